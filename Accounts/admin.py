@@ -1,18 +1,19 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin  # UserAdmin을 임포트
 
+from config.admin_pagination import EstimatedCountAdminMixin
+
 from .models import User  # Accounts 앱의 User 모델을 임포트
 
 
 # User 모델을 관리자 페이지에 등록
 @admin.register(User)
-class CustomUserAdmin(UserAdmin):
+class CustomUserAdmin(EstimatedCountAdminMixin, UserAdmin):
     list_display = (
         "id",
         "email",
         "username",
         "name",
-        "password",
         "is_admin",
         "is_staff",
         "is_superuser",
@@ -1,6 +1,8 @@
 from django.contrib import admin
 from django.utils.html import format_html
 
+from config.admin_pagination import EstimatedCountAdminMixin
+
 from .models import Agency, Group, Idol
 
 
@@ -13,6 +15,8 @@ class GroupInline(admin.TabularInline):
 @admin.register(Agency)
 class AgencyAdmin(admin.ModelAdmin):
     list_display = ("id", "name", "contact", "image_preview")
+    search_fields = ("name",)  # 그룹의 소속사 자동완성에 사용
+    ordering = ("name",)
 
     def image_preview(self, obj):
         if obj.image:
@@ -23,6 +27,9 @@ class AgencyAdmin(admin.ModelAdmin):
 @admin.register(Group)
 class GroupAdmin(admin.ModelAdmin):
     list_display = ("id", "name", "agency", "image_preview")
+    # Group.__str__ 이 소속사 이름을 사용하므로 함께 조회
+    list_select_related = ("agency",)
+    autocomplete_fields = ("agency",)
 
     def image_preview(self, obj):
         if obj.image:
@@ -30,6 +37,14 @@ class GroupAdmin(admin.ModelAdmin):
         return None
 
     search_fields = ("name",)
+    ordering = ("name",)
+
+    def get_search_results(self, request, queryset, search_term):
+        # 다른 화면의 그룹 자동완성 결과도 소속사 이름을 함께 조회
+        queryset, may_have_duplicates = super().get_search_results(
+            request, queryset, search_term
+        )
+        return queryset.select_related("agency"), may_have_duplicates
 
 
 class IdolInline(admin.TabularInline):
@@ -38,7 +53,17 @@ class IdolInline(admin.TabularInline):
 
 
 @admin.register(Idol)
-class IdolAdmin(admin.ModelAdmin):
+class IdolAdmin(EstimatedCountAdminMixin, admin.ModelAdmin):
     list_display = ("id", "name", "group")
-    search_fields = ("name",)
-    list_filter = ("group",)
+    # group 표시(Group.__str__)에 소속사 이름까지 필요
+    list_select_related = ("group__agency",)
+    autocomplete_fields = ("group",)
+    # 그룹 필터는 모든 그룹을 불러오므로 그룹 이름 검색으로 대체
+    search_fields = ("name", "group__name")
+
+    def get_search_results(self, request, queryset, search_term):
+        # 일정 참가 멤버 자동완성 등에서도 그룹/소속사 이름을 함께 조회
+        queryset, may_have_duplicates = super().get_search_results(
+            request, queryset, search_term
+        )
+        return queryset.select_related("group__agency"), may_have_duplicates
@@ -0,0 +1,55 @@
+from collections import Counter
+
+from django.db import transaction
+from django.db.models import Case, F, IntegerField, Value, When
+from django.utils import timezone
+
+from .models import ImageBlob
+
+BLOB_KEY_PREFIX = "images/blobs/"
+
+
+def get_blob_key_from_url(image_url):
+    # 내용 주소로 저장된 이미지 URL이면 S3 키를, 아니면 None 반환
+    if not image_url or BLOB_KEY_PREFIX not in image_url:
+        return None
+    return image_url[image_url.index(BLOB_KEY_PREFIX) :]
+
+
+def acquire_blob(s3_key, size):
+    """
+    blob 참조 수를 1 늘립니다. 업로드(HEAD 확인) 전에 호출해야
+    같은 blob을 삭제 중인 GC와 엇갈리지 않습니다.
+    """
+    with transaction.atomic():
+        blob, _ = ImageBlob.objects.select_for_update().get_or_create(
+            key=s3_key, defaults={"size": size}
+        )
+        ImageBlob.objects.filter(pk=blob.pk).update(
+            ref_count=F("ref_count") + 1, updated_at=timezone.now()
+        )
+
+
+def release_blob(s3_key):
+    if s3_key:
+        ImageBlob.objects.filter(key=s3_key).update(
+            ref_count=F("ref_count") - 1, updated_at=timezone.now()
+        )
+
+
+def release_image_url(image_url):
+    # 교체되거나 삭제된 이미지의 blob 참조 해제 (blob이 아닌 URL은 무시)
+    release_blob(get_blob_key_from_url(image_url))
+
+
+def release_image_urls(image_urls):
+    # 여러 이미지의 blob 참조를 UPDATE 한 번으로 해제 (같은 blob은 참조한 수만큼 감소)
+    counts = Counter(filter(None, map(get_blob_key_from_url, image_urls)))
+    if counts:
+        released = Case(
+            *(When(key=key, then=Value(count)) for key, count in counts.items()),
+            output_field=IntegerField(),
+        )
+        ImageBlob.objects.filter(key__in=counts).update(
+            ref_count=F("ref_count") - released, updated_at=timezone.now()
+        )
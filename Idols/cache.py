@@ -0,0 +1,152 @@
+import json
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+
+CATALOG_VERSION_KEY = "idols:catalog:version"
+GROUP_COUNTER_VERSION_KEY = "idols:group_counters:version"
+SNAPSHOT_KEY = "idols:snapshot:{name}:v{version}"
+SNAPSHOT_LOCK_KEY = "idols:snapshot:{name}:v{version}:lock"
+
+# 다른 워커가 스냅샷을 만드는 동안 기다리는 간격과 최대 대기 시간(초)
+SNAPSHOT_WAIT_INTERVAL = 0.05
+SNAPSHOT_WAIT_TIMEOUT = 5
+
+# 프로세스 메모리 캐시 {이름: (카탈로그 버전, 값)}
+_process_cache = {}
+
+
+def _get_version(key):
+    # 키가 없으면(최초 실행, 캐시 eviction) 현재 시각(ms)으로 초기화하여
+    # 이전에 쓰인 버전 번호가 재사용되지 않도록 함
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, int(time.time() * 1000), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def _incr_version(key):
+    try:
+        cache.incr(key)
+    except ValueError:
+        # 키가 없으면 새 버전으로 초기화
+        _get_version(key)
+
+
+def get_catalog_version():
+    """
+    현재 카탈로그 버전을 반환합니다.
+    """
+    return _get_version(CATALOG_VERSION_KEY)
+
+
+def _incr_catalog_version():
+    _incr_version(CATALOG_VERSION_KEY)
+
+
+def bump_catalog_version():
+    """
+    카탈로그 버전을 올려 기존 스냅샷을 무효화합니다.
+    트랜잭션 커밋 전에 다른 워커가 옛 데이터로 스냅샷을 다시 만들 수 있으므로
+    커밋 직후에 한 번 더 올립니다.
+    """
+    _incr_catalog_version()
+    transaction.on_commit(_incr_catalog_version)
+
+
+def get_group_counter_version():
+    """
+    그룹 구독자 수 버전을 반환합니다. 구독자 수가 포함된 스냅샷은 이름에 이 값을 넣어
+    구독/구독 취소가 카탈로그 버전(검색 인덱스, slug 맵 등)을 무효화하지 않도록 합니다.
+    """
+    return _get_version(GROUP_COUNTER_VERSION_KEY)
+
+
+def _incr_group_counter_version():
+    _incr_version(GROUP_COUNTER_VERSION_KEY)
+
+
+def bump_group_counter_version():
+    # bump_catalog_version 과 같이 커밋 직후에 한 번 더 올림
+    _incr_group_counter_version()
+    transaction.on_commit(_incr_group_counter_version)
+
+
+def get_catalog_snapshot(name, builder):
+    """
+    현재 카탈로그 버전에 해당하는 스냅샷(렌더링된 JSON bytes)을 반환합니다.
+    캐시 미스 시 락을 잡은 하나의 워커만 builder()를 실행하고,
+    나머지 워커는 스냅샷이 채워질 때까지 기다립니다.
+    """
+    version = get_catalog_version()
+    key = SNAPSHOT_KEY.format(name=name, version=version)
+    body = cache.get(key)
+    if body is not None:
+        return body
+
+    timeout = getattr(settings, "CATALOG_SNAPSHOT_TIMEOUT", 60 * 60 * 24)
+    lock_key = SNAPSHOT_LOCK_KEY.format(name=name, version=version)
+    if cache.add(lock_key, 1, timeout=SNAPSHOT_WAIT_TIMEOUT * 2):
+        try:
+            body = builder()
+            cache.set(key, body, timeout=timeout)
+        finally:
+            cache.delete(lock_key)
+        return body
+
+    # 다른 워커가 생성 중 - 완료될 때까지 대기
+    deadline = time.monotonic() + SNAPSHOT_WAIT_TIMEOUT
+    while time.monotonic() < deadline:
+        time.sleep(SNAPSHOT_WAIT_INTERVAL)
+        body = cache.get(key)
+        if body is not None:
+            return body
+
+    # 대기 시간 초과 시 캐시에 쓰지 않고 직접 생성
+    return builder()
+
+
+def get_process_snapshot(name, builder):
+    """
+    작은 조회용 데이터(예: slug -> id)를 프로세스 메모리에 보관합니다.
+    카탈로그 버전이 바뀌면 다음 호출 때 builder()로 다시 만듭니다.
+    """
+    version = get_catalog_version()
+    cached = _process_cache.get(name)
+    if cached is None or cached[0] != version:
+        cached = (version, builder())
+        _process_cache[name] = cached
+    return cached[1]
+
+
+def render_json(data):
+    return JSONRenderer().render(data)
+
+
+class SnapshotResponse(Response):
+    """
+    이미 렌더링된 JSON bytes를 그대로 내려주는 응답
+    """
+
+    def __init__(self, body, status=None, headers=None):
+        self._body = body
+        super().__init__(data=None, status=status, headers=headers)
+
+    @property
+    def data(self):
+        # 테스트 등에서 response.data 접근 시에만 파싱
+        return json.loads(self._body)
+
+    @data.setter
+    def data(self, value):
+        pass
+
+    @property
+    def rendered_content(self):
+        self["Content-Type"] = "application/json"
+        return self._body
@@ -0,0 +1,74 @@
+from django.db.models import Count, F, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce, Now
+
+from .models import Group
+
+# 비정규화 집계 컬럼 -> 실제 행을 세는 관계 (Group 기준 역참조)
+GROUP_COUNTERS = {
+    "member_count": "idol",
+    "subscriber_count": "usergroupsubscribe",
+}
+
+
+def adjust_group_counter(group_id, field, delta):
+    """
+    그룹의 집계 컬럼을 UPDATE ... SET col = col + delta 로 원자적으로 증감합니다.
+    (동시 요청이 서로의 값을 덮어쓰지 않음)
+    집계 값도 그룹 응답에 포함되므로 ETag 가 바뀌도록 updated_at 도 함께 갱신합니다.
+    스냅샷 무효화(bump_catalog_version / bump_group_counter_version)는 호출하는 쪽에서 처리합니다.
+    """
+    if group_id is None or not delta:
+        return
+    queryset = Group.objects.filter(pk=group_id)
+    if delta < 0:
+        # 이미 어긋나 0인 값은 음수로 만들지 않음 (정합성 작업에서 복구)
+        queryset = queryset.filter(**{f"{field}__gte": -delta})
+    queryset.update(**{field: F(field) + delta}, updated_at=Now())
+
+
+def get_actual_count(field):
+    # 그룹별 실제 행 수 서브쿼리 (GROUP BY 없이 그룹 한 행마다 계산)
+    relation = Group._meta.get_field(GROUP_COUNTERS[field])
+    return Coalesce(
+        Subquery(
+            relation.related_model.objects.filter(
+                **{relation.field.name: OuterRef("pk")}
+            )
+            .order_by()
+            .values(relation.field.name)
+            .annotate(count=Count("pk"))
+            .values("count")
+        ),
+        0,
+    )
+
+
+def reconcile_group_counters(batch_size=1000):
+    """
+    집계 컬럼이 실제 행 수와 다른 그룹을 찾아 batch_size개씩 UPDATE 한 번으로 고칩니다.
+    수정한 그룹 수를 반환합니다.
+    """
+    actual = {field: get_actual_count(field) for field in GROUP_COUNTERS}
+    drifted = (
+        Group.objects.annotate(
+            **{f"actual_{field}": expr for field, expr in actual.items()}
+        )
+        .filter(
+            Q(
+                *[~Q(**{field: F(f"actual_{field}")}) for field in GROUP_COUNTERS],
+                _connector=Q.OR,
+            )
+        )
+        .order_by("pk")
+        .values_list("pk", flat=True)
+    )
+    fixed = 0
+    last_pk = 0
+    while True:
+        pks = list(drifted.filter(pk__gt=last_pk)[:batch_size])
+        if not pks:
+            break
+        # 계산 시점과 UPDATE 사이의 증감도 반영되도록 UPDATE 안에서 다시 셈
+        fixed += Group.objects.filter(pk__in=pks).update(**actual, updated_at=Now())
+        last_pk = pks[-1]
+    return fixed
@@ -0,0 +1,107 @@
+from collections import Counter
+from contextvars import ContextVar
+from functools import wraps
+
+from django.db import transaction
+from django.utils import timezone
+
+from Preferences.models import UserGroupSubscribe
+from Schedules.models import Schedule
+
+from .blobs import release_image_urls
+from .cache import bump_catalog_version
+from .models import Agency, Group, Idol
+
+# 한 트랜잭션에서 삭제하는 최대 행 수
+PURGE_BATCH_SIZE = 1000
+
+# purge 중에는 행마다 보내는 post_delete 의 카탈로그 처리를 건너뛰고 배치 단위로 처리
+_purging = ContextVar("catalog_purging", default=False)
+
+
+def skip_during_purge(func):
+    """
+    purge 중에는 실행하지 않는 시그널 리시버로 만듭니다.
+    이미 숨겨진 그룹의 집계/검색 인덱스는 갱신할 필요가 없고,
+    버전 증가와 blob 참조 해제는 _delete_in_batches 가 배치마다 한 번씩 수행합니다.
+    """
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        if not _purging.get():
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+def hide_catalog_object(instance):
+    """
+    소속사/그룹을 즉시 숨김 처리합니다. (UPDATE 한두 번)
+    소속사는 소속 그룹도 같은 트랜잭션에서 숨기므로, 조회 쪽에서는 하위 데이터까지
+    한 번에 사라진 것으로 보입니다. 실제 삭제는 purge_deleted_catalog_task 가 수행합니다.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        if isinstance(instance, Agency):
+            Group.all_objects.filter(agency=instance, deleted_at__isnull=True).update(
+                deleted_at=now
+            )
+        type(instance).all_objects.filter(pk=instance.pk).update(deleted_at=now)
+        # update()는 시그널을 보내지 않으므로 스냅샷/검색 인덱스 무효화
+        bump_catalog_version()
+    instance.deleted_at = now
+
+
+def _delete_in_batches(queryset, batch_size, deleted, on_progress):
+    # pk 를 batch_size개씩 잘라 각각 별도 트랜잭션으로 삭제 (잠금 시간 제한)
+    model = queryset.model
+    has_image = any(field.name == "image" for field in model._meta.concrete_fields)
+    while True:
+        with transaction.atomic():
+            pks = list(queryset.values_list("pk", flat=True)[:batch_size])
+            if not pks:
+                return
+            batch = model._base_manager.filter(pk__in=pks)
+            images = list(batch.values_list("image", flat=True)) if has_image else []
+            token = _purging.set(True)
+            try:
+                _, counts = batch.delete()
+            finally:
+                _purging.reset(token)
+            release_image_urls(images)
+            # 검색 인덱스는 버전이 어긋나면 다음 검색 때 숨김 제외 상태로 다시 만들어짐
+            bump_catalog_version()
+        deleted.update(counts)
+        on_progress(deleted)
+
+
+def purge_deleted_catalog(batch_size=PURGE_BATCH_SIZE, on_progress=None):
+    """
+    숨김 처리된 그룹의 하위 데이터(일정 참여 멤버, 일정, 구독, 아이돌)부터
+    그룹, 소속사 순서로 batch_size개씩 삭제하고 {모델 라벨: 삭제 수}를 반환합니다.
+    중간에 중단되어도 숨김 상태는 유지되므로 다시 실행하면 이어서 처리합니다.
+    """
+    on_progress = on_progress or (lambda deleted: None)
+    deleted = Counter()
+    Through = Schedule.participating_members.through
+    group_ids = Group.all_objects.filter(deleted_at__isnull=False).values_list(
+        "pk", flat=True
+    )
+    for group_id in list(group_ids):
+        for queryset in (
+            Through.objects.filter(schedule__group_id=group_id),
+            Schedule.all_objects.filter(group_id=group_id),
+            UserGroupSubscribe.all_objects.filter(group_id=group_id),
+            Idol.all_objects.filter(group_id=group_id),
+            Group.all_objects.filter(pk=group_id),
+        ):
+            _delete_in_batches(
+                queryset.order_by("pk"), batch_size, deleted, on_progress
+            )
+    _delete_in_batches(
+        Agency.all_objects.filter(deleted_at__isnull=False).order_by("pk"),
+        batch_size,
+        deleted,
+        on_progress,
+    )
+    return dict(deleted)
@@ -0,0 +1,104 @@
+import csv
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+from .models import Agency, Group, Idol
+
+# 내보내기 대상 (type 값 -> 모델, 컬럼) - 소속사, 그룹, 아이돌 순서로 출력
+EXPORT_MODELS = {
+    "agency": (Agency, ("id", "name", "contact", "image", "updated_at")),
+    "group": (
+        Group,
+        ("id", "name", "slug", "agency_id", "color", "sns", "image", "updated_at"),
+    ),
+    "idol": (Idol, ("id", "name", "group_id", "image", "updated_at")),
+}
+# CSV는 모든 타입의 컬럼을 합쳐 한 파일로 출력 (해당 없는 컬럼은 빈 값)
+CSV_COLUMNS = (
+    "type",
+    "id",
+    "name",
+    "slug",
+    "agency_id",
+    "group_id",
+    "contact",
+    "color",
+    "sns",
+    "image",
+    "updated_at",
+)
+
+# DB 커서에서 한 번에 가져오는 행 수
+EXPORT_CHUNK_SIZE = 2000
+# 응답으로 한 번에 내보내는 행 수
+EXPORT_BUFFER_ROWS = 500
+
+
+def iter_catalog_rows(kinds=None, chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    (타입, {컬럼: 값})을 순서대로 반환합니다.
+    모델 인스턴스 없이 values_list 튜플을 서버 측 커서(iterator)로 chunk_size씩 읽으므로
+    카탈로그 크기와 관계없이 메모리 사용량이 일정합니다.
+    """
+    for kind, (model, columns) in EXPORT_MODELS.items():
+        if kinds and kind not in kinds:
+            continue
+        rows = (
+            model.objects.order_by("id")
+            .values_list(*columns)
+            .iterator(chunk_size=chunk_size)
+        )
+        for row in rows:
+            yield kind, dict(zip(columns, row))
+
+
+def _buffered(lines):
+    # 한 줄씩 보내면 write 호출이 너무 많아지므로 EXPORT_BUFFER_ROWS줄씩 묶어서 전송
+    buffer = []
+    for line in lines:
+        buffer.append(line)
+        if len(buffer) >= EXPORT_BUFFER_ROWS:
+            yield "".join(buffer)
+            buffer = []
+    if buffer:
+        yield "".join(buffer)
+
+
+def iter_ndjson(kinds=None):
+    # {"type": ..., 컬럼...} JSON 한 줄씩
+    encoder = DjangoJSONEncoder(ensure_ascii=False)
+    return _buffered(
+        encoder.encode({"type": kind, **row}) + "\n"
+        for kind, row in iter_catalog_rows(kinds)
+    )
+
+
+class _Echo:
+    # csv.writer 가 만든 한 줄을 그대로 반환하는 가짜 파일
+    def write(self, value):
+        return value
+
+
+def _csv_value(value):
+    if value is None:
+        return ""
+    return value.isoformat() if hasattr(value, "isoformat") else value
+
+
+def iter_csv(kinds=None):
+    writer = csv.writer(_Echo())
+    # 헤더는 쿼리 결과를 기다리지 않고 바로 전송
+    yield writer.writerow(CSV_COLUMNS)
+    yield from _buffered(
+        writer.writerow(
+            [kind] + [_csv_value(row.get(column)) for column in CSV_COLUMNS[1:]]
+        )
+        for kind, row in iter_catalog_rows(kinds)
+    )
+
+
+# 내보내기 형식 -> (Content-Type, 스트림 생성 함수)
+EXPORT_FORMATS = {
+    "ndjson": ("application/x-ndjson; charset=utf-8", iter_ndjson),
+    "csv": ("text/csv; charset=utf-8", iter_csv),
+}
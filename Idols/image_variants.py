@@ -0,0 +1,98 @@
+import io
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+from django.conf import settings
+from PIL import Image, ImageOps
+
+# 파생 이미지 크기(px, 긴 변 기준)와 포맷
+VARIANT_SIZES = (64, 256, 1024)
+VARIANT_FORMATS = {"webp": ("WEBP", "image/webp"), "jpg": ("JPEG", "image/jpeg")}
+
+_executor = None
+_executor_pid = None
+_executor_lock = threading.Lock()
+
+
+def _reset_executor():
+    global _executor, _executor_pid
+    _executor = None
+    _executor_pid = None
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_executor)
+
+
+def get_executor():
+    """
+    워커 프로세스 안에서 사용하는 이미지 처리용 프로세스 풀.
+    큰 이미지 디코딩/리사이즈가 워커 프로세스의 GIL을 붙잡지 않도록 분리합니다.
+    """
+    global _executor, _executor_pid
+    pid = os.getpid()
+    with _executor_lock:
+        if _executor is None or _executor_pid != pid:
+            _executor = ProcessPoolExecutor(
+                max_workers=settings.IMAGE_VARIANT_PROCESSES
+            )
+            _executor_pid = pid
+    return _executor
+
+
+def render_variants(source, sizes=VARIANT_SIZES):
+    """
+    원본 이미지 bytes로 크기/포맷별 파생 이미지를 만들어 [(크기, 확장자, bytes)]로 반환합니다.
+    EXIF 회전을 적용한 뒤 메타데이터 없이 저장하므로 EXIF가 제거됩니다.
+    (프로세스 풀에서 실행되므로 모듈 최상위 함수여야 함)
+    """
+    with Image.open(io.BytesIO(source)) as original:
+        image = ImageOps.exif_transpose(original)
+        has_alpha = image.mode in ("RGBA", "LA") or "transparency" in image.info
+        image = image.convert("RGBA" if has_alpha else "RGB")
+
+    variants = []
+    for size in sizes:
+        resized = image.copy()
+        resized.thumbnail((size, size), Image.Resampling.LANCZOS)
+        for ext, (pil_format, _) in VARIANT_FORMATS.items():
+            frame = resized
+            if pil_format == "JPEG" and frame.mode != "RGB":
+                # JPEG은 투명도를 지원하지 않으므로 흰 배경에 합성
+                background = Image.new("RGB", frame.size, "white")
+                background.paste(frame, mask=frame.getchannel("A"))
+                frame = background
+            buffer = io.BytesIO()
+            frame.save(buffer, format=pil_format, quality=82, optimize=True)
+            variants.append((size, ext, buffer.getvalue()))
+    return variants
+
+
+def build_variants(source):
+    # 프로세스 풀에서 생성하되, 풀을 쓸 수 없는 환경이면 현재 프로세스에서 처리
+    if settings.IMAGE_VARIANT_PROCESSES <= 0:
+        return render_variants(source)
+    future = get_executor().submit(render_variants, source)
+    return future.result(timeout=settings.IMAGE_VARIANT_TIMEOUT)
+
+
+def get_variant_key_base(s3_key):
+    # images/idols/1/photo.png -> images/idols/1/variants/photo
+    directory, file_name = os.path.split(s3_key)
+    stem, _ = os.path.splitext(file_name)
+    return f"{directory}/variants/{stem}"
+
+
+def get_variant_url(image_variants, size, ext="webp"):
+    """
+    variants 맵 {"base": ..., "sizes": [...], "formats": [...]}에서
+    요청 크기 이상인 가장 작은 파생 이미지 URL을 반환합니다.
+    """
+    if not image_variants:
+        return None
+    sizes = sorted(image_variants.get("sizes", []))
+    if not sizes or ext not in image_variants.get("formats", []):
+        return None
+    chosen = next((candidate for candidate in sizes if candidate >= size), sizes[-1])
+    return f"{image_variants['base']}_{chosen}.{ext}"
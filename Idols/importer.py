@@ -0,0 +1,286 @@
+from collections import Counter
+
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.db.models import Case, F, Value, When
+from django.db.models.functions import Lower
+from openpyxl import load_workbook
+
+from .cache import bump_catalog_version
+from .models import Agency, Group, Idol, assign_group_slugs
+
+# 엑셀 가져오기 시트 이름과 컬럼 (첫 행은 헤더)
+WORKBOOK_SHEETS = {
+    "agencies": ("name", "contact"),
+    "groups": ("agency", "name", "color", "sns"),
+    "idols": ("group", "name"),
+}
+
+
+def _text(value):
+    # JSON/엑셀 값을 문자열로 통일 (빈 값은 None)
+    if value is None or value == "":
+        return None
+    return str(value).strip()
+
+
+class CatalogImportError(Exception):
+    """가져오기 파일 형식 자체가 잘못된 경우"""
+
+
+class CatalogImport:
+    """
+    소속사 -> 그룹 -> 아이돌 묶음을 한 번에 검증하고 bulk_create로 저장합니다.
+    행 수와 관계없이 기존 데이터 조회 3번, INSERT 3번으로 처리합니다.
+
+    이미 있는 소속사(이름 기준)는 새로 만들지 않고 재사용하며,
+    같은 소속사의 기존 그룹도 재사용하여 아이돌만 추가할 수 있습니다.
+    """
+
+    def __init__(self, agencies=(), groups=(), idols=()):
+        # 각 행: {"row": 위치, 필드...}, 그룹/아이돌은 상위 항목을 이름으로 참조
+        self.agency_rows = list(agencies)
+        self.group_rows = list(groups)
+        self.idol_rows = list(idols)
+        self.errors = []
+        self.created = {"agencies": 0, "groups": 0, "idols": 0}
+        self.reused = {"agencies": 0, "groups": 0}
+
+    @classmethod
+    def from_json(cls, data):
+        """
+        {"agencies": [{"name", "contact", "groups": [{"name", ..., "idols": [{"name"}]}]}]}
+        """
+        if not isinstance(data, dict) or not isinstance(data.get("agencies"), list):
+            raise CatalogImportError("agencies 목록이 필요합니다.")
+        agencies, groups, idols = [], [], []
+        for a, agency in enumerate(data["agencies"]):
+            agency = agency if isinstance(agency, dict) else {}
+            agency_path = f"agencies[{a}]"
+            agencies.append(
+                {
+                    "row": agency_path,
+                    "name": _text(agency.get("name")),
+                    "contact": _text(agency.get("contact")),
+                }
+            )
+            for g, group in enumerate(agency.get("groups") or []):
+                group = group if isinstance(group, dict) else {}
+                group_path = f"{agency_path}.groups[{g}]"
+                groups.append(
+                    {
+                        "row": group_path,
+                        "agency": _text(agency.get("name")),
+                        "name": _text(group.get("name")),
+                        "color": _text(group.get("color")),
+                        "sns": _text(group.get("sns")),
+                    }
+                )
+                for i, idol in enumerate(group.get("idols") or []):
+                    idol = idol if isinstance(idol, dict) else {}
+                    idols.append(
+                        {
+                            "row": f"{group_path}.idols[{i}]",
+                            "group": _text(group.get("name")),
+                            "name": _text(idol.get("name")),
+                        }
+                    )
+        return cls(agencies, groups, idols)
+
+    @classmethod
+    def from_workbook(cls, file):
+        """agencies / groups / idols 시트를 읽습니다. (없는 시트는 빈 목록)"""
+        try:
+            workbook = load_workbook(file, read_only=True, data_only=True)
+        except Exception:
+            raise CatalogImportError("엑셀 파일을 읽을 수 없습니다.")
+        rows = {}
+        for sheet_name, columns in WORKBOOK_SHEETS.items():
+            rows[sheet_name] = []
+            if sheet_name not in workbook.sheetnames:
+                continue
+            sheet = workbook[sheet_name]
+            for number, values in enumerate(
+                sheet.iter_rows(min_row=2, values_only=True), start=2
+            ):
+                if all(_text(value) is None for value in values):
+                    continue
+                values = [_text(value) for value in values[: len(columns)]]
+                row = dict(zip(columns, values))
+                row["row"] = f"{sheet_name}:{number}"
+                rows[sheet_name].append(row)
+        workbook.close()
+        return cls(rows["agencies"], rows["groups"], rows["idols"])
+
+    def add_error(self, row, field, message):
+        self.errors.append({"row": row["row"], "errors": {field: [message]}})
+
+    def clean_instance(self, row, instance, exclude):
+        # 모델 필드 검증 (길이, 형식 등) - DB 조회 없이 수행
+        exclude = set(exclude) | {
+            field.name
+            for field in instance._meta.concrete_fields
+            if field.null and getattr(instance, field.attname) is None
+        }
+        try:
+            instance.clean_fields(exclude=exclude)
+        except ValidationError as e:
+            self.errors.append({"row": row["row"], "errors": e.message_dict})
+            return False
+        return True
+
+    def preload(self):
+        # 파일에 등장하는 이름만 (소문자 기준) 조회하여 기존 데이터와 대조
+        agency_names = {
+            (row.get(field) or "").lower()
+            for rows, field in (
+                (self.agency_rows, "name"),
+                (self.group_rows, "agency"),
+            )
+            for row in rows
+        }
+        group_names = {
+            (row.get(field) or "").lower()
+            for rows, field in ((self.group_rows, "name"), (self.idol_rows, "group"))
+            for row in rows
+        }
+        # 삭제 대기(숨김) 중인 행은 이름 제약에서 제외되므로 없는 것으로 취급
+        self.existing_agencies = {
+            name.lower(): pk
+            for pk, name in Agency.objects.annotate(lower_name=Lower("name"))
+            .filter(lower_name__in=agency_names)
+            .values_list("id", "name")
+        }
+        self.existing_groups = {
+            name.lower(): (pk, agency_id)
+            for pk, name, agency_id in Group.objects.annotate(lower_name=Lower("name"))
+            .filter(lower_name__in=group_names)
+            .values_list("id", "name", "agency_id")
+        }
+        existing_group_ids = [pk for pk, _ in self.existing_groups.values()]
+        self.existing_idols = set(
+            Idol.objects.filter(
+                group_id__in=existing_group_ids,
+                name__in={row.get("name") for row in self.idol_rows},
+            ).values_list("group_id", "name")
+        )
+
+    def validate(self):
+        self.preload()
+
+        # 소속사: 기존 이름은 재사용, 파일 안 중복은 오류
+        self.new_agencies = {}  # 소문자 이름 -> Agency
+        for row in self.agency_rows:
+            key = (row.get("name") or "").lower()
+            if key in self.new_agencies:
+                self.add_error(row, "name", "파일 안에 같은 이름의 소속사가 있습니다.")
+                continue
+            if key in self.existing_agencies:
+                self.reused["agencies"] += 1
+                continue
+            agency = Agency(name=row.get("name"), contact=row.get("contact"))
+            if self.clean_instance(row, agency, ()):
+                self.new_agencies[key] = agency
+
+        # 그룹: 같은 소속사의 기존 그룹은 재사용, 다른 소속사 그룹과 이름이 같으면 오류
+        self.new_groups = {}  # 소문자 이름 -> (Group, 소속사 키)
+        self.reused_groups = {}  # 소문자 이름 -> group_id
+        for row in self.group_rows:
+            agency_key = (row.get("agency") or "").lower()
+            key = (row.get("name") or "").lower()
+            if (
+                agency_key not in self.new_agencies
+                and agency_key not in self.existing_agencies
+            ):
+                self.add_error(row, "agency", "소속사를 찾을 수 없습니다.")
+                continue
+            if key in self.new_groups or key in self.reused_groups:
+                self.add_error(row, "name", "파일 안에 같은 이름의 그룹이 있습니다.")
+                continue
+            if key in self.existing_groups:
+                group_id, agency_id = self.existing_groups[key]
+                if self.existing_agencies.get(agency_key) == agency_id:
+                    self.reused_groups[key] = group_id
+                    self.reused["groups"] += 1
+                else:
+                    self.add_error(row, "name", "같은 이름의 그룹이 이미 존재합니다.")
+                continue
+            group = Group(
+                name=row.get("name"), color=row.get("color"), sns=row.get("sns")
+            )
+            if self.clean_instance(row, group, ("agency",)):
+                self.new_groups[key] = (group, agency_key)
+
+        # 아이돌: 같은 그룹 안 이름 중복은 파일/기존 데이터 모두 오류
+        self.new_idols = []  # (Idol, 그룹 키)
+        seen = set()
+        for row in self.idol_rows:
+            group_key = (row.get("group") or "").lower()
+            name = row.get("name")
+            if group_key in self.new_groups or group_key in self.reused_groups:
+                group_id = self.reused_groups.get(group_key)
+            elif group_key in self.existing_groups:
+                group_id = self.existing_groups[group_key][0]
+            else:
+                self.add_error(row, "group", "그룹을 찾을 수 없습니다.")
+                continue
+            if (group_key, name) in seen or (group_id, name) in self.existing_idols:
+                self.add_error(
+                    row, "name", "같은 그룹에 동일한 이름의 아이돌이 이미 존재합니다."
+                )
+                continue
+            seen.add((group_key, name))
+            idol = Idol(name=name, group_id=group_id)
+            if self.clean_instance(row, idol, ("group",)):
+                self.new_idols.append((idol, group_key))
+        return not self.errors
+
+    @transaction.atomic
+    def save(self):
+        """검증을 통과한 경우에만 호출합니다. 모델 단위로 bulk_create 한 번씩 실행합니다."""
+        agencies = Agency.objects.bulk_create(self.new_agencies.values())
+        agency_ids = dict(self.existing_agencies)
+        agency_ids.update({key: agency.pk for key, agency in self.new_agencies.items()})
+
+        # 아이돌 bulk_create는 멤버 수 시그널을 보내지 않으므로 직접 반영 (새 그룹)
+        added_members = Counter(group_key for _, group_key in self.new_idols)
+        for key, (group, agency_key) in self.new_groups.items():
+            group.agency_id = agency_ids[agency_key]
+            group.member_count = added_members[key]
+        # bulk_create는 save()를 거치지 않으므로 slug를 직접 지정
+        assign_group_slugs(group for group, _ in self.new_groups.values())
+        groups = Group.objects.bulk_create(
+            group for group, _ in self.new_groups.values()
+        )
+        group_ids = {key: pk for key, (pk, _) in self.existing_groups.items()}
+        group_ids.update({key: group.pk for key, (group, _) in self.new_groups.items()})
+
+        for idol, group_key in self.new_idols:
+            idol.group_id = group_ids[group_key]
+        idols = Idol.objects.bulk_create(idol for idol, _ in self.new_idols)
+        # 기존 그룹은 UPDATE 한 번으로 증가
+        existing_members = {
+            group_ids[key]: count
+            for key, count in added_members.items()
+            if key not in self.new_groups
+        }
+        if existing_members:
+            Group.objects.filter(pk__in=existing_members).update(
+                member_count=F("member_count")
+                + Case(
+                    *[
+                        When(pk=pk, then=Value(count))
+                        for pk, count in existing_members.items()
+                    ],
+                    default=Value(0),
+                )
+            )
+
+        # bulk_create는 시그널을 보내지 않으므로 카탈로그 버전을 직접 갱신
+        bump_catalog_version()
+        self.created = {
+            "agencies": len(agencies),
+            "groups": len(groups),
+            "idols": len(idols),
+        }
+        return self.created
@@ -0,0 +1,17 @@
+# Generated by Django 5.1.7 on 2026-10-17 14:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("Idols", "0003_catalog_updated_at"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="agency",
+            index=models.Index(fields=["name", "id"], name="agency_name_id_idx"),
+        ),
+    ]
@@ -0,0 +1,65 @@
+# Generated by Django 5.1.7 on 2026-10-17 15:02
+
+from django.db import migrations, models
+
+
+def mark_existing_images_ready(apps, schema_editor):
+    # 기존에 업로드된 이미지는 완료 상태로 표시
+    for model_name in ("Agency", "Group", "Idol"):
+        model = apps.get_model("Idols", model_name)
+        model.objects.exclude(image__isnull=True).exclude(image="").update(
+            image_status="ready"
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("Idols", "0004_agency_name_id_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="agency",
+            name="image_status",
+            field=models.CharField(
+                blank=True,
+                choices=[
+                    ("pending", "업로드 중"),
+                    ("ready", "업로드 완료"),
+                    ("failed", "업로드 실패"),
+                ],
+                max_length=10,
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="group",
+            name="image_status",
+            field=models.CharField(
+                blank=True,
+                choices=[
+                    ("pending", "업로드 중"),
+                    ("ready", "업로드 완료"),
+                    ("failed", "업로드 실패"),
+                ],
+                max_length=10,
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="idol",
+            name="image_status",
+            field=models.CharField(
+                blank=True,
+                choices=[
+                    ("pending", "업로드 중"),
+                    ("ready", "업로드 완료"),
+                    ("failed", "업로드 실패"),
+                ],
+                max_length=10,
+                null=True,
+            ),
+        ),
+        migrations.RunPython(mark_existing_images_ready, migrations.RunPython.noop),
+    ]
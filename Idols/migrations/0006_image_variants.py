@@ -0,0 +1,28 @@
+# Generated by Django 5.1.7 on 2026-10-17 15:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("Idols", "0005_image_status"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="agency",
+            name="image_variants",
+            field=models.JSONField(blank=True, default=dict),
+        ),
+        migrations.AddField(
+            model_name="group",
+            name="image_variants",
+            field=models.JSONField(blank=True, default=dict),
+        ),
+        migrations.AddField(
+            model_name="idol",
+            name="image_variants",
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
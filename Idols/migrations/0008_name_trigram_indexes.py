@@ -0,0 +1,45 @@
+# Generated by Django 5.1.7 on 2026-10-17 17:05
+
+from django.db import migrations
+
+# 퍼지 검색용 pg_trgm GIN 인덱스 (PostgreSQL 에서만 생성)
+TRIGRAM_INDEXES = (
+    ("Idols", "Agency", "agency_name_trgm_idx"),
+    ("Idols", "Group", "group_name_trgm_idx"),
+    ("Idols", "Idol", "idol_name_trgm_idx"),
+)
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for app_label, model_name, index_name in TRIGRAM_INDEXES:
+        table = schema_editor.quote_name(
+            apps.get_model(app_label, model_name)._meta.db_table
+        )
+        # 운영 중 테이블 쓰기를 막지 않도록 CONCURRENTLY 로 생성
+        schema_editor.execute(
+            f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_name} "
+            f"ON {table} USING gin (name gin_trgm_ops)"
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for _, _, index_name in TRIGRAM_INDEXES:
+        schema_editor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}")
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY 는 트랜잭션 안에서 실행할 수 없음
+    atomic = False
+
+    dependencies = [
+        ("Idols", "0007_image_blob"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
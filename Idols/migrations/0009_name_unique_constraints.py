@@ -0,0 +1,34 @@
+# Generated by Django 5.1.7 on 2026-10-17 17:40
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("Idols", "0008_name_trigram_indexes"),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name="agency",
+            constraint=models.UniqueConstraint(
+                django.db.models.functions.text.Lower("name"),
+                name="agency_name_ci_unique",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="group",
+            constraint=models.UniqueConstraint(
+                django.db.models.functions.text.Lower("name"),
+                name="group_name_ci_unique",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="idol",
+            constraint=models.UniqueConstraint(
+                fields=("group", "name"), name="idol_group_name_unique"
+            ),
+        ),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 5.1.7 on 2026-10-17 18:10
+
+from django.db import migrations, models
+from django.utils.text import slugify
+
+
+def fill_group_slugs(apps, schema_editor):
+    # 기존 그룹의 slug를 이름으로 채움 (겹치면 "-2", "-3" ... 추가)
+    Group = apps.get_model("Idols", "Group")
+    taken = set()
+    groups = list(Group.objects.order_by("id"))
+    for group in groups:
+        base = slugify(group.name or "", allow_unicode=True) or "group"
+        slug, suffix = base, 2
+        while slug in taken:
+            slug, suffix = f"{base}-{suffix}", suffix + 1
+        group.slug = slug
+        taken.add(slug)
+    Group.objects.bulk_update(groups, ["slug"], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("Idols", "0009_name_unique_constraints"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="group",
+            name="slug",
+            field=models.SlugField(
+                allow_unicode=True, default="", editable=False, max_length=120
+            ),
+            preserve_default=False,
+        ),
+        migrations.RunPython(fill_group_slugs, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="group",
+            name="slug",
+            field=models.SlugField(
+                allow_unicode=True, editable=False, max_length=120, unique=True
+            ),
+        ),
+    ]
@@ -0,0 +1,56 @@
+# Generated by Django 5.1.7 on 2026-10-17 18:25
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def fill_group_counters(apps, schema_editor):
+    # 기존 그룹의 멤버 수/구독자 수를 UPDATE 한 번으로 채움
+    Group = apps.get_model("Idols", "Group")
+    Idol = apps.get_model("Idols", "Idol")
+    UserGroupSubscribe = apps.get_model("Preferences", "UserGroupSubscribe")
+
+    def count_of(model):
+        return Coalesce(
+            Subquery(
+                model.objects.filter(group=OuterRef("pk"))
+                .order_by()
+                .values("group")
+                .annotate(count=Count("pk"))
+                .values("count")
+            ),
+            0,
+        )
+
+    Group.objects.update(
+        member_count=count_of(Idol), subscriber_count=count_of(UserGroupSubscribe)
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("Idols", "0010_group_slug"),
+        ("Preferences", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="group",
+            name="member_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="group",
+            name="subscriber_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(fill_group_counters, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="group",
+            index=models.Index(
+                fields=["subscriber_count", "id"], name="group_subscriber_count_idx"
+            ),
+        ),
+    ]
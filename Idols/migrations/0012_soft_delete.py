@@ -0,0 +1,39 @@
+# Generated by Django 5.1.7 on 2026-10-17 18:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("Idols", "0011_group_counters"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="agency",
+            name="deleted_at",
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="group",
+            name="deleted_at",
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name="agency",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", False)),
+                fields=["deleted_at"],
+                name="agency_deleted_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="group",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", False)),
+                fields=["deleted_at"],
+                name="group_deleted_idx",
+            ),
+        ),
+    ]
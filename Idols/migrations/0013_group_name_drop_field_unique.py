@@ -0,0 +1,18 @@
+# Generated by Django 5.1.7 on 2026-10-17 19:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("Idols", "0012_soft_delete"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="group",
+            name="name",
+            field=models.CharField(max_length=100),
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.1.7 on 2026-10-17 20:10
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("Idols", "0013_group_name_drop_field_unique"),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name="agency",
+            name="agency_name_ci_unique",
+        ),
+        migrations.RemoveConstraint(
+            model_name="group",
+            name="group_name_ci_unique",
+        ),
+        migrations.AddConstraint(
+            model_name="agency",
+            constraint=models.UniqueConstraint(
+                django.db.models.functions.text.Lower("name"),
+                condition=models.Q(("deleted_at__isnull", True)),
+                name="agency_name_ci_unique",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="group",
+            constraint=models.UniqueConstraint(
+                django.db.models.functions.text.Lower("name"),
+                condition=models.Q(("deleted_at__isnull", True)),
+                name="group_name_ci_unique",
+            ),
+        ),
+    ]
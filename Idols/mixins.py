@@ -0,0 +1,95 @@
+import hashlib
+
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, urlencode
+
+from .cache import get_catalog_snapshot
+
+
+class ConditionalGetMixin:
+    """
+    updated_at 최댓값과 행 개수로 ETag / Last-Modified를 계산하여
+    변경이 없으면 행을 조회하거나 직렬화하지 않고 304를 반환합니다.
+    계산한 값은 카탈로그 버전별로 캐시하므로 스냅샷 응답 경로에서는 쿼리가 없습니다.
+    """
+
+    # 응답에 포함되는 연관 모델 (예: 그룹 응답의 소속사 이름, 멤버 목록)
+    validator_relations = ()
+
+    def get_validator_queryset(self):
+        queryset = self.get_queryset().model.objects.all()
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        if lookup_url_kwarg in self.kwargs:
+            queryset = queryset.filter(
+                **{self.lookup_field: self.kwargs[lookup_url_kwarg]}
+            )
+        return queryset
+
+    def get_validator_cache_name(self):
+        # 뷰 + 조회 대상별 캐시 이름 (값은 카탈로그 버전이 바뀔 때만 달라짐)
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        return "validators:%s:%s" % (
+            type(self).__name__,
+            self.kwargs.get(lookup_url_kwarg, ""),
+        )
+
+    def get_representation_key(self):
+        # cursor, page_size, fields, expand, ordering 등에 따라 응답이 다르므로
+        # 정렬한 쿼리 문자열도 ETag 에 포함 (파라미터 순서만 다른 요청은 같은 값)
+        return urlencode(sorted(self.request.query_params.lists()), doseq=True)
+
+    def get_validators(self):
+        fingerprint, last_modified = get_catalog_snapshot(
+            self.get_validator_cache_name(), self.compute_validators
+        )
+        if fingerprint is None:
+            return None, None
+        fingerprint = "%s|%s" % (fingerprint, self.get_representation_key())
+        etag = '"%s"' % hashlib.sha1(fingerprint.encode()).hexdigest()
+        return etag, last_modified
+
+    def compute_validators(self):
+        # 집계 쿼리 한 번으로 변경 여부 판단에 필요한 값을 가져옴
+        aggregates = {
+            "updated_at": Max("updated_at"),
+            "count": Count("pk", distinct=True),
+        }
+        for relation in self.validator_relations:
+            aggregates[f"{relation}_updated_at"] = Max(f"{relation}__updated_at")
+            aggregates[f"{relation}_count"] = Count(relation, distinct=True)
+        values = self.get_validator_queryset().aggregate(**aggregates)
+        if not values["count"]:
+            return None, None
+
+        last_modified = max(
+            value
+            for key, value in values.items()
+            if key.endswith("updated_at") and value is not None
+        )
+        fingerprint = "|".join(
+            f"{key}={value.isoformat() if hasattr(value, 'isoformat') else value}"
+            for key, value in sorted(values.items())
+        )
+        return fingerprint, last_modified
+
+    def check_not_modified(self, request):
+        """
+        If-None-Match / If-Modified-Since 헤더가 현재 상태와 일치하면 304 응답을 반환합니다.
+        """
+        self._etag, self._last_modified = self.get_validators()
+        if self._etag is None:
+            return None
+        return get_conditional_response(
+            request,
+            etag=self._etag,
+            last_modified=int(self._last_modified.timestamp()),
+        )
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        etag = getattr(self, "_etag", None)
+        if etag and response.status_code in (200, 304) and request.method == "GET":
+            response["ETag"] = etag
+            response["Last-Modified"] = http_date(self._last_modified.timestamp())
+        return response
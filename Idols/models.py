@@ -1,20 +1,139 @@
 from django.core.validators import RegexValidator
 from django.db import models
+from django.db.models import Q
+from django.db.models.functions import Lower
+from django.utils.text import slugify
 
 from Accounts.models import User
 
 
+class ImageStatus(models.TextChoices):
+    # 비동기 이미지 업로드 상태
+    PENDING = "pending", "업로드 중"
+    READY = "ready", "업로드 완료"
+    FAILED = "failed", "업로드 실패"
+
+
+class ImageBlob(models.Model):
+    """
+    내용(SHA-256) 주소로 저장된 이미지 원본과 참조 수.
+    참조가 0인 채로 유예 기간이 지난 blob은 일괄 삭제 대상입니다.
+    """
+
+    key = models.CharField(max_length=200, unique=True)  # images/blobs/ab/abcd....png
+    size = models.PositiveBigIntegerField(default=0)
+    ref_count = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.key} ({self.ref_count})"
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["updated_at"],
+                condition=models.Q(ref_count__lte=0),
+                name="imageblob_orphan_idx",
+            )
+        ]
+
+
+class VisibleManager(models.Manager):
+    """
+    삭제 대기(숨김) 중인 행을 제외하는 기본 매니저.
+    (역참조 매니저는 인자 없이 생성되므로 조건 컬럼은 클래스 속성으로 지정)
+    """
+
+    deleted_at_field = "deleted_at"
+
+    def get_queryset(self):
+        return (
+            super().get_queryset().filter(**{f"{self.deleted_at_field}__isnull": True})
+        )
+
+
+class GroupVisibleManager(VisibleManager):
+    # 그룹에 속한 행 (아이돌, 일정, 구독) - 그룹이 삭제 대기 중이면 숨김
+    deleted_at_field = "group__deleted_at"
+
+
 class Agency(models.Model):
     name = models.CharField(max_length=20)  # null 불가, 공백 불가
     contact = models.CharField(max_length=50, null=True)
     image = models.URLField(max_length=500, null=True, blank=True)
+    image_status = models.CharField(
+        max_length=10, choices=ImageStatus.choices, null=True, blank=True
+    )
+    # 파생 이미지(썸네일) 정보 {"base": ..., "sizes": [...], "formats": [...]}
+    image_variants = models.JSONField(default=dict, blank=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
+    # 삭제 요청 시각 (값이 있으면 숨김 상태이며 purge_deleted_catalog_task 가 삭제)
+    deleted_at = models.DateTimeField(null=True, blank=True, editable=False)
+
+    objects = VisibleManager()
+    all_objects = models.Manager()
 
     def __str__(self):
         return self.name
 
+    class Meta:
+        # 목록 커서 페이지네이션 (name, id) 정렬용
+        indexes = [
+            models.Index(fields=["name", "id"], name="agency_name_id_idx"),
+            # 삭제 대기 행 조회용
+            models.Index(
+                fields=["deleted_at"],
+                condition=Q(deleted_at__isnull=False),
+                name="agency_deleted_idx",
+            ),
+        ]
+        # 대소문자 구분 없이 이름 중복 방지 (삭제 대기 중인 행은 제외하여 바로 다시 등록 가능)
+        constraints = [
+            models.UniqueConstraint(
+                Lower("name"),
+                condition=Q(deleted_at__isnull=True),
+                name="agency_name_ci_unique",
+            )
+        ]
+
+
+def make_group_slug(name):
+    # 한글 등 유니코드 문자는 유지한 URL용 이름 ("Red Velvet" -> "red-velvet")
+    return slugify(name or "", allow_unicode=True) or "group"
+
+
+def assign_group_slugs(groups):
+    """
+    그룹들에 서로/기존 그룹과 겹치지 않는 slug를 지정합니다. (기존 slug 조회 한 번)
+    "A.B" 와 "AB" 처럼 같은 slug가 되는 이름은 "-2", "-3" ... 을 붙입니다.
+    """
+    groups = list(groups)
+    if not groups:
+        return
+    bases = [make_group_slug(group.name) for group in groups]
+    prefixes = Q()
+    for base in set(bases):
+        prefixes |= Q(slug__startswith=base)
+    taken = set(
+        Group.all_objects.filter(prefixes)
+        .exclude(pk__in=[group.pk for group in groups if group.pk])
+        .values_list("slug", flat=True)
+    )
+    for group, base in zip(groups, bases):
+        slug, suffix = base, 2
+        while slug in taken:
+            slug, suffix = f"{base}-{suffix}", suffix + 1
+        group.slug = slug
+        taken.add(slug)
+
 
 class Group(models.Model):
-    name = models.CharField(max_length=100, unique=True)  # 그룹 이름
+    # 그룹 이름 (중복은 대소문자 무시 제약 group_name_ci_unique 로만 검사)
+    name = models.CharField(max_length=100)
+    # 이름에서 만든 URL용 식별자 (이름 변경 시 함께 갱신)
+    slug = models.SlugField(
+        max_length=120, unique=True, allow_unicode=True, editable=False
+    )
     agency = models.ForeignKey(Agency, on_delete=models.CASCADE)  # 소속사
     color = models.CharField(
         max_length=7,
@@ -28,18 +147,83 @@ class Group(models.Model):
     )
     sns = models.URLField(blank=True, null=True)  # SNS 링크
     image = models.URLField(max_length=500, null=True, blank=True)  # 그룹 이미지
+    image_status = models.CharField(
+        max_length=10, choices=ImageStatus.choices, null=True, blank=True
+    )
+    # 파생 이미지(썸네일) 정보 {"base": ..., "sizes": [...], "formats": [...]}
+    image_variants = models.JSONField(default=dict, blank=True)
+    # 비정규화된 집계 값 (F() 로 증감, 어긋나면 reconcile_group_counters_task 가 복구)
+    member_count = models.PositiveIntegerField(default=0, editable=False)
+    subscriber_count = models.PositiveIntegerField(default=0, editable=False)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
+    # 삭제 요청 시각 (소속사 삭제 시 함께 설정)
+    deleted_at = models.DateTimeField(null=True, blank=True, editable=False)
+
+    objects = VisibleManager()
+    all_objects = models.Manager()
 
     def __str__(self):
         return f"{self.name} ({self.agency.name})"
 
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or "name" in update_fields:
+            assign_group_slugs([self])
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "slug"}
+        super().save(*args, **kwargs)
+
+    class Meta:
+        # 대소문자 구분 없이 이름 중복 방지 (삭제 대기 중인 행은 제외하여 바로 다시 등록 가능)
+        constraints = [
+            models.UniqueConstraint(
+                Lower("name"),
+                condition=Q(deleted_at__isnull=True),
+                name="group_name_ci_unique",
+            )
+        ]
+        # 구독자 수 순위 (?ordering=-subscriber_count) 키셋 페이지네이션용
+        indexes = [
+            models.Index(
+                fields=["subscriber_count", "id"], name="group_subscriber_count_idx"
+            ),
+            models.Index(
+                fields=["deleted_at"],
+                condition=Q(deleted_at__isnull=False),
+                name="group_deleted_idx",
+            ),
+        ]
+
 
 class Idol(models.Model):
     group = models.ForeignKey(Group, on_delete=models.CASCADE)
     name = models.CharField(max_length=10)
     image = models.URLField(max_length=500, null=True, blank=True)
+    image_status = models.CharField(
+        max_length=10, choices=ImageStatus.choices, null=True, blank=True
+    )
+    # 파생 이미지(썸네일) 정보 {"base": ..., "sizes": [...], "formats": [...]}
+    image_variants = models.JSONField(default=dict, blank=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
+
+    objects = GroupVisibleManager()
+    all_objects = models.Manager()
 
     def __str__(self):
         return f"{self.name} ({self.group.name})"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # 소속 그룹이 바뀌었는지 저장 시 비교하기 위해 조회 당시 값을 보관
+        instance._loaded_group_id = instance.__dict__.get("group_id")
+        return instance
+
     class Meta:
         db_table = "idols"
+        # 같은 그룹 안에서 이름 중복 방지
+        constraints = [
+            models.UniqueConstraint(
+                fields=["group", "name"], name="idol_group_name_unique"
+            )
+        ]
@@ -1,22 +1,218 @@
+import hashlib
+import mimetypes
+import os
+import threading
+import uuid
+
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+from botocore.exceptions import ClientError
 from django.conf import settings
 
+# 프로세스별로 한 번만 만드는 S3 클라이언트 (boto3 클라이언트는 스레드 간 공유 가능)
+_s3_client = None
+_s3_client_pid = None
+_s3_client_lock = threading.Lock()
+
+
+def _reset_s3_client():
+    # fork 된 자식 프로세스는 부모의 커넥션 풀을 물려받지 않도록 새로 생성
+    global _s3_client, _s3_client_pid
+    _s3_client = None
+    _s3_client_pid = None
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_s3_client)
+
+
+def get_s3_client():
+    """
+    커넥션 풀을 가진 프로세스 단위 S3 클라이언트를 지연 생성하여 반환합니다.
+    자격 증명 확인, 엔드포인트 설정, TLS 연결을 요청마다 반복하지 않습니다.
+    """
+    global _s3_client, _s3_client_pid
+    pid = os.getpid()
+    if _s3_client is not None and _s3_client_pid == pid:
+        return _s3_client
+
+    with _s3_client_lock:
+        if _s3_client is None or _s3_client_pid != pid:
+            session = boto3.session.Session(
+                aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+                aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+                region_name=settings.AWS_REGION_NAME,
+            )
+            _s3_client = session.client(
+                "s3",
+                endpoint_url=settings.AWS_S3_ENDPOINT_URL,
+                config=Config(
+                    max_pool_connections=settings.AWS_S3_MAX_POOL_CONNECTIONS,
+                    retries={"max_attempts": 3, "mode": "standard"},
+                ),
+            )
+            _s3_client_pid = pid
+    return _s3_client
+
+
+def get_transfer_config():
+    # 멀티파트 업로드 설정 (임계값, 파트 크기, 동시 전송 수)
+    return TransferConfig(
+        multipart_threshold=settings.AWS_S3_MULTIPART_THRESHOLD,
+        multipart_chunksize=settings.AWS_S3_MULTIPART_CHUNKSIZE,
+        max_concurrency=settings.AWS_S3_MAX_CONCURRENCY,
+        use_threads=settings.AWS_S3_MAX_CONCURRENCY > 1,
+    )
+
+
+def get_image_url(s3_key):
+    if settings.AWS_S3_ENDPOINT_URL:
+        endpoint = settings.AWS_S3_ENDPOINT_URL.rstrip("/")
+        return f"{endpoint}/{settings.AWS_STORAGE_BUCKET_NAME}/{s3_key}"
+    return f"https://{settings.AWS_STORAGE_BUCKET_NAME}.s3.{settings.AWS_REGION_NAME}.amazonaws.com/{s3_key}"
+
+
+def hash_fileobj(fileobj, chunk_size=1024 * 1024):
+    # 파일 전체를 메모리에 올리지 않고 청크 단위로 SHA-256과 크기 계산
+    digest = hashlib.sha256()
+    size = 0
+    for chunk in iter(lambda: fileobj.read(chunk_size), b""):
+        digest.update(chunk)
+        size += len(chunk)
+    fileobj.seek(0)
+    return digest.hexdigest(), size
 
-def upload_image_to_s3(image_file, s3_key_prefix, instance_id):
-    s3_client = boto3.client(
-        "s3",
-        aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-        aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-        region_name=settings.AWS_REGION_NAME,
+
+def get_blob_key(digest, file_name):
+    # 같은 내용은 항상 같은 키 (images/blobs/ab/abcd....png)
+    _, ext = os.path.splitext(file_name)
+    return f"images/blobs/{digest[:2]}/{digest}{ext.lower()}"
+
+
+def upload_blob_to_s3(fileobj, s3_key):
+    """
+    내용 주소 키로 업로드합니다. 같은 키의 객체가 이미 있으면 전송하지 않습니다.
+    업로드했으면 True, 기존 객체를 재사용했으면 False를 반환합니다.
+    """
+    if head_image_object(s3_key) is not None:
+        return False
+    extra_args = {"CacheControl": "public, max-age=31536000, immutable"}
+    content_type, _ = mimetypes.guess_type(s3_key)
+    if content_type:
+        extra_args["ContentType"] = content_type
+    get_s3_client().upload_fileobj(
+        fileobj,
+        settings.AWS_STORAGE_BUCKET_NAME,
+        s3_key,
+        ExtraArgs=extra_args,
+        Config=get_transfer_config(),
     )
-    file_name = image_file.name
-    s3_key = f"images/{s3_key_prefix}/{instance_id}/{file_name}"
+    return True
+
+
+def hash_image_object(s3_key, chunk_size=1024 * 1024):
+    # S3 객체를 청크 단위로 내려받으며 SHA-256과 크기 계산
+    body = get_s3_client().get_object(
+        Bucket=settings.AWS_STORAGE_BUCKET_NAME, Key=s3_key
+    )["Body"]
+    digest = hashlib.sha256()
+    size = 0
+    for chunk in body.iter_chunks(chunk_size):
+        digest.update(chunk)
+        size += len(chunk)
+    return digest.hexdigest(), size
+
+
+def copy_blob_in_s3(source_key, s3_key):
+    """
+    버킷 안의 객체를 내용 주소 키로 복사합니다. (서버를 거치지 않음)
+    같은 키의 객체가 이미 있으면 복사하지 않고 False를 반환합니다.
+    """
+    if head_image_object(s3_key) is not None:
+        return False
+    extra_args = {
+        "CacheControl": "public, max-age=31536000, immutable",
+        "MetadataDirective": "REPLACE",
+    }
+    content_type, _ = mimetypes.guess_type(s3_key)
+    if content_type:
+        extra_args["ContentType"] = content_type
+    get_s3_client().copy(
+        {"Bucket": settings.AWS_STORAGE_BUCKET_NAME, "Key": source_key},
+        settings.AWS_STORAGE_BUCKET_NAME,
+        s3_key,
+        ExtraArgs=extra_args,
+        Config=get_transfer_config(),
+    )
+    return True
+
+
+def create_presigned_image_post(s3_key, content_type):
+    """
+    클라이언트가 S3로 직접 업로드할 수 있는 presigned POST를 발급합니다.
+    키, Content-Type, 최대 크기를 조건으로 걸어 다른 경로나 큰 파일은 거부됩니다.
+    """
+    return get_s3_client().generate_presigned_post(
+        Bucket=settings.AWS_STORAGE_BUCKET_NAME,
+        Key=s3_key,
+        Fields={"Content-Type": content_type},
+        Conditions=[
+            {"Content-Type": content_type},
+            ["content-length-range", 1, settings.IMAGE_UPLOAD_MAX_SIZE],
+        ],
+        ExpiresIn=settings.IMAGE_UPLOAD_PRESIGN_EXPIRES,
+    )
+
+
+def head_image_object(s3_key):
+    # 업로드된 객체의 메타데이터 조회 (없으면 None)
     try:
-        s3_client.upload_fileobj(
-            image_file.file, settings.AWS_STORAGE_BUCKET_NAME, s3_key
+        return get_s3_client().head_object(
+            Bucket=settings.AWS_STORAGE_BUCKET_NAME, Key=s3_key
         )
-        image_url = f"https://{settings.AWS_STORAGE_BUCKET_NAME}.s3.{settings.AWS_REGION_NAME}.amazonaws.com/{s3_key}"
-        return image_url
-    except Exception as e:
-        print(f"S3 업로드 실패 ({s3_key_prefix}): {e}")
+    except ClientError:
         return None
+
+
+def read_image_object(s3_key):
+    response = get_s3_client().get_object(
+        Bucket=settings.AWS_STORAGE_BUCKET_NAME, Key=s3_key
+    )
+    return response["Body"].read()
+
+
+def put_image_object(s3_key, body, content_type):
+    # 파생 이미지는 키가 바뀌지 않으므로 장기 캐시 허용
+    get_s3_client().put_object(
+        Bucket=settings.AWS_STORAGE_BUCKET_NAME,
+        Key=s3_key,
+        Body=body,
+        ContentType=content_type,
+        CacheControl="public, max-age=31536000, immutable",
+    )
+
+
+def delete_image_objects(s3_keys, batch_size=1000):
+    # DeleteObjects는 요청당 최대 1000개
+    s3_keys = list(s3_keys)
+    for start in range(0, len(s3_keys), batch_size):
+        batch = s3_keys[start : start + batch_size]
+        get_s3_client().delete_objects(
+            Bucket=settings.AWS_STORAGE_BUCKET_NAME,
+            Delete={"Objects": [{"Key": key} for key in batch], "Quiet": True},
+        )
+
+
+def spool_image_file(image_file):
+    """
+    업로드된 파일을 워커가 읽을 수 있는 디스크 경로에 청크 단위로 저장하고 경로를 반환합니다.
+    """
+    spool_dir = settings.IMAGE_UPLOAD_SPOOL_DIR
+    os.makedirs(spool_dir, exist_ok=True)
+    _, ext = os.path.splitext(image_file.name)
+    path = os.path.join(spool_dir, f"{uuid.uuid4().hex}{ext}")
+    with open(path, "wb") as spooled:
+        for chunk in image_file.chunks():
+            spooled.write(chunk)
+    return path
@@ -0,0 +1,300 @@
+import re
+import threading
+import unicodedata
+from bisect import bisect_left, insort
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import F, Value
+
+from .cache import get_catalog_version
+from .models import Agency, Group, Idol
+
+# 한글 음절 분해 (초성 19 x 중성 21 x 종성 28)
+HANGUL_BASE = 0xAC00
+HANGUL_LAST = 0xD7A3
+COMPAT_JAMO_FIRST = "\u3131"
+COMPAT_JAMO_LAST = "\u318e"
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+JONGSEONG = ("",) + tuple("ㄱㄲㄳㄴㄵㄶㄷㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅄㅅㅆㅇㅈㅊㅋㅌㅍㅎ")
+
+# 겹받침/이중모음은 입력 순서대로 풀어서 입력 중인 글자도 접두사로 일치하도록 함
+COMPOUND_JAMO = {
+    "ㄳ": "ㄱㅅ",
+    "ㄵ": "ㄴㅈ",
+    "ㄶ": "ㄴㅎ",
+    "ㄺ": "ㄹㄱ",
+    "ㄻ": "ㄹㅁ",
+    "ㄼ": "ㄹㅂ",
+    "ㄽ": "ㄹㅅ",
+    "ㄾ": "ㄹㅌ",
+    "ㄿ": "ㄹㅍ",
+    "ㅀ": "ㄹㅎ",
+    "ㅄ": "ㅂㅅ",
+    "ㅘ": "ㅗㅏ",
+    "ㅙ": "ㅗㅐ",
+    "ㅚ": "ㅗㅣ",
+    "ㅝ": "ㅜㅓ",
+    "ㅞ": "ㅜㅔ",
+    "ㅟ": "ㅜㅣ",
+    "ㅢ": "ㅡㅣ",
+}
+
+WORD_SEPARATOR = re.compile(r"[\W_]+")
+
+# 검색 대상 모델 (응답의 type 값)
+SEARCH_MODELS = {"agency": Agency, "group": Group, "idol": Idol}
+
+
+def decompose_hangul(text):
+    chars = []
+    for char in text:
+        code = ord(char)
+        if HANGUL_BASE <= code <= HANGUL_LAST:
+            index = code - HANGUL_BASE
+            jamo = (
+                CHOSEONG[index // 588]
+                + JUNGSEONG[(index % 588) // 28]
+                + JONGSEONG[index % 28]
+            )
+        else:
+            jamo = char
+        chars.append("".join(COMPOUND_JAMO.get(part, part) for part in jamo))
+    return "".join(chars)
+
+
+def normalize_name(text):
+    """
+    대소문자, 공백, 기호를 무시하고 한글은 자모 단위로 분해한 검색 키를 만듭니다.
+    "뉴진스" -> "ㄴㅠㅈㅣㄴㅅㅡ", "New Jeans" -> "newjeans"
+    """
+    # 전각 문자 등은 NFKC로 정리하되, 호환 자모(ㅈ)는 조합용 자모로 바뀌지 않도록 유지
+    text = "".join(
+        (
+            char
+            if COMPAT_JAMO_FIRST <= char <= COMPAT_JAMO_LAST
+            else unicodedata.normalize("NFKC", char)
+        )
+        for char in unicodedata.normalize("NFC", text or "")
+    ).casefold()
+    return decompose_hangul(WORD_SEPARATOR.sub("", text))
+
+
+def get_search_keys(name):
+    # 전체 이름과 각 단어의 시작 위치부터의 키 ("Red Velvet" -> redvelvet, velvet)
+    words = [word for word in WORD_SEPARATOR.split(name or "") if word]
+    keys = {normalize_name(name)}
+    for start in range(1, len(words)):
+        keys.add(normalize_name("".join(words[start:])))
+    keys.discard("")
+    return keys
+
+
+class CatalogSearchIndex:
+    """
+    소속사/그룹/아이돌 이름의 프로세스 내 접두사 인덱스.
+    정렬된 (키, 타입, id) 배열에서 bisect로 접두사 범위를 찾으므로 DB를 조회하지 않습니다.
+
+    인덱스를 만든 시점의 카탈로그 버전을 기억하고, 이 프로세스의 변경은 시그널로
+    바로 반영합니다. 다른 프로세스의 변경으로 버전이 달라지면 백그라운드 스레드에서
+    다시 만들고, 그동안 검색은 기존 인덱스로 응답합니다. (처음 한 번만 요청 안에서 생성)
+    """
+
+    # 커밋된 저장/삭제 한 번당 bump_catalog_version()이 올리는 버전 수
+    VERSION_STEP = 2
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._entries = []  # [(키, 타입, id)] 정렬 유지
+        self._names = {}  # (타입, id) -> (이름, 전체 이름 키)
+        self._version = None
+        self._expected_version = None
+        self._rebuilding = False
+
+    def rebuild(self):
+        version = get_catalog_version()
+        entries = []
+        names = {}
+        for kind, model in SEARCH_MODELS.items():
+            for pk, name in model.objects.values_list("id", "name"):
+                names[(kind, pk)] = (name, normalize_name(name))
+                entries.extend((key, kind, pk) for key in get_search_keys(name))
+        entries.sort()
+        with self._lock:
+            self._entries = entries
+            self._names = names
+            self._version = self._expected_version = version
+
+    def ensure_fresh(self):
+        with self._lock:
+            if self._version is None:
+                initial = True
+            elif self._rebuilding or get_catalog_version() == self._expected_version:
+                return
+            else:
+                initial = False
+                self._rebuilding = True
+        if initial:
+            self.rebuild()
+        else:
+            self.schedule_rebuild()
+
+    def schedule_rebuild(self):
+        if not getattr(settings, "CATALOG_SEARCH_BACKGROUND_REBUILD", True):
+            self._finish_rebuild()
+            return
+        threading.Thread(
+            target=self._rebuild_in_background,
+            name="catalog-search-rebuild",
+            daemon=True,
+        ).start()
+
+    def _rebuild_in_background(self):
+        try:
+            self._finish_rebuild()
+        finally:
+            # 스레드가 연 DB 연결 정리
+            connection.close()
+
+    def _finish_rebuild(self):
+        try:
+            self.rebuild()
+        finally:
+            with self._lock:
+                self._rebuilding = False
+
+    def _remove(self, kind, pk):
+        indexed = self._names.pop((kind, pk), None)
+        if indexed is None:
+            return
+        for key in get_search_keys(indexed[0]):
+            index = bisect_left(self._entries, (key, kind, pk))
+            if index < len(self._entries) and self._entries[index] == (key, kind, pk):
+                del self._entries[index]
+
+    def upsert(self, kind, pk, name):
+        with self._lock:
+            if self._version is None:
+                return
+            self._remove(kind, pk)
+            self._names[(kind, pk)] = (name, normalize_name(name))
+            for key in get_search_keys(name):
+                insort(self._entries, (key, kind, pk))
+            self._expected_version += self.VERSION_STEP
+
+    def remove(self, kind, pk):
+        with self._lock:
+            if self._version is None:
+                return
+            self._remove(kind, pk)
+            self._expected_version += self.VERSION_STEP
+
+    def search(self, query, limit=10, kinds=None):
+        """
+        접두사가 일치하는 항목을 [{"type", "id", "name"}]로 반환합니다.
+        정확히 일치 > 이름 시작 일치 > 단어 시작 일치, 같으면 짧은 이름 순입니다.
+        """
+        prefix = normalize_name(query)
+        if not prefix:
+            return []
+        self.ensure_fresh()
+        with self._lock:
+            matches = {}
+            index = bisect_left(self._entries, (prefix,))
+            while index < len(self._entries):
+                key, kind, pk = self._entries[index]
+                index += 1
+                if not key.startswith(prefix):
+                    break
+                if kinds and kind not in kinds:
+                    continue
+                name, full_key = self._names[(kind, pk)]
+                rank = (
+                    0 if full_key == prefix else 1 if key == full_key else 2,
+                    len(full_key),
+                    name,
+                )
+                if (kind, pk) not in matches or rank < matches[(kind, pk)][0]:
+                    matches[(kind, pk)] = (rank, name)
+        ranked = sorted(matches.items(), key=lambda item: item[1][0])
+        return [
+            {"type": kind, "id": pk, "name": name}
+            for (kind, pk), (_, name) in ranked[:limit]
+        ]
+
+
+catalog_index = CatalogSearchIndex()
+
+
+def get_trigrams(text):
+    # pg_trgm과 같은 방식: 단어마다 앞 공백 2개, 뒤 공백 1개를 붙여 3글자씩 분할
+    text = unicodedata.normalize("NFKC", text or "").casefold()
+    trigrams = set()
+    for word in WORD_SEPARATOR.split(text):
+        if word:
+            padded = f"  {word} "
+            trigrams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return trigrams
+
+
+def trigram_similarity(left, right):
+    # pg_trgm similarity(): 공통 trigram 수 / 전체 trigram 수 (인자는 trigram 집합)
+    union = left | right
+    return len(left & right) / len(union) if union else 0.0
+
+
+def normalize_query(query):
+    return " ".join(unicodedata.normalize("NFKC", query or "").casefold().split())
+
+
+def _fuzzy_search_postgres(model, query, threshold, limit):
+    # name 컬럼의 gin_trgm_ops 인덱스를 타도록 % 연산자로 후보를 좁힌 뒤 유사도 정렬
+    from django.contrib.postgres.lookups import TrigramSimilar
+    from django.contrib.postgres.search import TrigramSimilarity
+
+    return list(
+        model.objects.filter(TrigramSimilar(F("name"), Value(query)))
+        .annotate(score=TrigramSimilarity("name", query))
+        .filter(score__gte=threshold)
+        .order_by("-score", "id")
+        .values_list("id", "name", "score")[:limit]
+    )
+
+
+def _fuzzy_search_python(model, query, threshold, limit):
+    # pg_trgm이 없는 DB(SQLite 테스트 등)용 n-gram 점수 계산
+    query_trigrams = get_trigrams(query)
+    scored = []
+    for pk, name in model.objects.values_list("id", "name"):
+        score = trigram_similarity(query_trigrams, get_trigrams(name))
+        if score >= threshold:
+            scored.append((pk, name, score))
+    scored.sort(key=lambda item: (-item[2], item[0]))
+    return scored[:limit]
+
+
+def fuzzy_search(query, limit=20, kinds=None):
+    """
+    오타를 허용하는 trigram 유사도 검색. [{"type", "id", "name", "score"}]를 점수순으로 반환합니다.
+    PostgreSQL에서는 pg_trgm 인덱스를, 그 외에는 Python n-gram 계산을 사용합니다.
+    """
+    query = normalize_query(query)
+    if not query:
+        return []
+    threshold = getattr(settings, "CATALOG_FUZZY_THRESHOLD", 0.3)
+    search = (
+        _fuzzy_search_postgres
+        if connection.vendor == "postgresql"
+        else _fuzzy_search_python
+    )
+    results = []
+    for kind, model in SEARCH_MODELS.items():
+        if kinds and kind not in kinds:
+            continue
+        results.extend(
+            {"type": kind, "id": pk, "name": name, "score": round(score, 3)}
+            for pk, name, score in search(model, query, threshold, limit)
+        )
+    results.sort(key=lambda item: -item["score"])
+    return results[:limit]
@@ -1,126 +1,363 @@
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import Prefetch
+from django.utils import timezone
 from rest_framework import serializers
+from rest_framework.settings import api_settings
 
-from Idols.s3_utils import upload_image_to_s3
+from Idols.s3_utils import spool_image_file
+from Schedules.models import Schedule
 
-from .models import Agency, Group, Idol
+from .image_variants import get_variant_url
+from .models import Agency, Group, Idol, ImageStatus
+from .tasks import upload_image_task
 
 
-class IdolNestedSerializer(serializers.ModelSerializer):
-    class Meta:
-        model = Idol
-        fields = [
-            "id",
-            "name",
-            "image",
-        ]  # 그룹 정보에 포함시킬 아이돌 필드 (id, 이름, 이미지 URL)
+class SparseFieldsMixin:
+    """
+    GET 요청의 ?fields= 로 응답 필드를 제한하고, ?expand= 로 확장 필드를 추가합니다.
+    fields 파라미터가 없으면 기존과 같이 전체 필드를 반환합니다.
+    """
 
+    # fields 를 지정한 경우 expand 에 포함되어야만 반환되는 필드
+    expandable_fields = ()
+    # 모델 필드가 아닌 응답 필드를 만들 때 함께 조회해야 하는 컬럼
+    field_dependencies = {"thumbnail": ("image", "image_variants")}
 
-# Agency Serializer
-class AgencySerializer(serializers.ModelSerializer):
-    image_file = serializers.ImageField(write_only=True, required=False)
+    @classmethod
+    def get_requested_fields(cls, request):
+        fields = set(cls.Meta.fields)
+        if request is None or request.method != "GET":
+            return fields
+        params = request.query_params
+        if "fields" not in params:
+            return fields
 
-    class Meta:
-        model = Agency
-        fields = ["id", "name", "contact", "image", "image_file"]  # 필요한 필드 정의
-        read_only_fields = ["image"]  # image 필드는 읽기 전용으로 설정
-
-    # 이름 중복 검증 (자신 제외)
-    def validate_name(self, value):
-        agency_id = (
-            self.instance.id if self.instance else None
-        )  # 현재 객체의 ID 가져오기
-        if Agency.objects.filter(name__iexact=value).exclude(id=agency_id).exists():
-            raise serializers.ValidationError("같은 이름의 소속사가 이미 존재합니다.")
-        return value
+        def split(value):
+            return {name.strip() for name in value.split(",") if name.strip()}
+
+        requested = split(params["fields"]) - set(cls.expandable_fields)
+        requested |= split(params.get("expand", "")) & set(cls.expandable_fields)
+        return (requested | {"id"}) & fields
+
+    @classmethod
+    def setup_eager_loading(cls, queryset, request, extra_fields=()):
+        """
+        요청된 필드만 조회하도록 쿼리셋을 좁힙니다.
+        (연관 모델 로딩은 각 시리얼라이저에서 추가)
+        """
+        if request is None or request.method != "GET":
+            return queryset
+        if "fields" not in request.query_params:
+            return queryset
+        concrete = {field.name for field in cls.Meta.model._meta.concrete_fields}
+        requested = cls.get_requested_fields(request)
+        for name in requested & set(cls.field_dependencies):
+            extra_fields = (*extra_fields, *cls.field_dependencies[name])
+        return queryset.only(*sorted((requested & concrete) | set(extra_fields)))
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        request = self.context.get("request")
+        requested = self.get_requested_fields(request)
+        for name in set(self.fields) - requested:
+            self.fields.pop(name)
+
+
+class ImageUploadMixin:
+    """
+    image_file 을 디스크에 임시 저장한 뒤 Celery 작업으로 S3 업로드를 넘깁니다.
+    요청은 업로드를 기다리지 않고 image_status=pending 으로 바로 응답합니다.
+    """
+
+    # S3 키 접두사 (images/{image_prefix}/{id}/...)
+    image_prefix = None
 
     def create(self, validated_data):
         image_file = validated_data.pop("image_file", None)
+        if image_file:
+            validated_data["image_status"] = ImageStatus.PENDING
         instance = super().create(validated_data)
         if image_file:
-            image_url = upload_image_to_s3(image_file, "agencies", instance.id)
-            if image_url:
-                instance.image = image_url
-                instance.save()
+            self.schedule_image_upload(instance, image_file)
         return instance
 
     def update(self, instance, validated_data):
         image_file = validated_data.pop("image_file", None)
+        if image_file:
+            validated_data["image_status"] = ImageStatus.PENDING
         instance = super().update(instance, validated_data)
         if image_file:
-            image_url = upload_image_to_s3(image_file, "agencies", instance.id)
-            if image_url:
-                instance.image = image_url
-                instance.save()
+            self.schedule_image_upload(instance, image_file)
         return instance
 
+    def schedule_image_upload(self, instance, image_file):
+        spool_path = spool_image_file(image_file)
+        # 커밋 이후에 작업을 발행해야 워커가 저장된 객체를 조회할 수 있음
+        transaction.on_commit(
+            lambda: upload_image_task.delay(
+                instance._meta.label,
+                instance.pk,
+                self.image_prefix,
+                spool_path,
+                image_file.name,
+            )
+        )
+
+
+class UniqueConstraintMixin:
+    """
+    중복 검사를 미리 조회하지 않고 DB 유니크 제약 위반(IntegrityError)을
+    검증 오류로 바꿉니다. 동시에 같은 이름을 저장하는 경쟁 상황도 제약이 막습니다.
+    """
+
+    # 제약 이름 -> (오류 필드, 메시지)
+    unique_error_messages = {}
+
+    def create(self, validated_data):
+        try:
+            with transaction.atomic():
+                return super().create(validated_data)
+        except IntegrityError as e:
+            self.raise_unique_error(e)
+
+    def update(self, instance, validated_data):
+        try:
+            with transaction.atomic():
+                return super().update(instance, validated_data)
+        except IntegrityError as e:
+            self.raise_unique_error(e)
+
+    def raise_unique_error(self, error):
+        message = str(error)
+        model = self.Meta.model
+        for constraint in model._meta.constraints:
+            if constraint.name not in self.unique_error_messages:
+                continue
+            # SQLite는 필드 제약의 경우 이름 대신 컬럼 목록을 표시
+            columns = ", ".join(
+                f"{model._meta.db_table}.{model._meta.get_field(name).column}"
+                for name in constraint.fields
+            )
+            if constraint.name in message or (columns and columns in message):
+                field, detail = self.unique_error_messages[constraint.name]
+                raise serializers.ValidationError({field: [detail]})
+        raise error
+
+
+class VariantImageField(serializers.Field):
+    """
+    image_variants 에서 요청 크기에 맞는 파생 이미지 URL을 반환합니다.
+    파생 이미지가 아직 없으면 원본 image URL을 반환합니다.
+    """
+
+    def __init__(self, size, ext="webp", **kwargs):
+        self.size = size
+        self.ext = ext
+        kwargs["source"] = "*"
+        kwargs["read_only"] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, instance):
+        return get_variant_url(instance.image_variants, self.size, self.ext) or (
+            instance.image
+        )
+
+
+class IdolNestedSerializer(serializers.ModelSerializer):
+    thumbnail = VariantImageField(size=64)  # 목록용 작은 썸네일
+
+    class Meta:
+        model = Idol
+        fields = [
+            "id",
+            "name",
+            "image",
+            "thumbnail",
+        ]  # 그룹 정보에 포함시킬 아이돌 필드 (id, 이름, 이미지 URL)
+
+
+class UpcomingScheduleSerializer(serializers.ModelSerializer):
+    # 참여 멤버는 이름만 반환 (prefetch 된 목록 사용)
+    participating_members = serializers.SlugRelatedField(
+        many=True, read_only=True, slug_field="name"
+    )
+
+    class Meta:
+        model = Schedule
+        fields = [
+            "id",
+            "title",
+            "location",
+            "start_time",
+            "end_time",
+            "participating_members",
+        ]
+
+
+def get_upcoming_schedules_prefetch(limit):
+    """
+    그룹마다 다가오는 일정 limit개를 upcoming_schedules 로 가져오는 Prefetch.
+    슬라이스된 Prefetch는 그룹 수와 관계없이
+    ROW_NUMBER() OVER (PARTITION BY group_id ORDER BY start_time) 쿼리 한 번으로 실행됩니다.
+    """
+    schedules = (
+        Schedule.objects.filter(start_time__gte=timezone.now())
+        .order_by("start_time", "id")
+        .prefetch_related(
+            Prefetch(
+                "participating_members",
+                queryset=Idol.objects.only("id", "name").order_by("name"),
+            )
+        )
+    )
+    return Prefetch(
+        "schedules", queryset=schedules[:limit], to_attr="upcoming_schedules"
+    )
+
+
+# Agency Serializer
+class AgencySerializer(
+    SparseFieldsMixin,
+    ImageUploadMixin,
+    UniqueConstraintMixin,
+    serializers.ModelSerializer,
+):
+    image_prefix = "agencies"
+    unique_error_messages = {
+        "agency_name_ci_unique": ("name", "같은 이름의 소속사가 이미 존재합니다.")
+    }
+    image_file = serializers.ImageField(write_only=True, required=False)
+    thumbnail = VariantImageField(size=256)
+
+    class Meta:
+        model = Agency
+        fields = [
+            "id",
+            "name",
+            "contact",
+            "image",
+            "image_status",
+            "image_variants",
+            "thumbnail",
+            "image_file",
+        ]  # 필요한 필드 정의
+        read_only_fields = [
+            "image",
+            "image_status",
+            "image_variants",
+        ]  # 이미지 필드는 읽기 전용으로 설정
+        # 이름 중복은 미리 조회하지 않고 유니크 제약으로 검사
+        extra_kwargs = {"name": {"validators": []}}
+
 
 # Group Serializer
-class GroupSerializer(serializers.ModelSerializer):
+class GroupSerializer(
+    SparseFieldsMixin,
+    ImageUploadMixin,
+    UniqueConstraintMixin,
+    serializers.ModelSerializer,
+):
+    expandable_fields = ("idol_set",)
+    image_prefix = "groups"
+    unique_error_messages = {
+        "group_name_ci_unique": ("name", "같은 이름의 그룹이 이미 존재합니다.")
+    }
+
     agency_name = serializers.CharField(
         source="agency.name", read_only=True
     )  # 관련 소속사 이름 추가 (읽기 전용)
     idol_set = IdolNestedSerializer(many=True, read_only=True)
-    member_count = serializers.SerializerMethodField()
+    # ?upcoming=N 일 때만 포함
+    upcoming_schedules = UpcomingScheduleSerializer(many=True, read_only=True)
     image_file = serializers.ImageField(write_only=True, required=False)
+    thumbnail = VariantImageField(size=256)
 
     class Meta:
         model = Group
         fields = [
             "id",  # ID 필드 추가
             "name",
+            "slug",  # URL용 이름 (읽기 전용)
             "agency",  # 소속사 ID (ForeignKey)
             "agency_name",  # 소속사 이름
             "color",
             "sns",
             "image",  # 그룹 이미지 URL
+            "image_status",  # 이미지 업로드 상태 (pending/ready/failed)
+            "image_variants",  # 파생 이미지 정보 (크기/포맷)
+            "thumbnail",  # 목록용 썸네일 URL
             "idol_set",  # 중첩된 아이돌 정보 리스트
-            "member_count",  # 계산된 멤버 수
+            "member_count",  # 멤버 수 (비정규화 컬럼)
+            "subscriber_count",  # 구독자 수 (비정규화 컬럼)
+            "upcoming_schedules",  # 다가오는 일정 (?upcoming=N)
             "image_file",  # 이미지 업로드용 (write_only)
         ]  # 사용 필드 정의
 
-        read_only_fields = ["image"]  # image 필드는 읽기 전용으로 설정
+        read_only_fields = [
+            "image",
+            "image_status",
+            "image_variants",
+        ]  # 이미지 필드는 읽기 전용으로 설정
+        # 이름 중복은 미리 조회하지 않고 유니크 제약으로 검사
+        extra_kwargs = {"name": {"validators": []}}
 
-    # member_count 계산 메서드
-    def get_member_count(self, obj):
-        # obj는 Group 인스턴스. 연관된 idol_set의 개수를 센다.
-        return obj.idol_set.count()
+    @classmethod
+    def get_upcoming_limit(cls, request):
+        # ?upcoming=N (없거나 잘못된 값이면 일정을 포함하지 않음)
+        if request is None or request.method != "GET":
+            return None
+        try:
+            limit = int(request.query_params.get("upcoming", ""))
+        except ValueError:
+            return None
+        if limit < 1:
+            return None
+        return min(limit, settings.CATALOG_MAX_UPCOMING)
 
-    # 이름 중복 검증 자신 제외
-    def validate_name(self, value):
-        group_id = (
-            self.instance.id if self.instance else None
-        )  # 현재 객체의 ID 가져오기
-        if Group.objects.filter(name__iexact=value).exclude(id=group_id).exists():
-            raise serializers.ValidationError("같은 이름의 그룹이 이미 존재합니다.")
-        return value
+    @classmethod
+    def get_requested_fields(cls, request):
+        fields = super().get_requested_fields(request)
+        if cls.get_upcoming_limit(request):
+            fields.add("upcoming_schedules")
+        else:
+            fields.discard("upcoming_schedules")
+        return fields
 
-    def create(self, validated_data):
-        image_file = validated_data.pop("image_file", None)
-        instance = super().create(validated_data)
-        if image_file:
-            image_url = upload_image_to_s3(image_file, "groups", instance.id)
-            if image_url:
-                instance.image = image_url
-                instance.save()
-        return instance
-
-    def update(self, instance, validated_data):
-        image_file = validated_data.pop("image_file", None)
-        instance = super().update(instance, validated_data)
-        if image_file:
-            image_url = upload_image_to_s3(image_file, "groups", instance.id)
-            if image_url:
-                instance.image = image_url
-                instance.save()
-        return instance
+    @classmethod
+    def setup_eager_loading(cls, queryset, request, extra_fields=()):
+        requested = cls.get_requested_fields(request)
+        if "upcoming_schedules" in requested:
+            queryset = queryset.prefetch_related(
+                get_upcoming_schedules_prefetch(cls.get_upcoming_limit(request))
+            )
+        if "agency_name" in requested:
+            queryset = queryset.select_related("agency")
+            extra_fields = (*extra_fields, "agency", "agency__name")
+        if "idol_set" in requested:
+            queryset = queryset.prefetch_related("idol_set")
+        return super().setup_eager_loading(queryset, request, extra_fields)
 
 
 # Idol Serializer
-class IdolSerializer(serializers.ModelSerializer):
+class IdolSerializer(
+    SparseFieldsMixin,
+    ImageUploadMixin,
+    UniqueConstraintMixin,
+    serializers.ModelSerializer,
+):
+    image_prefix = "idols"
+    unique_error_messages = {
+        "idol_group_name_unique": (
+            api_settings.NON_FIELD_ERRORS_KEY,
+            "같은 그룹에 동일한 이름의 아이돌이 이미 존재합니다.",
+        )
+    }
     group_name = serializers.CharField(
         source="group.name", read_only=True
     )  # 관련 그룹 이름 추가 (읽기 전용)
     image_file = serializers.ImageField(write_only=True, required=False)
+    thumbnail = VariantImageField(size=256)
 
     class Meta:
         model = Idol
@@ -130,43 +367,53 @@ class IdolSerializer(serializers.ModelSerializer):
             "group",  # 생성/수정 시 필요
             "group_name",
             "image",  # 아이돌 이미지 URL 필드 추가
+            "image_status",
+            "image_variants",
+            "thumbnail",
             "image_file",
         ]
         # group_name도 읽기 전용이므로 read_only_fields에 추가
-        read_only_fields = ["image", "group_name"]
+        read_only_fields = ["image", "image_status", "image_variants", "group_name"]
+        # (group, name) 중복은 미리 조회하지 않고 유니크 제약으로 검사
+        validators = []
+
+    @classmethod
+    def setup_eager_loading(cls, queryset, request, extra_fields=()):
+        if "group_name" in cls.get_requested_fields(request):
+            queryset = queryset.select_related("group")
+            extra_fields = (*extra_fields, "group", "group__name")
+        return super().setup_eager_loading(queryset, request, extra_fields)
 
     def validate(self, data):
         name = data.get("name")
         group = data.get("group")
-        idol_id = self.instance.id if self.instance else None  # 현재 객체의 ID 가져오기
 
         # 데이터 유효성 검사
         if not name or not group:
             raise serializers.ValidationError("이름과 그룹은 필수 입력 항목입니다.")
 
-        # 같은 그룹 내의 이름 중복 검사 (자기 자신 제외)
-        if Idol.objects.filter(name=name, group=group).exclude(id=idol_id).exists():
-            raise serializers.ValidationError(
-                "같은 그룹에 동일한 이름의 아이돌이 이미 존재합니다."
-            )
+        # 같은 그룹 내의 이름 중복은 저장 시 유니크 제약으로 검사
         return data
 
-    def create(self, validated_data):
-        image_file = validated_data.pop("image_file", None)
-        instance = super().create(validated_data)
-        if image_file:
-            image_url = upload_image_to_s3(image_file, "idols", instance.id)
-            if image_url:
-                instance.image = image_url
-                instance.save()
-        return instance
 
-    def update(self, instance, validated_data):
-        image_file = validated_data.pop("image_file", None)
-        instance = super().update(instance, validated_data)
-        if image_file:
-            image_url = upload_image_to_s3(image_file, "idols", instance.id)
-            if image_url:
-                instance.image = image_url
-                instance.save()
-        return instance
+# 직접 업로드(presigned) 요청
+class ImageUploadRequestSerializer(serializers.Serializer):
+    content_type = serializers.CharField()
+
+    def validate_content_type(self, value):
+        if value not in settings.IMAGE_UPLOAD_CONTENT_TYPES:
+            raise serializers.ValidationError("허용되지 않는 이미지 형식입니다.")
+        return value
+
+
+# 직접 업로드 완료 확인
+class ImageUploadConfirmSerializer(serializers.Serializer):
+    key = serializers.CharField()
+
+    def validate_key(self, value):
+        # 발급한 경로(images/{대상}/{id}/) 바로 아래의 객체만 허용
+        prefix = self.context["key_prefix"]
+        file_name = value[len(prefix) :]
+        if not value.startswith(prefix) or not file_name or "/" in file_name:
+            raise serializers.ValidationError("허용되지 않는 업로드 경로입니다.")
+        return value
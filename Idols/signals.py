@@ -0,0 +1,67 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .blobs import release_image_url
+from .cache import bump_catalog_version
+from .counters import adjust_group_counter
+from .deletion import skip_during_purge
+from .models import Agency, Group, Idol
+from .search import SEARCH_MODELS, catalog_index
+
+SEARCH_KINDS = {model: kind for kind, model in SEARCH_MODELS.items()}
+
+
+@receiver(post_save, sender=Agency)
+@receiver(post_save, sender=Group)
+@receiver(post_save, sender=Idol)
+@receiver(post_delete, sender=Agency)
+@receiver(post_delete, sender=Group)
+@receiver(post_delete, sender=Idol)
+@skip_during_purge
+def invalidate_catalog(sender, **kwargs):
+    # 소속사/그룹/아이돌이 변경되면 카탈로그 스냅샷 무효화
+    bump_catalog_version()
+
+
+@receiver(post_save, sender=Agency)
+@receiver(post_save, sender=Group)
+@receiver(post_save, sender=Idol)
+def update_search_index(sender, instance, **kwargs):
+    # 커밋된 변경만 이 프로세스의 검색 인덱스에 반영
+    kind, pk, name = SEARCH_KINDS[sender], instance.pk, instance.name
+    transaction.on_commit(lambda: catalog_index.upsert(kind, pk, name))
+
+
+@receiver(post_delete, sender=Agency)
+@receiver(post_delete, sender=Group)
+@receiver(post_delete, sender=Idol)
+@skip_during_purge
+def remove_from_search_index(sender, instance, **kwargs):
+    kind, pk = SEARCH_KINDS[sender], instance.pk
+    transaction.on_commit(lambda: catalog_index.remove(kind, pk))
+
+
+@receiver(post_delete, sender=Agency)
+@receiver(post_delete, sender=Group)
+@receiver(post_delete, sender=Idol)
+@skip_during_purge
+def release_image_blob(sender, instance, **kwargs):
+    # 삭제된 객체가 참조하던 이미지 blob 참조 해제
+    release_image_url(instance.image)
+
+
+@receiver(post_save, sender=Idol)
+def update_member_count(sender, instance, created, **kwargs):
+    # 새 아이돌이거나 소속 그룹이 바뀌었으면 그룹 멤버 수 증감
+    previous = None if created else getattr(instance, "_loaded_group_id", None)
+    if created or (previous is not None and previous != instance.group_id):
+        adjust_group_counter(previous, "member_count", -1)
+        adjust_group_counter(instance.group_id, "member_count", 1)
+    instance._loaded_group_id = instance.group_id
+
+
+@receiver(post_delete, sender=Idol)
+@skip_during_purge
+def decrease_member_count(sender, instance, **kwargs):
+    adjust_group_counter(instance.group_id, "member_count", -1)
@@ -0,0 +1,207 @@
+import logging
+import os
+from datetime import timedelta
+
+from celery import shared_task
+from django.apps import apps
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from .blobs import BLOB_KEY_PREFIX, acquire_blob, release_blob, release_image_url
+from .cache import bump_catalog_version
+from .counters import reconcile_group_counters
+from .deletion import purge_deleted_catalog
+from .image_variants import (
+    VARIANT_FORMATS,
+    VARIANT_SIZES,
+    build_variants,
+    get_variant_key_base,
+)
+from .models import ImageBlob, ImageStatus
+from .s3_utils import (
+    delete_image_objects,
+    get_blob_key,
+    get_image_url,
+    hash_fileobj,
+    head_image_object,
+    put_image_object,
+    read_image_object,
+    upload_blob_to_s3,
+)
+
+logger = logging.getLogger(__name__)
+
+# S3 업로드 실패 시 재시도 횟수 (모두 실패하면 image_status=failed)
+UPLOAD_MAX_RETRIES = 3
+
+
+def _set_image_status(model, instance_id, filters=None, **fields):
+    # update()는 시그널을 발생시키지 않으므로 updated_at과 카탈로그 버전을 직접 갱신
+    updated = model.objects.filter(pk=instance_id, **(filters or {})).update(
+        updated_at=timezone.now(), **fields
+    )
+    bump_catalog_version()
+    return updated
+
+
+@shared_task(bind=True)
+def upload_image_task(
+    self, model_label, instance_id, s3_key_prefix, spool_path, file_name
+):
+    """
+    디스크에 임시 저장된 이미지를 내용 주소(SHA-256) 키로 S3에 업로드하고 image 필드를 갱신합니다.
+    같은 내용의 blob이 이미 있으면 업로드를 건너뜁니다.
+    (s3_key_prefix는 이미 발행된 작업과의 호환을 위해 유지)
+    """
+    model = apps.get_model(model_label)
+    try:
+        with open(spool_path, "rb") as fileobj:
+            digest, size = hash_fileobj(fileobj)
+            s3_key = get_blob_key(digest, file_name)
+            acquire_blob(s3_key, size)
+            try:
+                upload_blob_to_s3(fileobj, s3_key)
+            except Exception:
+                release_blob(s3_key)
+                raise
+    except FileNotFoundError:
+        logger.error(f"업로드할 임시 파일 없음 ({model_label} {instance_id})")
+        _set_image_status(model, instance_id, image_status=ImageStatus.FAILED)
+        return False
+    except Exception as e:
+        # retry()는 횟수를 모두 쓰면 MaxRetriesExceededError 대신 e 를 다시 던지므로 미리 확인
+        if self.request.retries < UPLOAD_MAX_RETRIES:
+            raise self.retry(exc=e, countdown=10, max_retries=UPLOAD_MAX_RETRIES)
+        logger.error(
+            f"이미지 업로드 최대 재시도 초과 ({model_label} {instance_id}): {e}"
+        )
+        _set_image_status(model, instance_id, image_status=ImageStatus.FAILED)
+        os.remove(spool_path)
+        return False
+
+    with transaction.atomic():
+        previous = (
+            model.objects.select_for_update()
+            .filter(pk=instance_id)
+            .values_list("image", flat=True)
+            .first()
+        )
+        updated = _set_image_status(
+            model,
+            instance_id,
+            image=get_image_url(s3_key),
+            image_status=ImageStatus.READY,
+            image_variants={},
+        )
+        # 이전 이미지 참조 해제 (객체가 그 사이 삭제되었으면 새 blob 참조 해제)
+        if updated:
+            release_image_url(previous)
+        else:
+            release_blob(s3_key)
+    os.remove(spool_path)
+    logger.info(f"이미지 업로드 완료 ({model_label} {instance_id})")
+    if updated:
+        generate_image_variants_task.delay(model_label, instance_id, s3_key)
+    return bool(updated)
+
+
+@shared_task(bind=True)
+def generate_image_variants_task(self, model_label, instance_id, s3_key):
+    """원본 이미지로 크기별 WebP/JPEG 파생 이미지를 만들어 S3에 저장합니다."""
+    model = apps.get_model(model_label)
+    try:
+        key_base = get_variant_key_base(s3_key)
+        # 같은 blob의 파생 이미지가 이미 있으면 다시 만들지 않음
+        last_variant = f"{key_base}_{VARIANT_SIZES[-1]}.{list(VARIANT_FORMATS)[-1]}"
+        if not (s3_key.startswith(BLOB_KEY_PREFIX) and head_image_object(last_variant)):
+            source = read_image_object(s3_key)
+            # 디코딩/리사이즈는 프로세스 풀에서 실행
+            variants = build_variants(source)
+            for size, ext, body in variants:
+                content_type = VARIANT_FORMATS[ext][1]
+                put_image_object(f"{key_base}_{size}.{ext}", body, content_type)
+    except Exception as e:
+        logger.error(f"파생 이미지 생성 실패 ({model_label} {instance_id}): {e}")
+        return False
+
+    # 그 사이 이미지가 교체되었다면 반영하지 않음
+    image_variants = {
+        "base": get_image_url(key_base),
+        "sizes": list(VARIANT_SIZES),
+        "formats": list(VARIANT_FORMATS),
+    }
+    updated = _set_image_status(
+        model,
+        instance_id,
+        filters={"image": get_image_url(s3_key)},
+        image_variants=image_variants,
+    )
+    return bool(updated)
+
+
+@shared_task
+def collect_image_blobs_task(batch_size=1000):
+    """
+    참조가 0인 채로 유예 시간이 지난 blob과 파생 이미지를 S3와 테이블에서 일괄 삭제합니다.
+    (Celery beat 등으로 주기 실행)
+    """
+    cutoff = timezone.now() - timedelta(seconds=settings.IMAGE_BLOB_GC_GRACE)
+    collected = 0
+    while True:
+        with transaction.atomic():
+            # 처리 중 다시 참조되는 blob과 엇갈리지 않도록 행을 잠근 채 삭제
+            keys = list(
+                ImageBlob.objects.select_for_update(skip_locked=True)
+                .filter(ref_count__lte=0, updated_at__lt=cutoff)
+                .order_by("updated_at")
+                .values_list("key", flat=True)[:batch_size]
+            )
+            if not keys:
+                break
+            s3_keys = []
+            for key in keys:
+                key_base = get_variant_key_base(key)
+                s3_keys.append(key)
+                s3_keys.extend(
+                    f"{key_base}_{size}.{ext}"
+                    for size in VARIANT_SIZES
+                    for ext in VARIANT_FORMATS
+                )
+            delete_image_objects(s3_keys)
+            ImageBlob.objects.filter(key__in=keys).delete()
+        collected += len(keys)
+    logger.info(f"이미지 blob {collected}개 삭제")
+    return collected
+
+
+@shared_task
+def reconcile_group_counters_task(batch_size=1000):
+    """
+    그룹의 멤버 수/구독자 수가 실제 행 수와 어긋난 경우 일괄 복구합니다.
+    (bulk 작업, 시그널 없는 삭제 등으로 생긴 차이 - Celery beat 등으로 주기 실행)
+    """
+    fixed = reconcile_group_counters(batch_size)
+    if fixed:
+        # 캐시된 카탈로그 응답에도 고친 값이 반영되도록 무효화
+        bump_catalog_version()
+    logger.info(f"그룹 집계 {fixed}개 복구")
+    return fixed
+
+
+@shared_task(bind=True)
+def purge_deleted_catalog_task(self, batch_size=1000):
+    """
+    숨김 처리된 소속사/그룹과 하위 데이터를 batch_size개씩 나누어 삭제합니다.
+    배치마다 PROGRESS 상태로 {모델 라벨: 삭제 수}를 기록합니다.
+    (삭제 요청 시 예약되며, 중단된 작업을 이어서 처리하도록 주기 실행도 가능)
+    """
+
+    def report(deleted):
+        # 워커에서 실행될 때만 결과 백엔드에 기록
+        if self.request.id and not self.request.is_eager:
+            self.update_state(state="PROGRESS", meta={"deleted": dict(deleted)})
+
+    deleted = purge_deleted_catalog(batch_size, on_progress=report)
+    logger.info(f"삭제 대기 카탈로그 정리: {deleted}")
+    return deleted
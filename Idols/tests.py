@@ -1,11 +1,61 @@
+import base64
+import csv
+import hashlib
+import io
+import json
+import os
+import shutil
+import tempfile
+from datetime import timedelta
+from unittest import skipUnless
+from unittest.mock import patch
+
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AnonymousUser
-from django.test import override_settings
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test import SimpleTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from django.utils import timezone
+from PIL import Image
 from rest_framework import status
 from rest_framework.test import APIClient, APITestCase
 
-from .models import Agency, Group, Idol
+try:
+    from moto import mock_aws
+except ImportError:  # moto 미설치 시 S3 연동 테스트 건너뜀
+    mock_aws = None
+
+from config.admin_pagination import EstimatedCountPaginator
+from config.query_budget import QueryBudgetExceeded, QueryBudgetMixin, query_budget
+from Preferences.models import UserGroupSubscribe
+from Preferences.services import SubscriptionService
+from Schedules.models import Schedule
+
+from . import s3_utils
+from .cache import bump_catalog_version, get_catalog_version
+from .deletion import hide_catalog_object, purge_deleted_catalog
+from .exporter import CSV_COLUMNS
+from .image_variants import get_variant_url, render_variants
+from .importer import CatalogImport
+from .models import Agency, Group, Idol, ImageBlob
+from .search import (
+    CatalogSearchIndex,
+    catalog_index,
+    get_trigrams,
+    normalize_name,
+    trigram_similarity,
+)
+from .tasks import (
+    UPLOAD_MAX_RETRIES,
+    collect_image_blobs_task,
+    generate_image_variants_task,
+    purge_deleted_catalog_task,
+    reconcile_group_counters_task,
+    upload_image_task,
+)
 
 
 class AgencyViewTests(APITestCase):
@@ -242,3 +292,1649 @@ class AgencyViewTests(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["data"]["name"], "Idol1")
         self.assertEqual(response.data["data"]["group"], self.group.id)
+
+
+class GroupListSnapshotTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.agency = Agency.objects.create(name="Snapshot Agency")
+        self.group = Group.objects.create(name="Snapshot Group", agency=self.agency)
+        self.group_list_url = reverse("group_list")
+
+    def test_snapshot_served_without_queries(self):
+        """두 번째 요청부터는 목록 조회 없이 스냅샷 반환"""
+        first = self.client.get(self.group_list_url)
+        self.assertEqual(first.status_code, status.HTTP_200_OK)
+
+        with self.assertNumQueries(0):
+            second = self.client.get(self.group_list_url)
+        self.assertEqual(second.content, first.content)
+        self.assertEqual(second["Content-Type"], "application/json")
+
+    def test_snapshot_invalidated_on_catalog_change(self):
+        """아이돌 추가 시 스냅샷 갱신 확인"""
+        self.client.get(self.group_list_url)
+        Idol.objects.create(name="Idol1", group=self.group)
+
+        response = self.client.get(self.group_list_url)
+        self.assertEqual(response.data["data"][0]["member_count"], 1)
+        self.assertEqual(response.data["data"][0]["idol_set"][0]["name"], "Idol1")
+
+
+class ConditionalGetTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.agency = Agency.objects.create(name="Etag Agency")
+        self.group = Group.objects.create(name="Etag Group", agency=self.agency)
+        self.idol = Idol.objects.create(name="Idol1", group=self.group)
+
+    def test_list_returns_validators(self):
+        """목록 응답에 ETag / Last-Modified 헤더 포함"""
+        for url_name in ("agency_list", "group_list", "idol_list"):
+            response = self.client.get(reverse(url_name))
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertTrue(response["ETag"].startswith('"'))
+            self.assertIn("Last-Modified", response)
+
+    def test_if_none_match_returns_304(self):
+        """ETag가 일치하면 캐시된 검증 값으로 쿼리 없이 304 반환"""
+        url = reverse("group_detail", kwargs={"pk": self.group.id})
+        etag = self.client.get(url)["ETag"]
+
+        with self.assertNumQueries(0):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response["ETag"], etag)
+
+    def test_etag_differs_per_representation(self):
+        """fields/cursor 등이 다른 응답은 ETag 도 다름 (파라미터 순서는 무관)"""
+        url = reverse("group_list")
+        full = self.client.get(url)["ETag"]
+        narrow = self.client.get(url, {"fields": "id,name", "page_size": 1})["ETag"]
+        self.assertNotEqual(narrow, full)
+        response = self.client.get(url + "?page_size=1&fields=id,name")
+        self.assertEqual(response["ETag"], narrow)
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=narrow)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["ETag"], full)
+
+    def test_etag_changes_when_member_changes(self):
+        """멤버가 바뀌면 그룹 목록 ETag 변경"""
+        url = reverse("group_list")
+        etag = self.client.get(url)["ETag"]
+        self.idol.delete()
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_if_modified_since_returns_304(self):
+        """Last-Modified 이후 변경이 없으면 304 반환"""
+        url = reverse("idol_detail", kwargs={"pk": self.idol.id})
+        last_modified = self.client.get(url)["Last-Modified"]
+
+        response = self.client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+
+class KeysetPaginationTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        for name in ("Delta", "Alpha", "Echo", "Charlie", "Bravo"):
+            agency = Agency.objects.create(name=name)
+            Group.objects.create(name=f"{name} Group", agency=agency)
+
+    def collect_pages(self, url):
+        names = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            names.extend(item["name"] for item in response.data["data"])
+            url = response.data["next"]
+        return names
+
+    def test_agency_pages_follow_name_order(self):
+        """커서를 따라가면 이름 순으로 전체 목록 조회"""
+        names = self.collect_pages(reverse("agency_list") + "?page_size=2")
+        self.assertEqual(names, ["Alpha", "Bravo", "Charlie", "Delta", "Echo"])
+
+    def test_group_pages_use_snapshot_per_cursor(self):
+        """그룹 목록도 페이지별로 조회"""
+        names = self.collect_pages(reverse("group_list") + "?page_size=3")
+        self.assertEqual(len(names), 5)
+        self.assertEqual(names[0], "Alpha Group")
+
+    @override_settings(ALLOWED_HOSTS=["a.example.com", "b.example.com"])
+    def test_cached_next_link_is_relative(self):
+        """캐시된 그룹 목록의 next에는 처음 요청한 호스트가 남지 않음"""
+        url = reverse("group_list") + "?page_size=2"
+        first = self.client.get(url, HTTP_HOST="a.example.com")
+        second = self.client.get(url, HTTP_HOST="b.example.com", secure=True)
+        self.assertEqual(second.content, first.content)
+        self.assertTrue(first.data["next"].startswith(reverse("group_list") + "?"))
+        self.assertNotIn("example.com", first.data["next"])
+
+    def test_last_page_has_no_next(self):
+        """마지막 페이지의 next는 None"""
+        response = self.client.get(reverse("idol_list"))
+        self.assertIsNone(response.data["next"])
+
+    def test_invalid_cursor(self):
+        """잘못된 커서는 404 반환"""
+        response = self.client.get(reverse("agency_list") + "?cursor=invalid")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_cursor_value_types(self):
+        """정렬 컬럼 타입과 맞지 않는 커서 값도 404 반환"""
+        for position in (["abc"], [None], [{"x": 1}]):
+            cursor = base64.urlsafe_b64encode(json.dumps(position).encode()).decode()
+            response = self.client.get(reverse("idol_list"), {"cursor": cursor})
+            self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        cursor = base64.urlsafe_b64encode(json.dumps(["Alpha", "x"]).encode())
+        response = self.client.get(reverse("agency_list"), {"cursor": cursor.decode()})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class SparseFieldsTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.agency = Agency.objects.create(name="Sparse Agency")
+        self.group = Group.objects.create(
+            name="Sparse Group", agency=self.agency, color="#FFFFFF"
+        )
+        Idol.objects.create(name="Idol1", group=self.group)
+
+    def test_group_list_fields(self):
+        """?fields= 로 요청한 필드만 단일 SELECT로 반환"""
+        url = reverse("group_list") + "?fields=id,name,color"
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(set(response.data["data"][0]), {"id", "name", "color"})
+
+        # 조건부 요청 집계 쿼리 + 그룹 조회 쿼리
+        self.assertEqual(len(queries), 2)
+        select_sql = queries[1]["sql"]
+        self.assertNotIn("COUNT", select_sql)
+        self.assertNotIn("JOIN", select_sql)
+        self.assertNotIn('"sns"', select_sql)
+
+    def test_group_expand_idol_set(self):
+        """?expand=idol_set 지정 시 멤버 목록 포함"""
+        url = reverse("group_list") + "?fields=name&expand=idol_set"
+        response = self.client.get(url)
+        group = response.data["data"][0]
+        self.assertEqual(set(group), {"id", "name", "idol_set"})
+        self.assertEqual(group["idol_set"][0]["name"], "Idol1")
+
+    def test_idol_detail_fields(self):
+        """아이돌 상세도 ?fields= 지원"""
+        idol = Idol.objects.get(name="Idol1")
+        url = reverse("idol_detail", kwargs={"pk": idol.id}) + "?fields=name"
+        response = self.client.get(url)
+        self.assertEqual(response.data["data"], {"id": idol.id, "name": "Idol1"})
+
+
+class IdolsQueryBudgetTests(QueryBudgetMixin, APITestCase):
+    """
+    Idols 엔드포인트별 쿼리 예산 (N=1, 10, 1000에서 동일해야 함)
+    """
+
+    def setUp(self):
+        self.agency = Agency.objects.create(name="Budget Agency")
+        self.group = Group.objects.create(name="Budget Group", agency=self.agency)
+        self.idol = Idol.objects.create(name="Budget", group=self.group)
+        self.sequence = 0
+
+    def before_budget_request(self):
+        # 그룹 목록 스냅샷 캐시 없이 측정
+        cache.clear()
+
+    def populate(self, count):
+        # 소속사, 그룹, 아이돌을 count개씩 추가 (bulk_create로 빠르게 생성)
+        start = self.sequence
+        self.sequence += count
+        agencies = Agency.objects.bulk_create(
+            Agency(name=f"A{index}") for index in range(start, self.sequence)
+        )
+        groups = Group.objects.bulk_create(
+            Group(name=f"G{index}", slug=f"g{index}", agency=agency)
+            for index, agency in zip(range(start, self.sequence), agencies)
+        )
+        Idol.objects.bulk_create(
+            Idol(name=f"I{index}", group=group)
+            for index, group in zip(range(start, self.sequence), groups)
+        )
+        # 상세 조회 대상 그룹의 멤버도 함께 늘림
+        Idol.objects.bulk_create(
+            Idol(name=f"M{index}", group=self.group)
+            for index in range(start, self.sequence)
+        )
+
+    def test_agency_list_budget(self):
+        # 검증 집계 + 목록 조회
+        self.assertEndpointBudget(reverse("agency_list"), 2, self.populate)
+
+    def test_agency_detail_budget(self):
+        url = reverse("agency_detail", kwargs={"pk": self.agency.id})
+        self.assertEndpointBudget(url, 2, self.populate)
+
+    def test_group_list_budget(self):
+        # 검증 집계 + 그룹(소속사 조인, 멤버 수 집계) + 멤버 prefetch
+        self.assertEndpointBudget(reverse("group_list"), 3, self.populate)
+
+    def test_group_list_sparse_budget(self):
+        url = reverse("group_list") + "?fields=id,name,color"
+        self.assertEndpointBudget(url, 2, self.populate)
+
+    def test_group_by_name_budget(self):
+        url = reverse("group_by_name", kwargs={"slug": self.group.slug})
+        self.assertEndpointBudget(url, 4, self.populate)
+
+    def test_group_detail_budget(self):
+        url = reverse("group_detail", kwargs={"pk": self.group.id})
+        self.assertEndpointBudget(url, 3, self.populate)
+
+    def test_idol_list_budget(self):
+        self.assertEndpointBudget(reverse("idol_list"), 2, self.populate)
+
+    def test_idol_detail_budget(self):
+        url = reverse("idol_detail", kwargs={"pk": self.idol.id})
+        self.assertEndpointBudget(url, 2, self.populate)
+
+    def test_budget_exceeded_reports_queries(self):
+        """예산 초과 시 실행된 쿼리 목록과 함께 실패"""
+        with self.assertRaises(QueryBudgetExceeded) as context:
+            with query_budget(1):
+                list(Agency.objects.all())
+                list(Group.objects.all())
+        self.assertIn("2개 실행", str(context.exception))
+
+
+def make_image_file(name="image.png"):
+    buffer = io.BytesIO()
+    Image.new("RGB", (10, 10), "#6A5096").save(buffer, format="PNG")
+    return SimpleUploadedFile(name, buffer.getvalue(), content_type="image/png")
+
+
+class AsyncImageUploadTests(APITestCase):
+    def setUp(self):
+        self.spool_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.spool_dir, ignore_errors=True)
+        User = get_user_model()
+        self.admin_user = User.objects.create_superuser(
+            username="admin",
+            name="Super User",
+            email="admin@example.com",
+            password="adminpassword",
+        )
+        self.client.force_authenticate(user=self.admin_user)
+
+    @patch("Idols.serializers.upload_image_task.delay")
+    def test_create_agency_returns_pending(self, mock_delay):
+        """이미지 업로드를 기다리지 않고 pending 상태로 응답"""
+        with self.settings(IMAGE_UPLOAD_SPOOL_DIR=self.spool_dir):
+            with self.captureOnCommitCallbacks(execute=True):
+                response = self.client.post(
+                    reverse("agency_list"),
+                    {"name": "Image Agency", "image_file": make_image_file()},
+                    format="multipart",
+                )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["data"]["image_status"], "pending")
+        self.assertIsNone(response.data["data"]["image"])
+
+        model_label, instance_id, prefix, spool_path, file_name = (
+            mock_delay.call_args.args
+        )
+        self.assertEqual(model_label, "Idols.Agency")
+        self.assertEqual(prefix, "agencies")
+        self.assertEqual(file_name, "image.png")
+        self.assertTrue(os.path.exists(spool_path))
+
+    @patch("Idols.tasks.generate_image_variants_task.delay")
+    @patch("Idols.tasks.upload_blob_to_s3", return_value=True)
+    def test_upload_task_marks_ready(self, mock_upload, mock_variants):
+        """업로드 작업 완료 시 image와 상태 갱신, 임시 파일 삭제"""
+        agency = Agency.objects.create(name="Task Agency", image_status="pending")
+        spool_path = os.path.join(self.spool_dir, "spooled.png")
+        with open(spool_path, "wb") as spooled:
+            spooled.write(b"image")
+
+        upload_image_task("Idols.Agency", agency.id, "agencies", spool_path, "a.png")
+
+        agency.refresh_from_db()
+        digest = hashlib.sha256(b"image").hexdigest()
+        self.assertTrue(
+            agency.image.endswith(f"images/blobs/{digest[:2]}/{digest}.png")
+        )
+        self.assertEqual(agency.image_status, "ready")
+        self.assertFalse(os.path.exists(spool_path))
+
+    @patch("Idols.tasks.upload_blob_to_s3", side_effect=OSError("S3 unavailable"))
+    def test_upload_task_retries_then_marks_failed(self, mock_upload):
+        """마지막 재시도까지 실패하면 failed 표시와 임시 파일 삭제"""
+        agency = Agency.objects.create(name="Retry Agency", image_status="pending")
+        spool_path = os.path.join(self.spool_dir, "retry.png")
+        with open(spool_path, "wb") as spooled:
+            spooled.write(b"image")
+        args = ("Idols.Agency", agency.id, "agencies", spool_path, "a.png")
+
+        # eager 실행에서는 재시도가 마지막 시도까지 이어서 실행됨
+        result = upload_image_task.apply(args=args)
+        self.assertIs(result.get(), False)
+        self.assertEqual(mock_upload.call_count, UPLOAD_MAX_RETRIES + 1)
+        agency.refresh_from_db()
+        self.assertEqual(agency.image_status, "failed")
+        self.assertFalse(os.path.exists(spool_path))
+        # 업로드 실패한 blob 참조는 남기지 않음
+        self.assertFalse(ImageBlob.objects.filter(ref_count__gt=0).exists())
+
+    def test_upload_task_missing_file_marks_failed(self):
+        """임시 파일이 없으면 failed 상태로 표시"""
+        idol_group = Group.objects.create(
+            name="Task Group", agency=Agency.objects.create(name="Task Agency")
+        )
+        missing_path = os.path.join(self.spool_dir, "missing.png")
+
+        upload_image_task("Idols.Group", idol_group.id, "groups", missing_path, "g.png")
+
+        idol_group.refresh_from_db()
+        self.assertEqual(idol_group.image_status, "failed")
+
+
+class S3ClientPoolTests(SimpleTestCase):
+    def setUp(self):
+        s3_utils._reset_s3_client()
+        self.addCleanup(s3_utils._reset_s3_client)
+
+    def test_client_reused_within_process(self):
+        """같은 프로세스에서는 S3 클라이언트를 재사용"""
+        self.assertIs(s3_utils.get_s3_client(), s3_utils.get_s3_client())
+
+    def test_client_recreated_in_forked_process(self):
+        """fork 된 프로세스(pid 변경)에서는 새 클라이언트 생성"""
+        client = s3_utils.get_s3_client()
+        with patch("Idols.s3_utils.os.getpid", return_value=os.getpid() + 1):
+            self.assertIsNot(s3_utils.get_s3_client(), client)
+
+    @override_settings(AWS_S3_MULTIPART_THRESHOLD=1024, AWS_S3_MAX_CONCURRENCY=2)
+    def test_transfer_config_from_settings(self):
+        """멀티파트 전송 설정은 settings 값을 사용"""
+        config = s3_utils.get_transfer_config()
+        self.assertEqual(config.multipart_threshold, 1024)
+        self.assertEqual(config.max_request_concurrency, 2)
+
+
+@skipUnless(mock_aws, "moto가 설치되어 있어야 합니다.")
+@override_settings(
+    AWS_ACCESS_KEY_ID="testing",
+    AWS_SECRET_ACCESS_KEY="testing",
+    AWS_STORAGE_BUCKET_NAME="ilog-test",
+    AWS_REGION_NAME="ap-northeast-2",
+    IMAGE_UPLOAD_MAX_SIZE=1024,
+)
+class DirectImageUploadTests(APITestCase):
+    def setUp(self):
+        # moto로 로컬 S3 대용 구성
+        mock = mock_aws()
+        mock.start()
+        self.addCleanup(mock.stop)
+        s3_utils._reset_s3_client()
+        self.addCleanup(s3_utils._reset_s3_client)
+        self.s3 = s3_utils.get_s3_client()
+        self.s3.create_bucket(
+            Bucket="ilog-test",
+            CreateBucketConfiguration={"LocationConstraint": "ap-northeast-2"},
+        )
+
+        User = get_user_model()
+        admin_user = User.objects.create_superuser(
+            username="admin",
+            name="Super User",
+            email="admin@example.com",
+            password="adminpassword",
+        )
+        self.client.force_authenticate(user=admin_user)
+        self.agency = Agency.objects.create(name="Upload Agency")
+        self.group = Group.objects.create(name="Upload Group", agency=self.agency)
+        self.url = lambda action: reverse(
+            f"image_upload_{action}", kwargs={"target": "groups", "pk": self.group.id}
+        )
+
+    def test_presign_scoped_to_object(self):
+        """presigned POST는 대상 객체 경로와 크기/형식 제한을 포함"""
+        response = self.client.post(
+            self.url("presign"), {"content_type": "image/png"}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.data["data"]
+        self.assertTrue(data["key"].startswith(f"images/groups/{self.group.id}/"))
+        self.assertEqual(data["fields"]["key"], data["key"])
+        self.assertEqual(data["fields"]["Content-Type"], "image/png")
+
+    def test_presign_rejects_content_type(self):
+        """허용되지 않는 형식은 400"""
+        response = self.client.post(
+            self.url("presign"), {"content_type": "text/html"}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def confirm(self, name, body):
+        key = f"images/groups/{self.group.id}/{name}"
+        self.s3.put_object(
+            Bucket="ilog-test", Key=key, Body=body, ContentType="image/png"
+        )
+        with patch("Idols.views.generate_image_variants_task.delay"):
+            with self.captureOnCommitCallbacks(execute=True):
+                response = self.client.post(
+                    self.url("confirm"), {"key": key}, format="json"
+                )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIsNone(s3_utils.head_image_object(key))
+        self.group.refresh_from_db()
+        return self.group.image
+
+    def test_confirm_sets_image(self):
+        """업로드된 객체를 내용 주소 blob으로 옮겨 image 반영"""
+        image = self.confirm("photo.png", b"png")
+        blob_key = s3_utils.get_blob_key(
+            hashlib.sha256(b"png").hexdigest(), "photo.png"
+        )
+        self.assertTrue(image.endswith(blob_key))
+        self.assertEqual(self.group.image_status, "ready")
+        self.assertEqual(s3_utils.read_image_object(blob_key), b"png")
+        self.assertEqual(ImageBlob.objects.get(key=blob_key).ref_count, 1)
+
+    def test_confirm_replaces_blob_reference(self):
+        """같은 내용은 blob을 재사용하고, 교체된 이미지는 참조 해제"""
+        first = self.confirm("first.png", b"first")
+        self.assertEqual(self.confirm("again.png", b"first"), first)
+        self.assertEqual(ImageBlob.objects.get().ref_count, 1)
+
+        self.confirm("second.png", b"second")
+        counts = dict(ImageBlob.objects.values_list("size", "ref_count"))
+        self.assertEqual(counts, {5: 0, 6: 1})
+
+    def test_confirm_rejects_invalid_objects(self):
+        """다른 경로, 없는 객체, 제한 초과 객체는 거부"""
+        other_key = f"images/idols/{self.group.id}/photo.png"
+        response = self.client.post(
+            self.url("confirm"), {"key": other_key}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        missing_key = f"images/groups/{self.group.id}/missing.png"
+        response = self.client.post(
+            self.url("confirm"), {"key": missing_key}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        large_key = f"images/groups/{self.group.id}/large.png"
+        self.s3.put_object(
+            Bucket="ilog-test", Key=large_key, Body=b"0" * 2048, ContentType="image/png"
+        )
+        response = self.client.post(
+            self.url("confirm"), {"key": large_key}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.group.refresh_from_db()
+        self.assertIsNone(self.group.image)
+
+
+@skipUnless(mock_aws, "moto가 설치되어 있어야 합니다.")
+@override_settings(
+    AWS_ACCESS_KEY_ID="testing",
+    AWS_SECRET_ACCESS_KEY="testing",
+    AWS_STORAGE_BUCKET_NAME="ilog-test",
+    AWS_REGION_NAME="ap-northeast-2",
+    IMAGE_VARIANT_PROCESSES=0,
+    CELERY_TASK_ALWAYS_EAGER=True,  # delay().get() 을 브로커 없이 바로 실행
+)
+class ImageVariantTests(APITestCase):
+    def setUp(self):
+        mock = mock_aws()
+        mock.start()
+        self.addCleanup(mock.stop)
+        s3_utils._reset_s3_client()
+        self.addCleanup(s3_utils._reset_s3_client)
+        self.s3 = s3_utils.get_s3_client()
+        self.s3.create_bucket(
+            Bucket="ilog-test",
+            CreateBucketConfiguration={"LocationConstraint": "ap-northeast-2"},
+        )
+        self.agency = Agency.objects.create(name="Variant Agency")
+        self.group = Group.objects.create(name="Variant Group", agency=self.agency)
+
+    def make_source(self, size=(400, 300)):
+        image = Image.new("RGB", size, "#6A5096")
+        exif = Image.Exif()
+        exif[0x0112] = 1  # Orientation
+        exif[0x010F] = "ilog camera"  # Make
+        buffer = io.BytesIO()
+        image.save(buffer, format="JPEG", exif=exif)
+        return buffer.getvalue()
+
+    def test_render_variants_strips_exif(self):
+        """크기별 WebP/JPEG을 만들고 EXIF는 제거, 원본보다 크게 늘리지 않음"""
+        variants = render_variants(self.make_source())
+        self.assertEqual(
+            {(size, ext) for size, ext, _ in variants},
+            {(size, ext) for size in (64, 256, 1024) for ext in ("webp", "jpg")},
+        )
+        for size, ext, body in variants:
+            with Image.open(io.BytesIO(body)) as variant:
+                self.assertLessEqual(max(variant.size), min(size, 400))
+                self.assertEqual(len(variant.getexif()), 0)
+                if size == 1024:
+                    self.assertEqual(variant.size, (400, 300))
+
+    def test_task_uploads_variants(self):
+        """작업이 파생 이미지를 저장하고 variants 맵을 기록"""
+        key = f"images/groups/{self.group.id}/photo.jpg"
+        self.s3.put_object(Bucket="ilog-test", Key=key, Body=self.make_source())
+        Group.objects.filter(pk=self.group.id).update(image=s3_utils.get_image_url(key))
+
+        self.assertTrue(
+            generate_image_variants_task.delay("Idols.Group", self.group.id, key).get()
+        )
+        self.group.refresh_from_db()
+        variants = self.group.image_variants
+        self.assertEqual(variants["sizes"], [64, 256, 1024])
+        self.assertTrue(
+            variants["base"].endswith(f"groups/{self.group.id}/variants/photo")
+        )
+
+        stored = self.s3.head_object(
+            Bucket="ilog-test",
+            Key=f"images/groups/{self.group.id}/variants/photo_256.webp",
+        )
+        self.assertEqual(stored["ContentType"], "image/webp")
+        self.assertIn("immutable", stored["CacheControl"])
+
+    def test_task_skips_replaced_image(self):
+        """처리 중 이미지가 교체되었으면 variants를 덮어쓰지 않음"""
+        key = f"images/groups/{self.group.id}/old.jpg"
+        self.s3.put_object(Bucket="ilog-test", Key=key, Body=self.make_source())
+        Group.objects.filter(pk=self.group.id).update(
+            image="https://example.com/new.png"
+        )
+
+        self.assertFalse(
+            generate_image_variants_task.delay("Idols.Group", self.group.id, key).get()
+        )
+        self.group.refresh_from_db()
+        self.assertEqual(self.group.image_variants, {})
+
+    def test_thumbnail_url(self):
+        """thumbnail은 요청 크기에 맞는 파생 이미지, 없으면 원본 URL"""
+        Group.objects.filter(pk=self.group.id).update(image="https://example.com/a.png")
+        bump_catalog_version()
+        response = self.client.get(reverse("group_detail", args=[self.group.id]))
+        self.assertEqual(
+            response.data["data"]["thumbnail"], "https://example.com/a.png"
+        )
+
+        image_variants = {
+            "base": "https://example.com/variants/a",
+            "sizes": [64, 256, 1024],
+            "formats": ["webp", "jpg"],
+        }
+        Group.objects.filter(pk=self.group.id).update(image_variants=image_variants)
+        bump_catalog_version()
+        response = self.client.get(reverse("group_detail", args=[self.group.id]))
+        self.assertEqual(
+            response.data["data"]["thumbnail"],
+            "https://example.com/variants/a_256.webp",
+        )
+        self.assertEqual(
+            get_variant_url(image_variants, 100, "jpg"),
+            "https://example.com/variants/a_256.jpg",
+        )
+        self.assertEqual(
+            get_variant_url(image_variants, 2000),
+            "https://example.com/variants/a_1024.webp",
+        )
+
+
+@skipUnless(mock_aws, "moto가 설치되어 있어야 합니다.")
+@override_settings(
+    AWS_ACCESS_KEY_ID="testing",
+    AWS_SECRET_ACCESS_KEY="testing",
+    AWS_STORAGE_BUCKET_NAME="ilog-test",
+    AWS_REGION_NAME="ap-northeast-2",
+    IMAGE_BLOB_GC_GRACE=0,
+)
+@patch("Idols.tasks.generate_image_variants_task.delay")
+class ContentAddressedImageTests(APITestCase):
+    def setUp(self):
+        mock = mock_aws()
+        mock.start()
+        self.addCleanup(mock.stop)
+        s3_utils._reset_s3_client()
+        self.addCleanup(s3_utils._reset_s3_client)
+        self.s3 = s3_utils.get_s3_client()
+        self.s3.create_bucket(
+            Bucket="ilog-test",
+            CreateBucketConfiguration={"LocationConstraint": "ap-northeast-2"},
+        )
+        self.spool_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.spool_dir, ignore_errors=True)
+        self.group = Group.objects.create(
+            name="Blob Group", agency=Agency.objects.create(name="Blob Agency")
+        )
+
+    def upload(self, idol, body, file_name="photo.png"):
+        spool_path = os.path.join(self.spool_dir, f"{idol.id}.png")
+        with open(spool_path, "wb") as spooled:
+            spooled.write(body)
+        upload_image_task("Idols.Idol", idol.id, "idols", spool_path, file_name)
+        idol.refresh_from_db()
+        return idol
+
+    def blob_keys(self):
+        listed = self.s3.list_objects_v2(Bucket="ilog-test", Prefix="images/blobs/")
+        return [item["Key"] for item in listed.get("Contents", [])]
+
+    def test_same_content_shares_blob(self, mock_variants):
+        """같은 내용은 한 번만 저장하고 참조 수로 공유"""
+        first = self.upload(Idol.objects.create(name="A", group=self.group), b"same")
+        # 두 번째 업로드는 HEAD 확인 후 전송하지 않음
+        with patch.object(
+            s3_utils, "get_transfer_config", wraps=s3_utils.get_transfer_config
+        ) as mock_transfer:
+            second = self.upload(
+                Idol.objects.create(name="B", group=self.group), b"same", "other.PNG"
+            )
+        mock_transfer.assert_not_called()
+
+        self.assertEqual(first.image, second.image)
+        self.assertEqual(len(self.blob_keys()), 1)
+        blob = ImageBlob.objects.get()
+        self.assertEqual((blob.ref_count, blob.size), (2, 4))
+
+    def test_replace_and_delete_release_blob(self, mock_variants):
+        """이미지 교체/객체 삭제 시 참조 해제 후 GC로 일괄 삭제"""
+        idol = self.upload(Idol.objects.create(name="A", group=self.group), b"old")
+        self.upload(idol, b"newer")
+        counts = dict(ImageBlob.objects.values_list("size", "ref_count"))
+        self.assertEqual(counts, {3: 0, 5: 1})
+
+        self.assertEqual(collect_image_blobs_task(), 1)
+        self.assertEqual(self.blob_keys(), [ImageBlob.objects.get().key])
+
+        idol.delete()
+        self.assertEqual(collect_image_blobs_task(), 1)
+        self.assertEqual(self.blob_keys(), [])
+        self.assertFalse(ImageBlob.objects.exists())
+
+
+# 검색 인덱스는 요청 안에서 바로 다시 생성 (백그라운드 스레드는 테스트 트랜잭션을 볼 수 없음)
+@override_settings(CATALOG_SEARCH_BACKGROUND_REBUILD=False)
+class CatalogSearchTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.agency = Agency.objects.create(name="ADOR")
+        self.newjeans = Group.objects.create(name="뉴진스", agency=self.agency)
+        self.velvet = Group.objects.create(name="Red Velvet", agency=self.agency)
+        self.minji = Idol.objects.create(name="민지", group=self.newjeans)
+        self.url = reverse("catalog_search")
+
+    def search(self, query, **params):
+        response = self.client.get(self.url, {"q": query, **params})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [(item["type"], item["name"]) for item in response.data["data"]]
+
+    def test_normalize_name(self):
+        """자모 분해, 대소문자/공백 무시, 겹받침 분해"""
+        self.assertEqual(normalize_name("뉴진"), "ㄴㅠㅈㅣㄴ")
+        self.assertEqual(normalize_name("New Jeans!"), "newjeans")
+        self.assertTrue(normalize_name("닭").startswith(normalize_name("달")))
+        self.assertTrue(normalize_name("과").startswith(normalize_name("고")))
+
+    def test_partial_syllable_and_word_prefix(self):
+        """입력 중인 음절, 단어 시작, 대소문자 구분 없이 검색"""
+        self.assertEqual(self.search("뉴지"), [("group", "뉴진스")])
+        self.assertEqual(self.search("뉴ㅈ"), [("group", "뉴진스")])
+        self.assertEqual(self.search("velv"), [("group", "Red Velvet")])
+        self.assertEqual(self.search("ad"), [("agency", "ADOR")])
+        self.assertEqual(self.search("민"), [("idol", "민지")])
+        self.assertEqual(self.search(""), [])
+
+    def test_type_filter_and_ranking(self):
+        """정확히 일치하는 이름이 먼저, type으로 대상 제한"""
+        Idol.objects.create(name="뉴진", group=self.newjeans)
+        self.assertEqual(self.search("뉴진"), [("idol", "뉴진"), ("group", "뉴진스")])
+        self.assertEqual(self.search("뉴진", type="group"), [("group", "뉴진스")])
+        self.assertEqual(len(self.search("뉴진", limit=1)), 1)
+
+    def test_index_follows_signals_without_queries(self):
+        """커밋된 변경은 DB 재조회 없이 인덱스에 반영"""
+        catalog_index.rebuild()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.newjeans.name = "NewJeans"
+            self.newjeans.save()
+            self.minji.delete()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.search("newj"), [("group", "NewJeans")])
+            self.assertEqual(self.search("뉴진"), [])
+            self.assertEqual(self.search("민지"), [])
+
+    def test_rebuilds_after_external_change(self):
+        """다른 프로세스의 변경(카탈로그 버전 변경) 후에는 다시 생성"""
+        index = CatalogSearchIndex()
+        index.rebuild()
+        Group.objects.filter(pk=self.velvet.pk).update(name="aespa")
+        self.assertEqual(index.search("aes"), [])
+
+        bump_catalog_version()
+        results = index.search("aes")
+        self.assertEqual([item["name"] for item in results], ["aespa"])
+
+    @override_settings(CATALOG_SEARCH_BACKGROUND_REBUILD=True)
+    def test_stale_index_rebuilds_in_background(self):
+        """오래된 인덱스는 검색 요청에서 다시 만들지 않고 기존 인덱스로 응답"""
+        index = CatalogSearchIndex()
+        index.rebuild()
+        Group.objects.filter(pk=self.velvet.pk).update(name="aespa")
+        bump_catalog_version()
+
+        with patch("Idols.search.threading.Thread") as thread:
+            with self.assertNumQueries(0):
+                results = index.search("velv")
+                self.assertEqual(index.search("aes"), [])
+        self.assertEqual([item["name"] for item in results], ["Red Velvet"])
+        # 다시 만드는 중에는 스레드를 추가로 시작하지 않음
+        thread.assert_called_once()
+        thread.return_value.start.assert_called_once()
+
+        # 스레드가 실행할 재생성 (테스트 트랜잭션 안에서 직접 실행)
+        index._finish_rebuild()
+        results = index.search("aes")
+        self.assertEqual([item["name"] for item in results], ["aespa"])
+
+
+class FuzzySearchTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        agency = Agency.objects.create(name="SM Entertainment")
+        Group.objects.create(name="Red Velvet", agency=agency)
+        Group.objects.create(name="Girls Generation", agency=agency)
+        Idol.objects.create(name="Wendy", group=Group.objects.get(name="Red Velvet"))
+        self.url = reverse("catalog_fuzzy_search")
+
+    def test_trigram_similarity_matches_pg_trgm(self):
+        """pg_trgm similarity()와 같은 값"""
+        self.assertEqual(len(get_trigrams("cat")), 4)  # "  c", " ca", "cat", "at "
+        score = trigram_similarity(get_trigrams("word"), get_trigrams("two words"))
+        self.assertAlmostEqual(score, 4 / 11)
+
+    def test_typo_tolerant_ranking(self):
+        """오타가 있어도 유사도 순으로 반환"""
+        response = self.client.get(self.url, {"q": "  red  velvett "})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = response.data["data"]
+        self.assertEqual(results[0]["name"], "Red Velvet")
+        self.assertEqual(results[0]["type"], "group")
+        self.assertGreater(results[0]["score"], 0.5)
+        scores = [item["score"] for item in results]
+        self.assertEqual(scores, sorted(scores, reverse=True))
+
+        response = self.client.get(self.url, {"q": "wendi", "type": "group"})
+        self.assertEqual(response.data["data"], [])
+
+    def test_cached_per_normalized_query(self):
+        """정규화한 검색어가 같으면 DB를 다시 조회하지 않음"""
+        self.client.get(self.url, {"q": "Red Velvet"})
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url, {"q": "  RED   velvet"})
+        self.assertEqual(response.data["data"][0]["name"], "Red Velvet")
+
+        Group.objects.create(name="Red Velvets", agency=Agency.objects.get())
+        response = self.client.get(self.url, {"q": "red velvet"})
+        self.assertEqual(len(response.data["data"]), 2)
+
+
+class UniqueNameConstraintTests(APITestCase):
+    def setUp(self):
+        User = get_user_model()
+        admin_user = User.objects.create_superuser(
+            username="admin",
+            name="Super User",
+            email="admin@example.com",
+            password="adminpassword",
+        )
+        self.client.force_authenticate(user=admin_user)
+        self.agency = Agency.objects.create(name="HYBE")
+        self.group = Group.objects.create(name="LE SSERAFIM", agency=self.agency)
+        Group.objects.create(name="NewJeans", agency=self.agency)
+        Idol.objects.create(name="Chaewon", group=self.group)
+
+    def post(self, url_name, data):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(reverse(url_name), data, format="multipart")
+        # 대소문자 무시 중복 검사(LIKE/UPPER) 사전 조회 없이 제약으로 검출
+        for query in queries.captured_queries:
+            self.assertNotIn("LIKE", query["sql"])
+        return response
+
+    def test_agency_name_case_insensitive(self):
+        """대소문자만 다른 소속사 이름은 기존 메시지로 거부"""
+        response = self.post("agency_list", {"name": "hybe"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.data["name"], ["같은 이름의 소속사가 이미 존재합니다."]
+        )
+        self.assertEqual(Agency.objects.count(), 1)
+
+    def test_group_name_same_case(self):
+        """대소문자까지 같은 이름도 같은 메시지로 거부 (필드 unique 인덱스 없이 제약 하나로 검사)"""
+        self.assertFalse(Group._meta.get_field("name").unique)
+        response = self.client.post(
+            reverse("group_list"),
+            {"name": "NewJeans", "agency": self.agency.id},
+            format="multipart",
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["name"], ["같은 이름의 그룹이 이미 존재합니다."])
+        self.assertEqual(Group.objects.filter(name="NewJeans").count(), 1)
+
+    def test_group_rename_conflict(self):
+        """다른 그룹 이름으로 변경 시 거부, 자기 이름 유지는 허용"""
+        url = reverse("group_detail", args=[self.group.id])
+        response = self.client.put(
+            url, {"name": "newjeans", "agency": self.agency.id}, format="multipart"
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["name"], ["같은 이름의 그룹이 이미 존재합니다."])
+
+        response = self.client.put(
+            url, {"name": "LE SSERAFIM", "agency": self.agency.id}, format="multipart"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_idol_name_unique_per_group(self):
+        """같은 그룹 안에서만 아이돌 이름 중복 거부"""
+        response = self.post("idol_list", {"name": "Chaewon", "group": self.group.id})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.data["non_field_errors"],
+            ["같은 그룹에 동일한 이름의 아이돌이 이미 존재합니다."],
+        )
+
+        other = Group.objects.get(name="NewJeans")
+        response = self.post("idol_list", {"name": "Chaewon", "group": other.id})
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+
+class GroupSlugTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.agency = Agency.objects.create(name="SM")
+        self.group = Group.objects.create(name="Red Velvet", agency=self.agency)
+        Idol.objects.create(name="Irene", group=self.group)
+
+    def test_slug_assigned_from_name(self):
+        """이름으로 slug 생성, 한글 유지, 겹치면 번호 추가, 이름 변경 시 갱신"""
+        self.assertEqual(self.group.slug, "red-velvet")
+        self.assertEqual(
+            Group.objects.create(name="소녀시대", agency=self.agency).slug, "소녀시대"
+        )
+        self.assertEqual(
+            Group.objects.create(name="Red.Velvet", agency=self.agency).slug,
+            "redvelvet",
+        )
+        self.assertEqual(
+            Group.objects.create(name="Red-Velvet!", agency=self.agency).slug,
+            "red-velvet-2",
+        )
+        self.group.name = "Red Velvet Irene"
+        self.group.save(update_fields=["name"])
+        self.group.refresh_from_db()
+        self.assertEqual(self.group.slug, "red-velvet-irene")
+
+    def test_lookup_by_slug_or_name(self):
+        """slug 또는 이름으로 조회하면 상세 조회와 같은 응답"""
+        detail = self.client.get(reverse("group_detail", args=[self.group.id]))
+        for value in ("red-velvet", "Red Velvet"):
+            response = self.client.get(reverse("group_by_name", kwargs={"slug": value}))
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(response.content, detail.content)
+            self.assertEqual(response["ETag"], detail["ETag"])
+
+        response = self.client.get(reverse("group_by_name", kwargs={"slug": "exo"}))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_name_lookup_requires_exact_name(self):
+        """이름 조회는 slug 변환 없이 이름이 정확히 같은 그룹만 (대소문자 무시)"""
+        dotted = Group.objects.create(name="A.B", agency=self.agency)
+        plain = Group.objects.create(name="AB", agency=self.agency)
+        self.assertEqual((dotted.slug, plain.slug), ("ab", "ab-2"))
+
+        for value, group in (("AB", plain), ("a.b", dotted), ("ab", dotted)):
+            response = self.client.get(reverse("group_by_name", kwargs={"slug": value}))
+            self.assertEqual(response.data["data"]["id"], group.id)
+
+        response = self.client.get(
+            reverse("group_by_name", kwargs={"slug": "RED_VELVET"})
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_numeric_name_does_not_shadow_id(self):
+        """숫자 이름 그룹은 by-name 경로로, 숫자 경로는 항상 id로 조회"""
+        numeric = Group.objects.create(
+            name=str(self.group.id + 100), agency=self.agency
+        )
+        response = self.client.get(
+            reverse("group_by_name", kwargs={"slug": numeric.name})
+        )
+        self.assertEqual(response.data["data"]["id"], numeric.id)
+        response = self.client.get(reverse("group_detail", args=[self.group.id]))
+        self.assertEqual(response.data["data"]["id"], self.group.id)
+
+    def test_cached_lookup_queries(self):
+        """slug 맵과 상세 스냅샷, 검증 값이 캐시되면 쿼리 없이 응답"""
+        url = reverse("group_by_name", kwargs={"slug": "red-velvet"})
+        self.client.get(url)
+        with self.assertNumQueries(0):
+            response = self.client.get(url)
+        self.assertEqual(response.data["data"]["name"], "Red Velvet")
+
+        # 이름 변경 후에는 새 slug로만 조회
+        self.group.name = "Velvet"
+        self.group.save()
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        response = self.client.get(reverse("group_by_name", kwargs={"slug": "velvet"}))
+        self.assertEqual(response.data["data"]["name"], "Velvet")
+
+
+class GroupUpcomingScheduleTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = get_user_model().objects.create_user(
+            username="fan", name="Fan", email="fan@example.com", password="password"
+        )
+        self.agency = Agency.objects.create(name="ADOR")
+        self.group = Group.objects.create(name="NewJeans", agency=self.agency)
+        self.minji = Idol.objects.create(name="Minji", group=self.group)
+        self.hanni = Idol.objects.create(name="Hanni", group=self.group)
+        now = timezone.now()
+        self.add_schedule(self.group, "지난 공연", now - timedelta(days=1))
+        self.third = self.add_schedule(self.group, "팬미팅", now + timedelta(days=3))
+        self.first = self.add_schedule(
+            self.group, "음악방송", now + timedelta(days=1), [self.minji, self.hanni]
+        )
+        self.second = self.add_schedule(
+            self.group, "라디오", now + timedelta(days=2), [self.hanni]
+        )
+
+    def add_schedule(self, group, title, start_time, members=()):
+        schedule = Schedule.objects.create(
+            user=self.user,
+            group=group,
+            title=title,
+            location="서울",
+            start_time=start_time,
+        )
+        schedule.participating_members.set(members)
+        return schedule
+
+    def test_detail_embeds_next_schedules(self):
+        """?upcoming=N 이면 지난 일정을 제외한 다음 N개를 멤버 이름과 함께 포함"""
+        url = reverse("group_detail", args=[self.group.id])
+        response = self.client.get(url, {"upcoming": 2})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        schedules = response.data["data"]["upcoming_schedules"]
+        self.assertEqual(
+            [schedule["id"] for schedule in schedules], [self.first.id, self.second.id]
+        )
+        self.assertEqual(schedules[0]["participating_members"], ["Hanni", "Minji"])
+
+        for params in ({}, {"upcoming": "0"}, {"upcoming": "abc"}):
+            response = self.client.get(url, params)
+            self.assertNotIn("upcoming_schedules", response.data["data"])
+
+    def test_schedule_changes_not_cached(self):
+        """일정은 카탈로그 스냅샷에 캐시되지 않음"""
+        url = reverse("group_detail", args=[self.group.id])
+        self.client.get(url, {"upcoming": 5})
+        self.third.delete()
+        response = self.client.get(url, {"upcoming": 5})
+        self.assertEqual(len(response.data["data"]["upcoming_schedules"]), 2)
+
+    def test_list_uses_single_window_query(self):
+        """목록에서도 그룹 수와 관계없이 ROW_NUMBER 쿼리 한 번으로 일정 조회"""
+        now = timezone.now()
+        for index in range(5):
+            group = Group.objects.create(name=f"Group {index}", agency=self.agency)
+            for day in range(1, 5):
+                self.add_schedule(group, f"일정 {day}", now + timedelta(days=day))
+
+        url = reverse("group_list")
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, {"upcoming": 3})
+        schedule_queries = [
+            query["sql"]
+            for query in queries.captured_queries
+            if 'FROM "schedule"' in query["sql"]
+        ]
+        self.assertEqual(len(schedule_queries), 1)
+        self.assertIn("ROW_NUMBER", schedule_queries[0])
+        self.assertEqual(len(response.data["data"]), 6)
+        for group in response.data["data"]:
+            self.assertEqual(len(group["upcoming_schedules"]), 3)
+
+        # 그룹/일정 수가 늘어도 쿼리 수는 동일
+        for index in range(5, 10):
+            group = Group.objects.create(name=f"Group {index}", agency=self.agency)
+            self.add_schedule(group, "일정", now + timedelta(days=1))
+        with self.assertNumQueries(len(queries.captured_queries)):
+            self.client.get(url, {"upcoming": 3})
+
+
+class GroupCounterTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        User = get_user_model()
+        self.users = [
+            User.objects.create_user(
+                username=f"fan{n}",
+                name=f"Fan {n}",
+                email=f"fan{n}@example.com",
+                password="password",
+            )
+            for n in range(3)
+        ]
+        self.agency = Agency.objects.create(name="JYP")
+        self.twice = Group.objects.create(name="TWICE", agency=self.agency)
+        self.itzy = Group.objects.create(name="ITZY", agency=self.agency)
+        self.stray = Group.objects.create(name="Stray Kids", agency=self.agency)
+
+    def assertCounts(self, group, member_count, subscriber_count):
+        group.refresh_from_db()
+        self.assertEqual(
+            (group.member_count, group.subscriber_count),
+            (member_count, subscriber_count),
+        )
+
+    def test_member_count(self):
+        """아이돌 추가/이동/삭제 시 멤버 수 증감"""
+        nayeon = Idol.objects.create(name="Nayeon", group=self.twice)
+        Idol.objects.create(name="Momo", group=self.twice)
+        self.assertCounts(self.twice, 2, 0)
+
+        nayeon = Idol.objects.get(pk=nayeon.pk)
+        nayeon.group = self.itzy
+        nayeon.save()
+        self.assertCounts(self.twice, 1, 0)
+        self.assertCounts(self.itzy, 1, 0)
+
+        nayeon.delete()
+        self.assertCounts(self.itzy, 0, 0)
+
+    def test_subscriber_count(self):
+        """구독/구독 취소 시 구독자 수 증감 (알림 설정 변경은 제외)"""
+        SubscriptionService.subscribe_to_group(self.users[0], self.twice.id)
+        SubscriptionService.subscribe_to_group(self.users[1], self.twice.id)
+        SubscriptionService.subscribe_to_group(
+            self.users[0], self.twice.id, notification=False
+        )
+        self.assertCounts(self.twice, 0, 2)
+
+        SubscriptionService.unsubscribe_from_group(self.users[0], self.twice.id)
+        SubscriptionService.unsubscribe_from_group(self.users[0], self.twice.id)
+        self.assertCounts(self.twice, 0, 1)
+
+        # 사용자 삭제로 구독이 함께 삭제되어도 반영
+        self.users[1].delete()
+        self.assertCounts(self.twice, 0, 0)
+
+    def test_subscriber_count_in_cached_responses(self):
+        """구독 후 캐시된 그룹 목록/상세와 이전 ETag 로도 새 구독자 수를 반환"""
+        detail_url = reverse("group_detail", args=[self.twice.pk])
+        list_url = reverse("group_list")
+        etag = self.client.get(detail_url)["ETag"]
+        self.client.get(list_url)
+        version = get_catalog_version()
+
+        SubscriptionService.subscribe_to_group(self.users[0], self.twice.id)
+        # 구독은 카탈로그 버전(검색 인덱스, slug 맵, 다른 스냅샷)을 올리지 않음
+        self.assertEqual(get_catalog_version(), version)
+
+        response = self.client.get(detail_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(json.loads(response.content)["data"]["subscriber_count"], 1)
+        groups = {
+            group["name"]: group
+            for group in json.loads(self.client.get(list_url).content)["data"]
+        }
+        self.assertEqual(groups["TWICE"]["subscriber_count"], 1)
+
+        SubscriptionService.unsubscribe_from_group(self.users[0], self.twice.id)
+        response = self.client.get(detail_url)
+        self.assertEqual(json.loads(response.content)["data"]["subscriber_count"], 0)
+
+    def test_reconcile_drift(self):
+        """어긋난 집계만 실제 행 수로 복구"""
+        Idol.objects.create(name="Yeji", group=self.itzy)
+        SubscriptionService.subscribe_to_group(self.users[0], self.itzy.id)
+        Group.objects.filter(pk=self.itzy.pk).update(member_count=7)
+        Group.objects.filter(pk=self.twice.pk).update(subscriber_count=3)
+
+        self.assertEqual(reconcile_group_counters_task(batch_size=1), 2)
+        self.assertCounts(self.itzy, 1, 1)
+        self.assertCounts(self.twice, 0, 0)
+        self.assertEqual(reconcile_group_counters_task(), 0)
+
+    def test_import_updates_member_count(self):
+        """일괄 등록은 시그널 없이도 멤버 수 반영"""
+        Idol.objects.create(name="Nayeon", group=self.twice)
+        catalog = CatalogImport.from_json(
+            {
+                "agencies": [
+                    {
+                        "name": "JYP",
+                        "groups": [
+                            {"name": "TWICE", "idols": [{"name": "Jihyo"}]},
+                            {"name": "NMIXX", "idols": [{"name": "Haewon"}]},
+                        ],
+                    }
+                ]
+            }
+        )
+        self.assertTrue(catalog.validate())
+        catalog.save()
+        self.assertCounts(self.twice, 2, 0)
+        self.assertCounts(Group.objects.get(name="NMIXX"), 1, 0)
+
+    def test_order_by_subscriber_count(self):
+        """?ordering=-subscriber_count 는 구독 테이블 집계 없이 컬럼으로 정렬/페이지네이션"""
+        for user in self.users:
+            SubscriptionService.subscribe_to_group(user, self.stray.id)
+        for user in self.users[:2]:
+            SubscriptionService.subscribe_to_group(user, self.itzy.id)
+
+        url = reverse("group_list")
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(
+                url, {"ordering": "-subscriber_count", "page_size": 2}
+            )
+        self.assertEqual(
+            [group["name"] for group in response.data["data"]], ["Stray Kids", "ITZY"]
+        )
+        self.assertEqual(response.data["data"][0]["subscriber_count"], 3)
+        for query in queries.captured_queries:
+            self.assertNotIn("usergroupsubscribe", query["sql"].lower())
+
+        response = self.client.get(response.data["next"])
+        self.assertEqual([group["name"] for group in response.data["data"]], ["TWICE"])
+        self.assertIsNone(response.data["next"])
+
+
+# 검색 인덱스는 요청 안에서 바로 다시 생성 (백그라운드 스레드는 테스트 트랜잭션을 볼 수 없음)
+@override_settings(CATALOG_SEARCH_BACKGROUND_REBUILD=False)
+class SoftDeleteTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        User = get_user_model()
+        admin_user = User.objects.create_superuser(
+            username="admin",
+            name="Super User",
+            email="admin@example.com",
+            password="adminpassword",
+        )
+        self.client.force_authenticate(user=admin_user)
+        self.agency = Agency.objects.create(name="YG")
+        self.other = Agency.objects.create(name="THEBLACKLABEL")
+        self.groups = [
+            Group.objects.create(name=name, agency=self.agency)
+            for name in ("BLACKPINK", "BABYMONSTER")
+        ]
+        self.kept = Group.objects.create(name="MEOVV", agency=self.other)
+        now = timezone.now()
+        for group in (*self.groups, self.kept):
+            idols = [
+                Idol.objects.create(name=f"{group.name[:5]}{n}", group=group)
+                for n in range(3)
+            ]
+            UserGroupSubscribe.objects.create(user=admin_user, group=group)
+            for n in range(3):
+                schedule = Schedule.objects.create(
+                    user=admin_user,
+                    group=group,
+                    title=f"일정 {n}",
+                    location="서울",
+                    start_time=now + timedelta(days=n),
+                )
+                schedule.participating_members.set(idols)
+
+    @override_settings(CELERY_TASK_ALWAYS_EAGER=True)
+    def test_agency_delete_hides_then_purges(self):
+        """소속사 삭제 요청은 하위 데이터까지 즉시 숨기고, 실제 삭제는 커밋 후 작업에서 수행"""
+        response = self.client.get(reverse("catalog_search"), {"q": "B"})
+        self.assertEqual(len(response.data["data"]), 8)
+        with self.captureOnCommitCallbacks() as callbacks:
+            response = self.client.delete(
+                reverse("agency_detail", args=[self.agency.id])
+            )
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+        # 숨김 상태: 조회에서는 모두 사라지고, 행은 남아 있음
+        self.assertFalse(Agency.objects.filter(pk=self.agency.pk).exists())
+        self.assertEqual(list(Group.objects.all()), [self.kept])
+        self.assertEqual(
+            set(Idol.objects.values_list("group_id", flat=True)), {self.kept.id}
+        )
+        self.assertEqual(Schedule.objects.count(), 3)
+        self.assertEqual(UserGroupSubscribe.objects.count(), 1)
+        self.assertEqual(Idol.all_objects.count(), 9)
+        response = self.client.get(reverse("group_detail", args=[self.groups[0].id]))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        response = self.client.get(reverse("catalog_search"), {"q": "B"})
+        self.assertEqual(response.data["data"], [])
+
+        for callback in callbacks:
+            callback()
+        self.assertEqual(Agency.all_objects.count(), 1)
+        self.assertEqual(Group.all_objects.count(), 1)
+        self.assertEqual(Idol.all_objects.count(), 3)
+        self.assertEqual(Schedule.all_objects.count(), 3)
+        self.assertEqual(UserGroupSubscribe.all_objects.count(), 1)
+        self.assertEqual(Schedule.participating_members.through.objects.count(), 9)
+
+    def test_group_delete_keeps_agency(self):
+        self.client.delete(reverse("group_detail", args=[self.groups[0].id]))
+        self.assertEqual(
+            set(Group.objects.values_list("name", flat=True)), {"BABYMONSTER", "MEOVV"}
+        )
+        purge_deleted_catalog_task()
+        self.assertEqual(Agency.objects.count(), 2)
+        self.assertEqual(Idol.all_objects.count(), 6)
+
+    def test_purge_in_batches(self):
+        """배치마다 별도 트랜잭션으로 삭제하고 진행 상황 보고"""
+        hide_catalog_object(self.agency)
+        progress = []
+        deleted = purge_deleted_catalog(
+            batch_size=2,
+            on_progress=lambda counts: progress.append(sum(counts.values())),
+        )
+        self.assertEqual(deleted["Schedules.Schedule"], 6)
+        self.assertEqual(deleted["Idols.Idol"], 6)
+        self.assertEqual(deleted["Idols.Agency"], 1)
+        # 그룹당 참여 멤버 9행 -> 2개씩 5번 등, 한 번에 2행 이하만 삭제
+        self.assertGreater(len(progress), 20)
+        self.assertEqual(progress, sorted(progress))
+
+    def test_purge_skips_per_row_signals(self):
+        """purge 는 행마다 집계/버전/검색 인덱스를 갱신하지 않고 배치마다 한 번 처리"""
+        blob = ImageBlob.objects.create(key="images/blobs/ab/abcd.png", size=4)
+        Idol.objects.filter(group__agency=self.agency).update(
+            image="https://cdn.example.com/images/blobs/ab/abcd.png"
+        )
+        ImageBlob.objects.filter(pk=blob.pk).update(ref_count=7)
+        response = self.client.get(reverse("catalog_search"), {"q": "B"})
+        self.assertEqual(len(response.data["data"]), 8)
+        hide_catalog_object(self.agency)
+        with (
+            patch("Idols.signals.bump_catalog_version") as signal_bump,
+            patch("Preferences.signals.bump_group_counter_version") as subscribe_bump,
+            patch(
+                "Idols.deletion.bump_catalog_version", wraps=bump_catalog_version
+            ) as batch_bump,
+            CaptureQueriesContext(connection) as queries,
+            self.captureOnCommitCallbacks(execute=True) as callbacks,
+        ):
+            purge_deleted_catalog(batch_size=2)
+        signal_bump.assert_not_called()
+        subscribe_bump.assert_not_called()
+        # 그룹당 참여 멤버 9행(5배치) + 일정 3행(2) + 구독 1행(1) + 아이돌 3행(2) + 그룹(1), 소속사(1)
+        self.assertEqual(batch_bump.call_count, 2 * 11 + 1)
+        # 커밋 후 작업은 배치마다의 버전 증가뿐 (행마다 검색 인덱스 제거 없음)
+        self.assertEqual(len(callbacks), batch_bump.call_count)
+        self.assertFalse(
+            [q for q in queries if q["sql"].startswith('UPDATE "Idols_group"')]
+        )
+        # 이미지 blob 참조는 배치마다 한 번에 해제
+        self.assertEqual(ImageBlob.objects.get(pk=blob.pk).ref_count, 1)
+        # 검색 인덱스는 버전이 바뀌었으므로 삭제된 항목 없이 다시 만들어짐
+        response = self.client.get(reverse("catalog_search"), {"q": "B"})
+        self.assertEqual(response.data["data"], [])
+
+    def test_recreate_hidden_names(self):
+        """삭제 대기 중인 이름은 purge 전에도 API 로 다시 등록 가능"""
+        hide_catalog_object(self.agency)
+        response = self.client.post(reverse("agency_list"), {"name": "yg"})
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        response = self.client.post(
+            reverse("group_list"),
+            {"name": "BLACKPINK", "agency": response.data["data"]["id"]},
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertNotEqual(response.data["data"]["slug"], self.groups[0].slug)
+        # 보이는 행끼리는 여전히 중복 불가
+        response = self.client.post(reverse("agency_list"), {"name": "YG"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        purge_deleted_catalog()
+        self.assertEqual(Group.objects.get(name="BLACKPINK").agency.name, "yg")
+
+    def test_import_recreates_hidden_names(self):
+        """일괄 등록도 삭제 대기 중인 행은 없는 것으로 보고 새로 생성"""
+        hide_catalog_object(self.agency)
+        catalog = CatalogImport.from_json(
+            {"agencies": [{"name": "YG", "groups": [{"name": "BLACKPINK"}]}]}
+        )
+        self.assertTrue(catalog.validate())
+        catalog.save()
+        self.assertEqual(
+            Group.objects.get(name="BLACKPINK").agency,
+            Agency.objects.get(name="YG"),
+        )
+        self.assertEqual(Agency.all_objects.filter(name="YG").count(), 2)
+
+
+class CatalogImportTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        User = get_user_model()
+        admin_user = User.objects.create_superuser(
+            username="admin",
+            name="Super User",
+            email="admin@example.com",
+            password="adminpassword",
+        )
+        self.client.force_authenticate(user=admin_user)
+        self.url = reverse("catalog_import")
+
+    def make_payload(self, agency_count, group_count, idol_count, prefix="A"):
+        return {
+            "agencies": [
+                {
+                    "name": f"{prefix}{a}",
+                    "groups": [
+                        {
+                            "name": f"{prefix}{a}-G{g}",
+                            "color": "#FFFFFF",
+                            "idols": [{"name": f"I{i}"} for i in range(idol_count)],
+                        }
+                        for g in range(group_count)
+                    ],
+                }
+                for a in range(agency_count)
+            ]
+        }
+
+    def test_import_constant_queries(self):
+        """행 수와 관계없이 같은 쿼리 수로 일괄 등록"""
+        with CaptureQueriesContext(connection) as small:
+            response = self.client.post(
+                self.url, self.make_payload(1, 1, 1, "S"), format="json"
+            )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        with CaptureQueriesContext(connection) as large:
+            response = self.client.post(
+                self.url, self.make_payload(5, 4, 5, "L"), format="json"
+            )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(
+            response.data["data"]["created"],
+            {"agencies": 5, "groups": 20, "idols": 100},
+        )
+        self.assertEqual(len(large), len(small))
+        self.assertEqual(Idol.objects.filter(group__name="L4-G3").count(), 5)
+
+    def test_import_reuses_existing_and_updates_catalog(self):
+        """기존 소속사/그룹은 재사용하고 목록 캐시도 갱신"""
+        agency = Agency.objects.create(name="HYBE")
+        group = Group.objects.create(name="NewJeans", agency=agency)
+        self.client.get(reverse("group_list"))
+
+        payload = {
+            "agencies": [
+                {
+                    "name": "hybe",
+                    "groups": [
+                        {"name": "NewJeans", "idols": [{"name": "Hanni"}]},
+                        {"name": "ILLIT"},
+                    ],
+                }
+            ]
+        }
+        response = self.client.post(self.url, payload, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["data"]["reused"], {"agencies": 1, "groups": 1})
+        self.assertEqual(Agency.objects.count(), 1)
+        self.assertTrue(group.idol_set.filter(name="Hanni").exists())
+
+        names = [
+            item["name"] for item in self.client.get(reverse("group_list")).data["data"]
+        ]
+        self.assertEqual(names, ["ILLIT", "NewJeans"])
+
+    def test_import_reports_row_errors(self):
+        """오류가 있으면 저장하지 않고 행별로 보고"""
+        other = Agency.objects.create(name="SM")
+        Group.objects.create(name="aespa", agency=other)
+        payload = {
+            "agencies": [
+                {
+                    "name": "New",
+                    "groups": [
+                        {"name": "Aespa"},
+                        {"name": "Bad Color", "color": "red"},
+                        {"name": "Dup", "idols": [{"name": "A"}, {"name": "A"}]},
+                    ],
+                }
+            ]
+        }
+        response = self.client.post(self.url, payload, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        rows = {item["row"]: item["errors"] for item in response.data["rows"]}
+        self.assertEqual(
+            set(rows),
+            {
+                "agencies[0].groups[0]",
+                "agencies[0].groups[1]",
+                "agencies[0].groups[2].idols[1]",
+            },
+        )
+        self.assertIn("color", rows["agencies[0].groups[1]"])
+        self.assertFalse(Agency.objects.filter(name="New").exists())
+
+        response = self.client.post(self.url, {"foo": []}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_import_workbook(self):
+        """엑셀 시트(agencies/groups/idols)로 등록"""
+        from openpyxl import Workbook
+
+        workbook = Workbook()
+        workbook.active.title = "agencies"
+        workbook["agencies"].append(["name", "contact"])
+        workbook["agencies"].append(["ADOR", "010"])
+        groups = workbook.create_sheet("groups")
+        groups.append(["agency", "name", "color", "sns"])
+        groups.append(["ADOR", "NewJeans", "#1E90FF", None])
+        idols = workbook.create_sheet("idols")
+        idols.append(["group", "name"])
+        idols.append(["NewJeans", "Minji"])
+        idols.append([None, None])  # 빈 행은 건너뜀
+        idols.append(["Unknown", "Nobody"])
+        buffer = io.BytesIO()
+        workbook.save(buffer)
+
+        upload = SimpleUploadedFile("catalog.xlsx", buffer.getvalue())
+        response = self.client.post(self.url, {"file": upload}, format="multipart")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.data["rows"],
+            [{"row": "idols:4", "errors": {"group": ["그룹을 찾을 수 없습니다."]}}],
+        )
+
+        idols.delete_rows(4)
+        buffer = io.BytesIO()
+        workbook.save(buffer)
+        upload = SimpleUploadedFile("catalog.xlsx", buffer.getvalue())
+        response = self.client.post(self.url, {"file": upload}, format="multipart")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(Idol.objects.get().group.agency.contact, "010")
+
+    def test_import_requires_admin(self):
+        """관리자만 일괄 등록 가능"""
+        self.client.force_authenticate(user=None)
+        response = self.client.post(self.url, self.make_payload(1, 1, 1), format="json")
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+        user = get_user_model().objects.create_user(
+            username="fan",
+            name="Fan",
+            email="fan@example.com",
+            password="password123",
+        )
+        self.client.force_authenticate(user=user)
+        for method in (self.client.get, self.client.options, self.client.post):
+            response = method(self.url, self.make_payload(1, 1, 1), format="json")
+            self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class CatalogExportTests(APITestCase):
+    def setUp(self):
+        User = get_user_model()
+        self.admin_user = User.objects.create_superuser(
+            username="admin",
+            name="Super User",
+            email="admin@example.com",
+            password="adminpassword",
+        )
+        self.client.force_authenticate(user=self.admin_user)
+        agency = Agency.objects.create(name="SM", contact="02-000-0000")
+        group = Group.objects.create(name="Red Velvet", agency=agency, color="#FF0000")
+        Idol.objects.create(name="Irene", group=group)
+        Idol.objects.create(name="Seulgi", group=group)
+
+    def export(self, export_format, **params):
+        response = self.client.get(
+            reverse("catalog_export", args=[export_format]), params
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        return b"".join(response.streaming_content).decode()
+
+    def test_ndjson(self):
+        """소속사, 그룹, 아이돌 순서로 한 줄에 하나씩"""
+        lines = [json.loads(line) for line in self.export("ndjson").splitlines()]
+        self.assertEqual(
+            [line["type"] for line in lines], ["agency", "group", "idol", "idol"]
+        )
+        self.assertEqual(lines[1]["slug"], "red-velvet")
+        self.assertEqual(lines[2]["group_id"], lines[1]["id"])
+
+        lines = self.export("ndjson", type="idol").splitlines()
+        self.assertEqual(len(lines), 2)
+
+    def test_csv(self):
+        rows = list(csv.reader(io.StringIO(self.export("csv"))))
+        self.assertEqual(rows[0], list(CSV_COLUMNS))
+        self.assertEqual(len(rows), 5)
+        group = dict(zip(rows[0], rows[2]))
+        self.assertEqual(group["type"], "group")
+        self.assertEqual(group["color"], "#FF0000")
+        self.assertEqual(group["group_id"], "")
+
+    def test_streams_lazily_in_chunks(self):
+        """응답 생성 시점에는 쿼리를 실행하지 않고, 본문을 읽으면서 청크 단위로 조회"""
+        with self.assertNumQueries(0):
+            response = self.client.get(reverse("catalog_export", args=["csv"]))
+        chunks = iter(response.streaming_content)
+        with self.assertNumQueries(0):
+            self.assertTrue(next(chunks).startswith(b"type,id,name"))
+        with patch("Idols.exporter.EXPORT_BUFFER_ROWS", 1):
+            with self.assertNumQueries(1):
+                next(chunks)
+            self.assertEqual(len(list(chunks)), 3)
+
+    def test_requires_admin(self):
+        user = get_user_model().objects.create_user(
+            username="fan", name="Fan", email="fan@example.com", password="password"
+        )
+        self.client.force_authenticate(user=user)
+        response = self.client.get(reverse("catalog_export", args=["csv"]))
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+        self.client.force_authenticate(user=self.admin_user)
+        response = self.client.get(reverse("catalog_export", args=["xml"]))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class AdminChangelistQueryTests(QueryBudgetMixin, APITestCase):
+    def setUp(self):
+        User = get_user_model()
+        admin_user = User.objects.create_superuser(
+            username="admin",
+            name="Super User",
+            email="admin@example.com",
+            password="adminpassword",
+        )
+        self.client.force_login(admin_user)
+        self.agencies = [Agency.objects.create(name=f"Agency {n}") for n in range(3)]
+
+    def populate_groups(self, count):
+        start = Group.objects.count()
+        Group.objects.bulk_create(
+            Group(
+                name=f"Group {start + n}",
+                slug=f"group-{start + n}",
+                agency=self.agencies[n % 3],
+            )
+            for n in range(count)
+        )
+
+    def populate_idols(self, count):
+        if not Group.objects.exists():
+            self.populate_groups(10)
+        groups = list(Group.objects.all())
+        start = Idol.objects.count()
+        Idol.objects.bulk_create(
+            Idol(name=f"Idol {start + n}", group=groups[n % len(groups)])
+            for n in range(count)
+        )
+
+    def test_group_changelist_budget(self):
+        """그룹 목록은 행 수와 관계없이 일정한 쿼리 수 (1,000행 포함)"""
+        self.assertEndpointBudget(
+            reverse("admin:Idols_group_changelist"), 5, self.populate_groups
+        )
+
+    def test_idol_changelist_budget(self):
+        """아이돌 목록은 그룹/소속사를 조인하여 일정한 쿼리 수 (1,000행 포함)"""
+        self.assertEndpointBudget(
+            reverse("admin:Idols_idol_changelist"), 4, self.populate_idols
+        )
+
+    def test_soft_delete_filter_allows_estimated_count(self):
+        """기본 매니저의 숨김 조건만 있는 목록은 추정 COUNT 대상, 검색/필터가 있으면 제외"""
+        for model in (Agency, Group, Idol, Schedule, UserGroupSubscribe):
+            paginator = EstimatedCountPaginator(
+                model.objects.select_related().order_by("-pk"), 100
+            )
+            self.assertTrue(paginator.is_unfiltered(paginator.object_list), model)
+        paginator = EstimatedCountPaginator(Idol.objects.filter(name="Karina"), 100)
+        self.assertFalse(paginator.is_unfiltered(paginator.object_list))
+        paginator = EstimatedCountPaginator(Idol.all_objects.all(), 100)
+        self.assertTrue(paginator.is_unfiltered(paginator.object_list))
+
+    def test_group_autocomplete_budget(self):
+        """자동완성 결과의 그룹 표시도 소속사를 함께 조회"""
+        self.populate_groups(30)
+        url = reverse("admin:autocomplete") + (
+            "?app_label=Idols&model_name=idol&field_name=group&term=Group"
+        )
+        with query_budget(4):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.json()["results"]), 20)
@@ -3,11 +3,17 @@ from django.urls import path
 from .views import (
     AgencyDetailView,
     AgencyListView,
+    CatalogExportView,
+    CatalogFuzzySearchView,
+    CatalogImportView,
+    CatalogSearchView,
     GroupByNameView,
     GroupDetailView,
     GroupListView,
     IdolDetailView,
     IdolListView,
+    ImageUploadConfirmView,
+    ImageUploadPresignView,
 )
 
 urlpatterns = [
@@ -19,11 +25,41 @@ urlpatterns = [
     path(
         "groups/<int:pk>/", GroupDetailView.as_view(), name="group_detail"
     ),  # 그룹 디테일
-    path("groups/<str:name>/", GroupByNameView.as_view(), name="group_by_name"),
-    # 그룹 이름으로 검색
+    # 그룹 slug/이름으로 조회 (숫자 id 경로와 겹치지 않도록 분리)
+    path(
+        "groups/by-name/<str:slug>/",
+        GroupByNameView.as_view(),
+        name="group_by_name",
+    ),
     # 아이돌 리스트
     path("idols/", IdolListView.as_view(), name="idol_list"),
     path(
         "idols/<int:pk>/", IdolDetailView.as_view(), name="idol_detail"
     ),  # 디테일 확인
+    # 이름 자동완성 검색
+    path("search/", CatalogSearchView.as_view(), name="catalog_search"),
+    path(
+        "search/fuzzy/",
+        CatalogFuzzySearchView.as_view(),
+        name="catalog_fuzzy_search",
+    ),
+    # 일괄 등록 (JSON/엑셀)
+    path("import/", CatalogImportView.as_view(), name="catalog_import"),
+    # 전체 내보내기 (ndjson/csv 스트리밍)
+    path(
+        "export/<str:export_format>/",
+        CatalogExportView.as_view(),
+        name="catalog_export",
+    ),
+    # 이미지 직접 업로드 (presigned)
+    path(
+        "uploads/<str:target>/<int:pk>/presign/",
+        ImageUploadPresignView.as_view(),
+        name="image_upload_presign",
+    ),
+    path(
+        "uploads/<str:target>/<int:pk>/confirm/",
+        ImageUploadConfirmView.as_view(),
+        name="image_upload_confirm",
+    ),
 ]
@@ -1,39 +1,107 @@
-from django.db.models import Count
+import hashlib
+import json
+import uuid
+
+from django.conf import settings
+from django.db import transaction
+from django.http import Http404, StreamingHttpResponse
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import status
 from rest_framework.generics import (
     GenericAPIView,
-    ListAPIView,
     ListCreateAPIView,
     RetrieveUpdateDestroyAPIView,
     get_object_or_404,
 )
-from rest_framework.parsers import FormParser, MultiPartParser
-from rest_framework.permissions import AllowAny
+from rest_framework.parsers import FormParser, JSONParser, MultiPartParser
+from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from config.pagination import KeysetPagination
+from config.permissions import IsAdmin, IsAdminOrReadOnly
+
+from .blobs import acquire_blob, release_blob, release_image_url
+from .cache import (
+    SnapshotResponse,
+    get_catalog_snapshot,
+    get_group_counter_version,
+    get_process_snapshot,
+    render_json,
+)
+from .deletion import hide_catalog_object
+from .exporter import EXPORT_FORMATS
+from .importer import CatalogImport, CatalogImportError
+from .mixins import ConditionalGetMixin
+from .models import Agency, Group, Idol, ImageStatus
+from .s3_utils import (
+    copy_blob_in_s3,
+    create_presigned_image_post,
+    delete_image_objects,
+    get_blob_key,
+    get_image_url,
+    hash_image_object,
+    head_image_object,
+)
+from .search import catalog_index, fuzzy_search, normalize_query
+from .serializers import (
+    AgencySerializer,
+    GroupSerializer,
+    IdolSerializer,
+    ImageUploadConfirmSerializer,
+    ImageUploadRequestSerializer,
+)
+from .tasks import generate_image_variants_task, purge_deleted_catalog_task
 
-from config.permissions import IsAdminOrReadOnly
+# from config.base_exception import NotFoundException
 
-from .models import Agency, Group, Idol
-from .serializers import AgencySerializer, GroupSerializer, IdolSerializer
 
-# from config.base_exception import NotFoundException
+class GroupValidatorMixin(ConditionalGetMixin):
+    def get_validator_cache_name(self):
+        # 구독자 수가 바뀌면 updated_at 도 바뀌므로 그룹 집계 버전별로 구분
+        return "%s:c%s" % (
+            super().get_validator_cache_name(),
+            get_group_counter_version(),
+        )
+
+
+def get_group_snapshot_name(name, fields):
+    # 구독자 수를 포함하면 그룹 집계 버전별로 구분 (구독은 카탈로그 버전을 올리지 않음)
+    if "subscriber_count" in fields:
+        return "%s:%s:c%s" % (
+            name,
+            ",".join(sorted(fields)),
+            get_group_counter_version(),
+        )
+    return "%s:%s" % (name, ",".join(sorted(fields)))
+
 
 # 에이전시 리스트
-class AgencyListView(ListCreateAPIView):
+class AgencyListView(ConditionalGetMixin, ListCreateAPIView):
     queryset = Agency.objects.all()
     serializer_class = AgencySerializer
     permission_classes = [IsAdminOrReadOnly]
     parser_classes = (MultiPartParser, FormParser)
+    pagination_class = KeysetPagination
+    ordering = ("name", "id")
+
+    def get_queryset(self):
+        # ?fields= 로 요청된 컬럼만 조회
+        return AgencySerializer.setup_eager_loading(
+            super().get_queryset(), self.request, self.ordering
+        )
 
     @swagger_auto_schema(
         operation_description="소속사 목록을 가져옵니다.",
         responses={200: AgencySerializer(many=True)},  # 목록 반환
     )
     def get(self, request, *args, **kwargs):
-        response = super().get(request, *args, **kwargs)
-        return Response({"data": response.data}, status=response.status_code)
+        not_modified = self.check_not_modified(request)
+        if not_modified is not None:
+            return not_modified
+        # 페이지네이션 응답이 {"data": ..., "next": ...} 형식으로 반환됨
+        return super().get(request, *args, **kwargs)
 
     @swagger_auto_schema(
         operation_description="새 소속사를 생성합니다.",
@@ -52,17 +120,25 @@ class AgencyListView(ListCreateAPIView):
         return super().get_permissions()  # 관리자만 쓰기 허용
 
 
-class AgencyDetailView(RetrieveUpdateDestroyAPIView):
+class AgencyDetailView(ConditionalGetMixin, RetrieveUpdateDestroyAPIView):
     queryset = Agency.objects.all()
     serializer_class = AgencySerializer
     permission_classes = [IsAdminOrReadOnly]
     parser_classes = (MultiPartParser, FormParser)
 
+    def get_queryset(self):
+        return AgencySerializer.setup_eager_loading(
+            super().get_queryset(), self.request
+        )
+
     @swagger_auto_schema(
         operation_description="특정 소속사 데이터를 조회합니다.",
         responses={200: AgencySerializer},  # 성공 시 반환할 데이터 스키마
     )
     def get(self, request, *args, **kwargs):
+        not_modified = self.check_not_modified(request)
+        if not_modified is not None:
+            return not_modified
         response = super().get(request, *args, **kwargs)
         return Response({"data": response.data}, status=response.status_code)
 
@@ -89,27 +165,84 @@ class AgencyDetailView(RetrieveUpdateDestroyAPIView):
         response = super().delete(request, *args, **kwargs)
         return Response({"data": "소속사 삭제 성공"}, status=response.status_code)
 
+    def perform_destroy(self, instance):
+        # 즉시 숨기고 하위 데이터 삭제는 백그라운드에서 배치로 처리
+        hide_catalog_object(instance)
+        transaction.on_commit(purge_deleted_catalog_task.delay)
+
 
 # 그룹 리스트
-class GroupListView(ListCreateAPIView):
-    queryset = (
-        Group.objects.select_related("agency")
-        .prefetch_related("idol_set")
-        .annotate(member_count=Count("idol"))
-    )
+class GroupListView(GroupValidatorMixin, ListCreateAPIView):
+    queryset = Group.objects.all()
     serializer_class = GroupSerializer
+    validator_relations = ("agency", "idol")
     permission_classes = [IsAdminOrReadOnly]
     parser_classes = (MultiPartParser, FormParser)
+    pagination_class = KeysetPagination
+    ordering = ("name", "id")
+    # ?ordering= 값 -> 키셋 정렬 컬럼 (모두 인덱스가 있는 컬럼)
+    orderings = {
+        "name": ("name", "id"),
+        "subscriber_count": ("subscriber_count", "id"),
+        "-subscriber_count": ("-subscriber_count", "-id"),
+    }
+
+    def get_ordering(self):
+        # 알 수 없는 값은 기본 정렬(이름순)
+        return self.orderings.get(
+            self.request.query_params.get("ordering", ""), self.ordering
+        )
+
+    def get_queryset(self):
+        # 요청된 필드에 따라 소속사 조인, 멤버 prefetch를 선택적으로 수행
+        return GroupSerializer.setup_eager_loading(
+            super().get_queryset(),
+            self.request,
+            [field.lstrip("-") for field in self.get_ordering()],
+        )
 
     @swagger_auto_schema(
         operation_description="그룹 목록을 가져옵니다.",
+        manual_parameters=[
+            openapi.Parameter(
+                "upcoming",
+                openapi.IN_QUERY,
+                description="다가오는 일정 N개 포함",
+                type=openapi.TYPE_INTEGER,
+            ),
+            openapi.Parameter(
+                "ordering",
+                openapi.IN_QUERY,
+                description="name(기본), subscriber_count, -subscriber_count",
+                type=openapi.TYPE_STRING,
+            ),
+        ],
         responses={
             200: GroupSerializer(many=True),  # 그룹 목록 반환
         },
     )
     def get(self, request, *args, **kwargs):
-        response = super().get(request, *args, **kwargs)
-        return Response({"data": response.data}, status=response.status_code)
+        if (
+            GroupSerializer.get_upcoming_limit(request)
+            or self.get_ordering() != self.ordering
+        ):
+            # 다가오는 일정은 시간에 따라 바뀌고, 구독자 수 순위는 구독마다 자주 바뀌므로 캐시하지 않음
+            return SnapshotResponse(self.render_group_list())
+        not_modified = self.check_not_modified(request)
+        if not_modified is not None:
+            return not_modified
+        # 카탈로그 버전 + 페이지 + 요청 필드별로 캐시된 스냅샷을 그대로 반환
+        name = get_group_snapshot_name(
+            "group_list:%s" % self.paginator.get_page_key(request),
+            GroupSerializer.get_requested_fields(request),
+        )
+        body = get_catalog_snapshot(name, self.render_group_list)
+        return SnapshotResponse(body)
+
+    def render_group_list(self):
+        page = self.paginate_queryset(self.get_queryset())
+        serializer = self.get_serializer(page, many=True)
+        return render_json(self.get_paginated_response(serializer.data).data)
 
     @swagger_auto_schema(
         operation_description="새 그룹을 생성합니다.",
@@ -124,46 +257,49 @@ class GroupListView(ListCreateAPIView):
         return Response({"data": response.data}, status=response.status_code)
 
 
-class GroupByNameView(ListAPIView):
-    serializer_class = GroupSerializer
-
-    def get_queryset(self):
-        name = self.kwargs["name"]  # URL에서 'name' 변수 가져오기
-        # 특정 이름의 그룹 조회
-        return (
-            Group.objects.select_related("agency")
-            .prefetch_related("idol_set")
-            .filter(name=name)
-            .annotate(member_count=Count("idol"))
-        )
-
-    def list(self, request, *args, **kwargs):
-        # 기본 리스트 뷰 동작을 가져옴
-        queryset = self.get_queryset()
-        serializer = self.get_serializer(queryset, many=True)
-        return Response({"data": serializer.data}, status=200)
-
-
-class GroupDetailView(RetrieveUpdateDestroyAPIView):
-    queryset = (
-        Group.objects.select_related("agency")
-        .prefetch_related("idol_set")
-        .annotate(member_count=Count("idol"))
-    )
+class GroupDetailView(GroupValidatorMixin, RetrieveUpdateDestroyAPIView):
+    queryset = Group.objects.all()
     serializer_class = GroupSerializer
+    validator_relations = ("agency", "idol")
     permission_classes = [IsAdminOrReadOnly]
     parser_classes = (MultiPartParser, FormParser)
 
+    def get_queryset(self):
+        return GroupSerializer.setup_eager_loading(super().get_queryset(), self.request)
+
     @swagger_auto_schema(
         operation_description="특정 그룹 데이터를 조회합니다.",
+        manual_parameters=[
+            openapi.Parameter(
+                "upcoming",
+                openapi.IN_QUERY,
+                description="다가오는 일정 N개 포함",
+                type=openapi.TYPE_INTEGER,
+            ),
+        ],
         responses={
             200: GroupSerializer,  # 그룹 데이터 반환
             404: "그룹을 찾을 수 없습니다.",
         },
     )
     def get(self, request, *args, **kwargs):
-        response = super().get(request, *args, **kwargs)
-        return Response({"data": response.data}, status=response.status_code)
+        if GroupSerializer.get_upcoming_limit(request):
+            # 다가오는 일정은 시간과 일정 변경에 따라 달라지므로 캐시하지 않음
+            return SnapshotResponse(self.render_group_detail())
+        not_modified = self.check_not_modified(request)
+        if not_modified is not None:
+            return not_modified
+        # 카탈로그 버전 + 그룹 + 요청 필드별로 캐시된 스냅샷을 그대로 반환
+        name = get_group_snapshot_name(
+            "group_detail:%s" % self.kwargs["pk"],
+            GroupSerializer.get_requested_fields(request),
+        )
+        body = get_catalog_snapshot(name, self.render_group_detail)
+        return SnapshotResponse(body)
+
+    def render_group_detail(self):
+        serializer = self.get_serializer(self.get_object())
+        return render_json({"data": serializer.data})
 
     @swagger_auto_schema(
         operation_description="특정 그룹 데이터를 업데이트합니다.",
@@ -188,13 +324,65 @@ class GroupDetailView(RetrieveUpdateDestroyAPIView):
         response = super().delete(request, *args, **kwargs)
         return Response({"data": "그룹 삭제 성공"}, status=response.status_code)
 
+    def perform_destroy(self, instance):
+        # 즉시 숨기고 하위 데이터 삭제는 백그라운드에서 배치로 처리
+        hide_catalog_object(instance)
+        transaction.on_commit(purge_deleted_catalog_task.delay)
+
+
+def build_group_lookup_maps():
+    slugs, names = {}, {}
+    for pk, slug, name in Group.objects.values_list("id", "slug", "name"):
+        slugs[slug] = pk
+        names[name.lower()] = pk
+    return slugs, names
+
+
+def get_group_lookup_maps():
+    # (slug -> 그룹 id, 소문자 이름 -> 그룹 id)
+    # 카탈로그 버전이 바뀔 때만 프로세스별로 다시 조회
+    return get_process_snapshot("group_lookup", build_group_lookup_maps)
+
+
+# 그룹 이름(slug)으로 조회
+class GroupByNameView(GroupDetailView):
+    http_method_names = ["get", "head", "options"]
+
+    @swagger_auto_schema(
+        operation_description="slug 또는 이름으로 그룹 데이터를 조회합니다.",
+        responses={
+            200: GroupSerializer,
+            404: "그룹을 찾을 수 없습니다.",
+        },
+    )
+    def get(self, request, *args, **kwargs):
+        # slug가 아니면 대소문자만 무시하고 이름이 정확히 같은 그룹
+        # ("AB" 가 slug "ab" 인 "A.B" 로 조회되지 않도록 이름을 slug로 변환하지 않음)
+        slugs, names = get_group_lookup_maps()
+        value = kwargs["slug"]
+        pk = slugs.get(value) or names.get(value.lower())
+        if pk is None:
+            raise Http404
+        # 상세 조회와 같은 검증/스냅샷 캐시를 사용
+        self.kwargs = {"pk": pk}
+        return super().get(request, pk=pk)
+
 
 # 아이돌 리스트
-class IdolListView(ListCreateAPIView):
-    queryset = Idol.objects.select_related("group")
+class IdolListView(ConditionalGetMixin, ListCreateAPIView):
+    queryset = Idol.objects.all()
     serializer_class = IdolSerializer
+    validator_relations = ("group",)
     permission_classes = [IsAdminOrReadOnly]
     parser_classes = (MultiPartParser, FormParser)
+    pagination_class = KeysetPagination
+    ordering = ("id",)
+
+    def get_queryset(self):
+        # group_name 이 필요할 때만 그룹 조인
+        return IdolSerializer.setup_eager_loading(
+            super().get_queryset(), self.request, self.ordering
+        )
 
     @swagger_auto_schema(
         operation_description="아이돌 목록을 가져옵니다.",
@@ -203,8 +391,11 @@ class IdolListView(ListCreateAPIView):
         },
     )
     def get(self, request, *args, **kwargs):
-        response = super().get(request, *args, **kwargs)
-        return Response({"data": response.data}, status=response.status_code)
+        not_modified = self.check_not_modified(request)
+        if not_modified is not None:
+            return not_modified
+        # 페이지네이션 응답이 {"data": ..., "next": ...} 형식으로 반환됨
+        return super().get(request, *args, **kwargs)
 
     @swagger_auto_schema(
         operation_description="개별 아이돌을 생성합니다.",
@@ -219,11 +410,15 @@ class IdolListView(ListCreateAPIView):
         return Response({"data": response.data}, status=response.status_code)
 
 
-class IdolDetailView(RetrieveUpdateDestroyAPIView):
-    queryset = Idol.objects.select_related("group")
+class IdolDetailView(ConditionalGetMixin, RetrieveUpdateDestroyAPIView):
+    queryset = Idol.objects.all()
     serializer_class = IdolSerializer
+    validator_relations = ("group",)
     parser_classes = (MultiPartParser, FormParser)
 
+    def get_queryset(self):
+        return IdolSerializer.setup_eager_loading(super().get_queryset(), self.request)
+
     @swagger_auto_schema(
         operation_description="특정 아이돌 데이터를 조회합니다.",
         responses={
@@ -232,6 +427,9 @@ class IdolDetailView(RetrieveUpdateDestroyAPIView):
         },
     )
     def get(self, request, *args, **kwargs):
+        not_modified = self.check_not_modified(request)
+        if not_modified is not None:
+            return not_modified
         response = super().get(request, *args, **kwargs)
         return Response({"data": response.data}, status=response.status_code)
 
@@ -274,3 +472,293 @@ class IdolDetailView(RetrieveUpdateDestroyAPIView):
         }
         self.perform_destroy(instance)
         return Response({"data": deleted_idol_data}, status=status.HTTP_200_OK)
+
+
+# 이름 자동완성 검색
+class CatalogSearchView(APIView):
+    permission_classes = [AllowAny]
+    default_limit = 10
+    max_limit = 50
+
+    @swagger_auto_schema(
+        operation_description="소속사/그룹/아이돌 이름을 접두사로 검색합니다. (한글 자모 단위 일치)",
+        manual_parameters=[
+            openapi.Parameter(
+                "q", openapi.IN_QUERY, type=openapi.TYPE_STRING, required=True
+            ),
+            openapi.Parameter(
+                "type",
+                openapi.IN_QUERY,
+                description="agency, group, idol (쉼표로 구분)",
+                type=openapi.TYPE_STRING,
+            ),
+            openapi.Parameter("limit", openapi.IN_QUERY, type=openapi.TYPE_INTEGER),
+        ],
+        responses={200: "검색 결과 [{type, id, name}]"},
+    )
+    def get(self, request, *args, **kwargs):
+        results = catalog_index.search(
+            request.query_params.get("q", ""),
+            limit=self.get_limit(request),
+            kinds=self.get_kinds(request),
+        )
+        return Response({"data": results}, status=status.HTTP_200_OK)
+
+    def get_limit(self, request):
+        try:
+            limit = int(request.query_params.get("limit", self.default_limit))
+        except ValueError:
+            limit = self.default_limit
+        return min(max(limit, 1), self.max_limit)
+
+    def get_kinds(self, request):
+        return {
+            kind.strip()
+            for kind in request.query_params.get("type", "").split(",")
+            if kind.strip()
+        }
+
+
+# 오타 허용(trigram) 검색
+class CatalogFuzzySearchView(CatalogSearchView):
+    default_limit = 20
+
+    @swagger_auto_schema(
+        operation_description="소속사/그룹/아이돌 이름을 유사도(pg_trgm)로 검색합니다.",
+        manual_parameters=[
+            openapi.Parameter(
+                "q", openapi.IN_QUERY, type=openapi.TYPE_STRING, required=True
+            ),
+            openapi.Parameter(
+                "type",
+                openapi.IN_QUERY,
+                description="agency, group, idol (쉼표로 구분)",
+                type=openapi.TYPE_STRING,
+            ),
+            openapi.Parameter("limit", openapi.IN_QUERY, type=openapi.TYPE_INTEGER),
+        ],
+        responses={200: "검색 결과 [{type, id, name, score}] (유사도 내림차순)"},
+    )
+    def get(self, request, *args, **kwargs):
+        query = normalize_query(request.query_params.get("q", ""))
+        limit = self.get_limit(request)
+        kinds = sorted(self.get_kinds(request))
+        # 정규화한 검색어별로 카탈로그 버전 동안 결과 캐시
+        key = hashlib.sha1(
+            json.dumps([query, limit, kinds], ensure_ascii=False).encode()
+        ).hexdigest()
+        body = get_catalog_snapshot(
+            f"fuzzy_search:{key}",
+            lambda: render_json({"data": fuzzy_search(query, limit, kinds)}),
+        )
+        return SnapshotResponse(body)
+
+
+# 소속사/그룹/아이돌 일괄 등록
+class CatalogImportView(APIView):
+    permission_classes = [IsAuthenticated, IsAdmin]
+    parser_classes = (JSONParser, MultiPartParser, FormParser)
+
+    @swagger_auto_schema(
+        operation_description=(
+            "소속사 -> 그룹 -> 아이돌을 JSON 또는 엑셀(agencies/groups/idols 시트)로 "
+            "한 번에 등록합니다. 오류가 있으면 아무것도 저장하지 않고 행별 오류를 반환합니다."
+        ),
+        responses={
+            201: "생성/재사용된 항목 수",
+            400: "행별 오류 목록 [{row, errors}]",
+        },
+    )
+    def post(self, request, *args, **kwargs):
+        try:
+            if "file" in request.FILES:
+                catalog_import = CatalogImport.from_workbook(request.FILES["file"])
+            else:
+                catalog_import = CatalogImport.from_json(request.data)
+        except CatalogImportError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        if not catalog_import.validate():
+            return Response(
+                {
+                    "error": "가져올 데이터에 오류가 있습니다.",
+                    "rows": catalog_import.errors,
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        created = catalog_import.save()
+        return Response(
+            {"data": {"created": created, "reused": catalog_import.reused}},
+            status=status.HTTP_201_CREATED,
+        )
+
+
+# 전체 카탈로그 내보내기 (관리자)
+class CatalogExportView(APIView):
+    permission_classes = [IsAuthenticated, IsAdmin]
+
+    @swagger_auto_schema(
+        operation_description="소속사/그룹/아이돌 전체를 NDJSON 또는 CSV로 스트리밍합니다.",
+        manual_parameters=[
+            openapi.Parameter(
+                "type",
+                openapi.IN_QUERY,
+                description="agency, group, idol (쉼표로 구분, 없으면 전체)",
+                type=openapi.TYPE_STRING,
+            ),
+        ],
+        responses={200: "ndjson: 한 줄에 {type, id, name, ...} / csv: type 컬럼 포함"},
+    )
+    def get(self, request, export_format, *args, **kwargs):
+        if export_format not in EXPORT_FORMATS:
+            raise Http404
+        content_type, stream = EXPORT_FORMATS[export_format]
+        kinds = {
+            kind.strip()
+            for kind in request.query_params.get("type", "").split(",")
+            if kind.strip()
+        }
+        # 응답 본문을 만드는 동안 쿼리 결과를 청크 단위로 읽어 바로 전송
+        response = StreamingHttpResponse(stream(kinds), content_type=content_type)
+        response["Content-Disposition"] = (
+            f'attachment; filename="catalog.{export_format}"'
+        )
+        return response
+
+
+# 직접 업로드 대상 (URL 경로 -> 모델, 응답 시리얼라이저)
+IMAGE_UPLOAD_TARGETS = {
+    "agencies": (Agency, AgencySerializer),
+    "groups": (Group, GroupSerializer),
+    "idols": (Idol, IdolSerializer),
+}
+IMAGE_EXTENSIONS = {
+    "image/jpeg": ".jpg",
+    "image/png": ".png",
+    "image/webp": ".webp",
+    "image/gif": ".gif",
+}
+
+
+class DirectImageUploadMixin:
+    permission_classes = [IsAuthenticated, IsAdminOrReadOnly]
+
+    def get_target(self):
+        target = self.kwargs["target"]
+        if target not in IMAGE_UPLOAD_TARGETS:
+            raise Http404
+        model, serializer_class = IMAGE_UPLOAD_TARGETS[target]
+        instance = get_object_or_404(model, pk=self.kwargs["pk"])
+        return instance, serializer_class
+
+    def get_key_prefix(self):
+        return f"images/{self.kwargs['target']}/{self.kwargs['pk']}/"
+
+
+class ImageUploadPresignView(DirectImageUploadMixin, GenericAPIView):
+    """
+    이미지를 S3로 직접 업로드할 presigned POST를 발급합니다.
+    """
+
+    serializer_class = ImageUploadRequestSerializer
+
+    @swagger_auto_schema(
+        operation_description="이미지 직접 업로드용 presigned POST를 발급합니다.",
+        request_body=ImageUploadRequestSerializer,
+        responses={
+            200: "presigned POST (url, fields, key)",
+            400: "허용되지 않는 이미지 형식",
+            404: "대상을 찾을 수 없습니다.",
+        },
+    )
+    def post(self, request, *args, **kwargs):
+        self.get_target()
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        content_type = serializer.validated_data["content_type"]
+        key = self.get_key_prefix() + uuid.uuid4().hex + IMAGE_EXTENSIONS[content_type]
+        presigned = create_presigned_image_post(key, content_type)
+        return Response(
+            {
+                "data": {
+                    "key": key,
+                    "url": presigned["url"],
+                    "fields": presigned["fields"],
+                    "max_size": settings.IMAGE_UPLOAD_MAX_SIZE,
+                    "expires_in": settings.IMAGE_UPLOAD_PRESIGN_EXPIRES,
+                }
+            },
+            status=status.HTTP_200_OK,
+        )
+
+
+class ImageUploadConfirmView(DirectImageUploadMixin, GenericAPIView):
+    """
+    S3에 업로드된 객체의 메타데이터를 확인한 뒤 내용 주소 blob으로 옮겨 image 필드에 반영합니다.
+    """
+
+    serializer_class = ImageUploadConfirmSerializer
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context["key_prefix"] = self.get_key_prefix()
+        return context
+
+    @swagger_auto_schema(
+        operation_description="직접 업로드한 이미지를 확인하고 반영합니다.",
+        request_body=ImageUploadConfirmSerializer,
+        responses={
+            200: "이미지가 반영된 데이터",
+            400: "업로드된 이미지가 없거나 제한을 벗어남",
+            404: "대상을 찾을 수 없습니다.",
+        },
+    )
+    def post(self, request, *args, **kwargs):
+        instance, serializer_class = self.get_target()
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        key = serializer.validated_data["key"]
+        metadata = head_image_object(key)
+        if metadata is None:
+            return Response(
+                {"error": "업로드된 이미지를 찾을 수 없습니다."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if (
+            metadata["ContentLength"] > settings.IMAGE_UPLOAD_MAX_SIZE
+            or metadata.get("ContentType") not in settings.IMAGE_UPLOAD_CONTENT_TYPES
+        ):
+            return Response(
+                {"error": "이미지 크기 또는 형식이 올바르지 않습니다."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        # 서버 업로드와 같이 내용 주소 blob으로 옮겨 참조 수/GC 대상에 포함
+        digest, size = hash_image_object(key)
+        blob_key = get_blob_key(digest, key)
+        acquire_blob(blob_key, size)
+        try:
+            copy_blob_in_s3(key, blob_key)
+        except Exception:
+            release_blob(blob_key)
+            raise
+
+        previous_image = instance.image
+        instance.image = get_image_url(blob_key)
+        instance.image_status = ImageStatus.READY
+        instance.image_variants = {}
+        instance.save(
+            update_fields=["image", "image_status", "image_variants", "updated_at"]
+        )
+        release_image_url(previous_image)
+        # 반영된 뒤에 업로드 경로의 원본 삭제 (실패하면 다시 확인할 수 있도록 유지)
+        transaction.on_commit(lambda: delete_image_objects([key]))
+        transaction.on_commit(
+            lambda: generate_image_variants_task.delay(
+                instance._meta.label, instance.pk, blob_key
+            )
+        )
+        data = serializer_class(instance, context=self.get_serializer_context()).data
+        return Response({"data": data}, status=status.HTTP_200_OK)
@@ -1,12 +1,16 @@
 from django.contrib import admin
 
+from config.admin_pagination import EstimatedCountAdminMixin
+
 from .models import UserGroupSubscribe
 
 
 @admin.register(UserGroupSubscribe)
-class UserGroupSubscribeAdmin(admin.ModelAdmin):
+class UserGroupSubscribeAdmin(EstimatedCountAdminMixin, admin.ModelAdmin):
     # 관리자 페이지 목록에 표시할 필드
     list_display = ("user", "group", "notification")
+    list_select_related = ("user", "group__agency")
+    autocomplete_fields = ("user", "group")
     # 검색 가능한 필드
     search_fields = ("user__username", "group__name")
     # 필터 옵션 추가
@@ -1,7 +1,7 @@
 from django.db import models
 
 from Accounts.models import User
-from Idols.models import Group
+from Idols.models import Group, GroupVisibleManager
 
 
 class UserGroupSubscribe(models.Model):
@@ -9,5 +9,8 @@ class UserGroupSubscribe(models.Model):
     group = models.ForeignKey(Group, on_delete=models.CASCADE)
     notification = models.BooleanField(default=True)
 
+    objects = GroupVisibleManager()
+    all_objects = models.Manager()
+
     def __str__(self):
         return f"{self.user} subscribed to {self.group} (Notification: {self.notification})"
@@ -0,0 +1,24 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from Idols.cache import bump_group_counter_version
+from Idols.counters import adjust_group_counter
+from Idols.deletion import skip_during_purge
+
+from .models import UserGroupSubscribe
+
+
+@receiver(post_save, sender=UserGroupSubscribe)
+def increase_subscriber_count(sender, instance, created, **kwargs):
+    # 구독 설정 변경(알림 on/off)은 구독자 수에 영향 없음
+    if created:
+        adjust_group_counter(instance.group_id, "subscriber_count", 1)
+        # 구독자 수가 포함된 그룹 목록/상세 스냅샷만 무효화 (카탈로그 버전은 유지)
+        bump_group_counter_version()
+
+
+@receiver(post_delete, sender=UserGroupSubscribe)
+@skip_during_purge
+def decrease_subscriber_count(sender, instance, **kwargs):
+    adjust_group_counter(instance.group_id, "subscriber_count", -1)
+    bump_group_counter_version()
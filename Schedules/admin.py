@@ -1,10 +1,14 @@
 from django.contrib import admin
+from django.db.models import Prefetch
+
+from config.admin_pagination import EstimatedCountAdminMixin
+from Idols.models import Idol
 
 from .models import Schedule  # Schedule 모델 임포트
 
 
 @admin.register(Schedule)
-class ScheduleAdmin(admin.ModelAdmin):
+class ScheduleAdmin(EstimatedCountAdminMixin, admin.ModelAdmin):
     list_display = (
         "id",
         "title",
@@ -23,18 +27,29 @@ class ScheduleAdmin(admin.ModelAdmin):
     # 수정 불가능한 필드인 created_at 과 updated_at은 읽기 전용으로 처리합니다.
 
     list_filter = (
-        "user",
-        "group",
         "start_time",
     )  # 관리자 페이지의 스케줄 목록에서 필터링에 사용할 필드들을 지정합니다.
-    # user, group, start_time 필드를 기준으로 필터링할 수 있습니다.
+    # user, group 필터는 전체 사용자/그룹을 불러오므로 검색(username, 그룹 이름)으로 대체합니다.
 
     search_fields = (
         "title",
         "description",
         "location",
+        "user__username",
+        "group__name",
     )  # 관리자 페이지의 스케줄 목록에서 검색에 사용할 필드들을 지정합니다.
-    # title, description, location 필드를 기준으로 검색할 수 있습니다.
+    # title, description, location, 작성자, 그룹 이름을 기준으로 검색할 수 있습니다.
+
+    list_select_related = (
+        "user",
+        "group__agency",
+    )  # 목록의 user, group 표시(Group.__str__ 은 소속사 이름 사용)를 조인으로 함께 조회합니다.
+
+    autocomplete_fields = (
+        "user",
+        "group",
+        "participating_members",
+    )  # 수정 화면의 선택 위젯이 전체 목록 대신 검색으로 불러오도록 합니다.
 
     ordering = (
         "start_time",
@@ -67,11 +82,26 @@ class ScheduleAdmin(admin.ModelAdmin):
     )  # 관리자 페이지에서 수정할 수 없도록 읽기 전용으로 설정할 필드들을 지정합니다.
     # created_at, updated_at 필드는 읽기 전용으로 표시됩니다.
 
+    def get_queryset(self, request):
+        # 참가 멤버는 목록 페이지 단위로 한 번에 prefetch
+        return (
+            super()
+            .get_queryset(request)
+            .prefetch_related(
+                Prefetch(
+                    "participating_members",
+                    queryset=Idol.objects.only("id", "name"),
+                )
+            )
+        )
+
     def display_participating_members(self, obj):
         """
         참가 멤버들을 쉼표로 구분된 문자열로 표시합니다.
         """
-        return ", ".join([member.name for member in obj.participating_members.all()])
+        return ", ".join(
+            [member.name for member in obj.participating_members.all()]
+        )  # prefetch 결과 사용
 
     display_participating_members.short_description = (
         "Participating Members"  # 메서드의 컬럼 이름을 설정합니다.
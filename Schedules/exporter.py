@@ -0,0 +1,102 @@
+import csv
+from datetime import datetime
+
+from django.db import connection
+from django.db.models import Aggregate, TextField, Value
+from django.db.models.functions import Cast
+from django.utils import timezone
+from openpyxl import Workbook
+
+from Idols.exporter import EXPORT_CHUNK_SIZE, _buffered, _csv_value, _Echo
+
+from .importer import SCHEDULE_COLUMNS
+from .models import Schedule
+
+# 앞 7개 컬럼은 가져오기 형식과 같으므로 내보낸 파일을 그대로 다시 올릴 수 있음
+SCHEDULE_EXPORT_COLUMNS = (*SCHEDULE_COLUMNS, "participating_members", "group_name")
+
+
+class GroupConcat(Aggregate):
+    # PostgreSQL 이 아닌 DB(SQLite 테스트 등)용 문자열 집계 (순서 보장 없음)
+    function = "GROUP_CONCAT"
+    output_field = TextField()
+
+    def __init__(self, expression, delimiter, **extra):
+        super().__init__(Cast(expression, TextField()), Value(delimiter), **extra)
+
+
+def _member_aggregates():
+    """참여 멤버 id/이름을 일정마다 한 줄로 모으는 집계 (행마다 M2M 조회 없음)"""
+    if connection.vendor == "postgresql":
+        from django.contrib.postgres.aggregates import StringAgg
+
+        order_by = "participating_members__id"
+        return {
+            "member_ids": StringAgg(
+                Cast("participating_members__id", TextField()), ",", order_by=order_by
+            ),
+            "member_names": StringAgg(
+                "participating_members__name", ", ", order_by=order_by
+            ),
+        }
+    return {
+        "member_ids": GroupConcat("participating_members__id", ","),
+        "member_names": GroupConcat("participating_members__name", ", "),
+    }
+
+
+def iter_schedule_rows(queryset=None, chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    일정을 시작 시간 순서로 SCHEDULE_EXPORT_COLUMNS 순서의 튜플로 반환합니다.
+    참여 멤버는 GROUP BY 집계로 함께 읽고, 서버 측 커서(iterator)로 chunk_size씩 가져오므로
+    기간/그룹 수와 관계없이 메모리 사용량이 일정합니다.
+    시간은 현재 타임존 기준 naive 값입니다. (엑셀은 타임존을 지원하지 않음)
+    """
+    queryset = Schedule.objects.all() if queryset is None else queryset
+    rows = (
+        queryset.annotate(**_member_aggregates())
+        .order_by("start_time", "id")
+        .values_list(
+            "group_id",
+            "title",
+            "description",
+            "location",
+            "start_time",
+            "end_time",
+            "member_ids",
+            "member_names",
+            "group__name",
+        )
+        .iterator(chunk_size=chunk_size)
+    )
+    for row in rows:
+        yield tuple(
+            (
+                timezone.localtime(value).replace(tzinfo=None)
+                if isinstance(value, datetime)
+                else value
+            )
+            for value in row
+        )
+
+
+def iter_schedule_csv(queryset=None):
+    writer = csv.writer(_Echo())
+    yield writer.writerow(SCHEDULE_EXPORT_COLUMNS)
+    yield from _buffered(
+        writer.writerow([_csv_value(value) for value in row])
+        for row in iter_schedule_rows(queryset)
+    )
+
+
+def write_schedule_xlsx(file, queryset=None):
+    """
+    write_only 워크북에 한 행씩 추가하여 file 에 저장합니다.
+    셀 객체를 만들지 않고 행을 바로 임시 파일로 내보내므로 메모리 사용량이 일정합니다.
+    """
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet("schedules")
+    sheet.append(SCHEDULE_EXPORT_COLUMNS)
+    for row in iter_schedule_rows(queryset):
+        sheet.append(row)
+    workbook.save(file)
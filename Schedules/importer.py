@@ -0,0 +1,414 @@
+import csv
+import io
+import json
+import os
+import uuid
+from itertools import islice
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from openpyxl import load_workbook
+from rest_framework import serializers
+
+from Idols.models import Group, Idol
+
+from .models import Schedule, make_schedule_fingerprint
+
+# 업로드 파일의 컬럼 순서 (첫 행은 헤더)
+SCHEDULE_COLUMNS = (
+    "group",
+    "title",
+    "description",
+    "location",
+    "start_time",
+    "end_time",
+    "participating_member_ids",
+)
+
+# 검증/저장 단위 행 수
+IMPORT_CHUNK_SIZE = 1000
+
+
+def _text(value):
+    if value is None or value == "":
+        return None
+    return str(value).strip()
+
+
+def _to_int(value):
+    # 엑셀 숫자 셀은 float(3.0)로 읽히므로 정수로 변환
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return int(str(value).strip())
+
+
+def _split_ids(value):
+    # "1,2,3" 문자열, 숫자 셀 하나 (3.0) 또는 NDJSON 배열 [1, 2]
+    if isinstance(value, (int, float)):
+        return [_to_int(value)]
+    if isinstance(value, list):
+        return [_to_int(part) for part in value]
+    return [_to_int(part) for part in str(value).split(",") if part.strip()]
+
+
+class ScheduleImportError(Exception):
+    """업로드 파일 형식 자체가 잘못된 경우"""
+
+
+def read_workbook(file):
+    """
+    첫 시트의 2행부터 (행 번호, {컬럼: 값})을 하나씩 반환합니다.
+    read_only 모드로 열어 셀 객체 없이 값만 읽으므로 파일 크기와 관계없이 메모리가 일정합니다.
+    """
+    try:
+        workbook = load_workbook(file, read_only=True, data_only=True)
+    except Exception:
+        raise ScheduleImportError("엑셀 파일을 읽을 수 없습니다.")
+    try:
+        sheet = workbook.active
+        for number, values in enumerate(
+            sheet.iter_rows(min_row=2, values_only=True), start=2
+        ):
+            if all(_text(value) is None for value in values):
+                continue
+            yield number, dict(zip(SCHEDULE_COLUMNS, values))
+    finally:
+        workbook.close()
+
+
+def spool_import_file(file):
+    """업로드 파일을 워커가 읽을 수 있는 디스크 경로에 청크 단위로 저장하고 경로를 반환합니다."""
+    spool_dir = settings.SCHEDULE_IMPORT_SPOOL_DIR
+    os.makedirs(spool_dir, exist_ok=True)
+    _, ext = os.path.splitext(file.name)
+    path = os.path.join(spool_dir, f"{uuid.uuid4().hex}{ext}")
+    with open(path, "wb") as spooled:
+        for chunk in file.chunks():
+            spooled.write(chunk)
+    return path
+
+
+def iter_error_report(errors):
+    """행별 오류 [{row, errors: {필드: [메시지]}}]를 (행, 필드, 메시지) 한 줄씩 펼칩니다."""
+    for error in errors:
+        for field, messages in error["errors"].items():
+            for message in messages:
+                yield error["row"], field, message
+
+
+def read_csv(file):
+    """
+    CSV 파일(UTF-8, 첫 행은 헤더)을 한 줄씩 디코딩하며 (행 번호, {컬럼: 값})을 반환합니다.
+    컬럼 순서는 엑셀과 같습니다.
+    """
+    text = io.TextIOWrapper(file, encoding="utf-8-sig", newline="")
+    try:
+        reader = csv.reader(text)
+        next(reader, None)
+        for values in reader:
+            if all(_text(value) is None for value in values):
+                continue
+            yield reader.line_num, dict(zip(SCHEDULE_COLUMNS, values))
+    except (UnicodeDecodeError, csv.Error):
+        raise ScheduleImportError("CSV 파일을 읽을 수 없습니다.")
+    finally:
+        text.detach()
+
+
+def read_ndjson(file):
+    """
+    NDJSON 파일(한 줄에 {컬럼: 값} 객체 하나)을 한 줄씩 읽어 (줄 번호, {컬럼: 값})을 반환합니다.
+    """
+    for number, line in enumerate(file, start=1):
+        if not line.strip():
+            continue
+        try:
+            values = json.loads(line)
+        except (UnicodeDecodeError, ValueError):
+            values = None
+        if not isinstance(values, dict):
+            raise ScheduleImportError(f"{number}번째 줄이 올바른 JSON 객체가 아닙니다.")
+        yield number, {column: values.get(column) for column in SCHEDULE_COLUMNS}
+
+
+# 형식 이름 -> 행 읽기 함수 (모두 파일을 한 번에 읽지 않는 제너레이터)
+IMPORT_READERS = {
+    "xlsx": read_workbook,
+    "csv": read_csv,
+    "ndjson": read_ndjson,
+}
+
+# 업로드 Content-Type / 확장자 -> 형식 이름
+IMPORT_CONTENT_TYPES = {
+    "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet": "xlsx",
+    "text/csv": "csv",
+    "application/x-ndjson": "ndjson",
+}
+IMPORT_EXTENSIONS = {
+    ".xlsx": "xlsx",
+    ".csv": "csv",
+    ".ndjson": "ndjson",
+    ".jsonl": "ndjson",
+}
+
+
+def detect_import_format(file):
+    """Content-Type, 없으면 확장자로 형식을 정합니다. 지원하지 않으면 None"""
+    content_type = (file.content_type or "").split(";")[0].strip().lower()
+    if content_type in IMPORT_CONTENT_TYPES:
+        return IMPORT_CONTENT_TYPES[content_type]
+    _, ext = os.path.splitext(file.name)
+    return IMPORT_EXTENSIONS.get(ext.lower())
+
+
+class ScheduleImport:
+    """
+    일정 행을 chunk_size개씩 검증하고 bulk_create로 저장합니다.
+    그룹/아이돌 id는 처음 한 번만 조회하고, 청크마다 (그룹, 제목, 시작 시간) fingerprint 로
+    기존 일정을 한 번 조회한 뒤 일정과 참여 멤버(through) 행을 INSERT 두 번으로 저장합니다.
+
+    mode="create" 는 이미 등록된 일정을 오류로, mode="upsert" 는 바뀐 일정만
+    INSERT ... ON CONFLICT (fingerprint) DO UPDATE 로 수정하고 그대로인 일정은 건너뜁니다.
+
+    전체가 하나의 트랜잭션이며, 오류가 있는 행이 하나라도 있으면 모두 롤백하고
+    행별 오류(errors)를 남깁니다.
+    """
+
+    MODES = ("create", "upsert")
+    # upsert 시 기존 행에서 갱신하는 필드 (자연 키 group/title/start_time 과 작성자는 유지)
+    UPSERT_FIELDS = ("description", "location", "end_time")
+
+    def __init__(
+        self,
+        rows,
+        user,
+        chunk_size=IMPORT_CHUNK_SIZE,
+        on_progress=None,
+        mode="create",
+    ):
+        self.rows = rows  # (행 번호, {컬럼: 값}) 이터러블
+        self.user = user
+        self.chunk_size = chunk_size
+        self.on_progress = on_progress or (lambda schedule_import: None)
+        self.mode = mode
+        self.errors = []
+        self.processed = 0
+        self.succeeded = 0
+        self.failed = 0
+        self.created = 0
+        self.updated = 0
+        self.unchanged = 0
+        self.fingerprints = set()  # 파일 안 중복 확인용
+
+    def preload(self):
+        self.group_ids = set(Group.objects.values_list("id", flat=True))
+        self.idol_ids = set(Idol.objects.values_list("id", flat=True))
+
+    def add_errors(self, number, errors):
+        self.errors.append({"row": number, "errors": errors})
+
+    def parse_datetime(self, value, field, errors):
+        if value is None or value == "":
+            return None
+        try:
+            return serializers.DateTimeField().to_internal_value(value)
+        except serializers.ValidationError as e:
+            errors[field] = [str(message) for message in e.detail]
+
+    def clean_row(self, values):
+        """
+        한 행을 검증하여 (Schedule, 참여 멤버 id 목록, 오류)를 반환합니다.
+        DB 조회 없이 미리 읽은 id 집합으로 그룹/멤버 존재 여부를 확인합니다.
+        """
+        errors = {}
+        group_id = None
+        try:
+            group_id = _to_int(values.get("group"))
+            if group_id not in self.group_ids:
+                errors["group"] = ["존재하지 않는 그룹입니다."]
+        except (TypeError, ValueError):
+            errors["group"] = ["그룹 id가 필요합니다."]
+
+        member_ids = []
+        members = values.get("participating_member_ids")
+        if _text(members) is not None:
+            try:
+                member_ids = _split_ids(members)
+            except ValueError:
+                errors["participating_member_ids"] = [
+                    "멤버 id는 쉼표로 구분한 숫자입니다."
+                ]
+            else:
+                missing = [pk for pk in member_ids if pk not in self.idol_ids]
+                if missing:
+                    errors["participating_member_ids"] = [
+                        f"존재하지 않는 멤버입니다: {', '.join(map(str, missing))}"
+                    ]
+
+        start_time = self.parse_datetime(values.get("start_time"), "start_time", errors)
+        end_time = self.parse_datetime(values.get("end_time"), "end_time", errors)
+        if start_time and end_time and end_time <= start_time:
+            errors["end_time"] = ["종료 시간이 시작 시간보다 빠를 수 없습니다."]
+
+        schedule = Schedule(
+            user=self.user,
+            group_id=group_id,
+            title=_text(values.get("title")),
+            description=_text(values.get("description")),
+            location=_text(values.get("location")),
+            start_time=start_time,
+            end_time=end_time,
+        )
+        if group_id is not None and start_time is not None:
+            # bulk_create 는 save()를 거치지 않으므로 직접 지정
+            schedule.fingerprint = make_schedule_fingerprint(
+                group_id, schedule.title, start_time
+            )
+        # 길이/필수 값 등 모델 필드 검증 (연관 필드는 위에서 확인)
+        try:
+            schedule.clean_fields(
+                exclude={"user", "group", "start_time", "end_time", *errors}
+            )
+        except ValidationError as e:
+            errors.update(e.message_dict)
+        if start_time is None and "start_time" not in errors:
+            errors["start_time"] = ["시작 시간이 필요합니다."]
+        return schedule, list(dict.fromkeys(member_ids)), errors
+
+    def load_existing(self, schedules):
+        """
+        청크의 fingerprint 와 같은 기존 일정을 한 번에 조회하여
+        {fingerprint: (id, {필드: 값}, 참여 멤버 id 집합)}을 반환합니다.
+        참여 멤버는 LEFT JOIN 으로 함께 읽어 쿼리 한 번으로 처리합니다.
+        """
+        existing = {}
+        rows = Schedule.all_objects.filter(
+            fingerprint__in=[schedule.fingerprint for schedule in schedules]
+        ).values_list("fingerprint", "id", *self.UPSERT_FIELDS, "participating_members")
+        for fingerprint, pk, *values, member_id in rows:
+            _, _, member_ids = existing.setdefault(
+                fingerprint, (pk, dict(zip(self.UPSERT_FIELDS, values)), set())
+            )
+            if member_id is not None:
+                member_ids.add(member_id)
+        return existing
+
+    def save_members(self, cleaned, replaced=()):
+        # replaced: 참여 멤버를 새로 지정할 기존 일정 id (DELETE 후 다시 INSERT)
+        Through = Schedule.participating_members.through
+        if replaced:
+            Through.objects.filter(schedule_id__in=replaced).delete()
+        Through.objects.bulk_create(
+            Through(schedule_id=schedule.pk, idol_id=idol_id)
+            for schedule, member_ids in cleaned
+            for idol_id in member_ids
+        )
+
+    def save_chunk(self, cleaned):
+        schedules = Schedule.objects.bulk_create(schedule for schedule, _ in cleaned)
+        self.save_members(cleaned)
+        self.created += len(schedules)
+
+    def upsert_chunk(self, cleaned, existing):
+        """바뀐 일정과 새 일정만 INSERT ... ON CONFLICT 한 번으로 저장합니다."""
+        writes = []
+        replaced = []
+        created = updated = 0
+        for schedule, member_ids in cleaned:
+            current = existing.get(schedule.fingerprint)
+            if current is None:
+                writes.append((schedule, member_ids))
+                created += 1
+                continue
+            pk, values, current_members = current
+            members_changed = set(member_ids) != current_members
+            fields_changed = any(
+                getattr(schedule, field) != value for field, value in values.items()
+            )
+            if not (members_changed or fields_changed):
+                self.unchanged += 1
+                continue
+            writes.append((schedule, member_ids if members_changed else []))
+            if members_changed:
+                replaced.append(pk)
+            updated += 1
+        if not writes:
+            return
+        Schedule.objects.bulk_create(
+            (schedule for schedule, _ in writes),
+            update_conflicts=True,
+            unique_fields=["fingerprint"],
+            update_fields=[*self.UPSERT_FIELDS, "updated_at"],
+        )
+        for schedule, _ in writes:
+            if schedule.fingerprint in existing:
+                # 충돌로 수정된 행은 기존 id 사용 (RETURNING 미지원 DB 대비)
+                schedule.pk = existing[schedule.fingerprint][0]
+        self.save_members(writes, replaced)
+        self.created += created
+        self.updated += updated
+
+    def run(self):
+        """
+        모든 행을 처리하고 저장에 성공하면 True를 반환합니다.
+        오류가 생긴 뒤에도 나머지 행을 계속 검증하여 전체 오류 목록을 만듭니다.
+        """
+        self.preload()
+        rows = iter(self.rows)
+        try:
+            with transaction.atomic():
+                while True:
+                    chunk = list(islice(rows, self.chunk_size))
+                    if not chunk:
+                        break
+                    cleaned = []
+                    for number, values in chunk:
+                        schedule, member_ids, errors = self.clean_row(values)
+                        if not errors and schedule.fingerprint in self.fingerprints:
+                            errors = {
+                                "title": [
+                                    "파일 안에 같은 그룹/제목/시작 시간의 일정이 있습니다."
+                                ]
+                            }
+                        if errors:
+                            self.add_errors(number, errors)
+                            self.failed += 1
+                        else:
+                            self.fingerprints.add(schedule.fingerprint)
+                            cleaned.append((number, schedule, member_ids))
+                    self.processed += len(chunk)
+
+                    existing = self.load_existing(
+                        schedule for _, schedule, _ in cleaned
+                    )
+                    if self.mode == "create":
+                        # 이미 등록된 일정은 upsert 모드로만 다시 가져올 수 있음
+                        rows_to_save = []
+                        for number, schedule, member_ids in cleaned:
+                            if schedule.fingerprint in existing:
+                                self.add_errors(
+                                    number, {"title": ["이미 등록된 일정입니다."]}
+                                )
+                                self.failed += 1
+                            else:
+                                rows_to_save.append((number, schedule, member_ids))
+                        cleaned = rows_to_save
+                    self.succeeded += len(cleaned)
+
+                    # 오류가 나온 뒤로는 어차피 롤백하므로 저장하지 않음
+                    if not self.errors:
+                        cleaned = [(schedule, ids) for _, schedule, ids in cleaned]
+                        if self.mode == "upsert":
+                            self.upsert_chunk(cleaned, existing)
+                        else:
+                            self.save_chunk(cleaned)
+                    self.on_progress(self)
+                if self.errors:
+                    transaction.set_rollback(True)
+                    self.created = self.updated = self.unchanged = 0
+        except Exception:
+            # 중간에 예외가 나면 전체가 롤백되므로 저장 수도 0
+            self.created = self.updated = self.unchanged = 0
+            raise
+        return not self.errors
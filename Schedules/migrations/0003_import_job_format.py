@@ -0,0 +1,18 @@
+# Generated by Django 5.1.7 on 2026-10-17 19:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("Schedules", "0002_import_job"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="importjob",
+            name="file_format",
+            field=models.CharField(default="xlsx", max_length=10),
+        ),
+    ]
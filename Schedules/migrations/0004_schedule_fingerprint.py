@@ -0,0 +1,74 @@
+# Generated by Django 5.1.7 on 2026-10-17 19:25
+
+import hashlib
+from datetime import timezone
+
+from django.db import migrations, models
+
+
+def fill_schedule_fingerprints(apps, schema_editor):
+    # 기존 일정의 fingerprint 를 채움 (이미 중복 등록된 일정은 가장 먼저 만든 행에만 지정)
+    # 나머지 중복 행은 NULL 로 남으며, 키(그룹/제목/시작 시간)를 바꾸지 않는 수정은 계속 가능
+    Schedule = apps.get_model("Schedules", "Schedule")
+    taken = set()
+    batch = []
+    for schedule in (
+        Schedule.objects.order_by("id")
+        .only("id", "group_id", "title", "start_time")
+        .iterator(chunk_size=1000)
+    ):
+        key = "\x1f".join(
+            (
+                str(schedule.group_id),
+                schedule.title or "",
+                schedule.start_time.astimezone(timezone.utc).isoformat(),
+            )
+        )
+        fingerprint = hashlib.sha256(key.encode()).hexdigest()
+        if fingerprint in taken:
+            continue
+        taken.add(fingerprint)
+        schedule.fingerprint = fingerprint
+        batch.append(schedule)
+        if len(batch) >= 1000:
+            Schedule.objects.bulk_update(batch, ["fingerprint"])
+            batch = []
+    Schedule.objects.bulk_update(batch, ["fingerprint"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("Schedules", "0003_import_job_format"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="importjob",
+            name="mode",
+            field=models.CharField(default="create", max_length=10),
+        ),
+        migrations.AddField(
+            model_name="importjob",
+            name="unchanged",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="importjob",
+            name="updated",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="schedule",
+            name="fingerprint",
+            field=models.CharField(editable=False, max_length=64, null=True),
+        ),
+        migrations.RunPython(fill_schedule_fingerprints, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="schedule",
+            name="fingerprint",
+            field=models.CharField(
+                editable=False, max_length=64, null=True, unique=True
+            ),
+        ),
+    ]
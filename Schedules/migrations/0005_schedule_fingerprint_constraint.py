@@ -0,0 +1,27 @@
+# Generated by Django 5.1.7 on 2026-10-17 20:20
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("Idols", "0014_name_unique_excludes_deleted"),
+        ("Schedules", "0004_schedule_fingerprint"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="schedule",
+            name="fingerprint",
+            field=models.CharField(editable=False, max_length=64, null=True),
+        ),
+        migrations.AddConstraint(
+            model_name="schedule",
+            constraint=models.UniqueConstraint(
+                fields=("fingerprint",), name="schedule_fingerprint_unique"
+            ),
+        ),
+    ]
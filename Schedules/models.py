@@ -1,11 +1,26 @@
+import hashlib
+from datetime import timezone as dt_timezone
+
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.db import models
 
-from Idols.models import Group, Idol
+from Idols.models import Group, GroupVisibleManager, Idol
 
 User = get_user_model()
 
 
+def make_schedule_fingerprint(group_id, title, start_time):
+    """
+    (그룹, 제목, 시작 시간) 자연 키의 SHA-256 값. 같은 일정을 다시 가져올 때 기존 행을 찾는 데 사용합니다.
+    시작 시간은 UTC로 맞춰 타임존 표기와 관계없이 같은 값이 되도록 합니다.
+    """
+    key = "\x1f".join(
+        (str(group_id), title or "", start_time.astimezone(dt_timezone.utc).isoformat())
+    )
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
 class Schedule(models.Model):
     id = models.AutoField(primary_key=True)
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="schedules")
@@ -17,14 +32,112 @@ class Schedule(models.Model):
     end_time = models.DateTimeField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    # make_schedule_fingerprint 값 (일괄 가져오기 upsert 기준, 중복 등록 방지)
+    # 0004 이전에 이미 중복 등록된 일정은 가장 먼저 만든 행만 값을 가지고 나머지는 NULL
+    fingerprint = models.CharField(max_length=64, null=True, editable=False)
 
     # 참가 멤버와의 다대다 관계를 위한 필드
     participating_members = models.ManyToManyField(
         Idol, related_name="schedules", blank=True
     )
 
+    objects = GroupVisibleManager()
+    all_objects = models.Manager()
+
     def __str__(self):
         return self.title
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # fingerprint 를 받지 못한 기존 중복 일정이면 조회 당시 키를 보관
+        # (키를 바꾸지 않는 수정은 NULL 을 유지하여 먼저 만든 행과 충돌하지 않음)
+        if "fingerprint" in field_names and instance.fingerprint is None:
+            instance._legacy_fingerprint = make_schedule_fingerprint(
+                instance.group_id, instance.title, instance.start_time
+            )
+        return instance
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        key_fields = {"group", "group_id", "title", "start_time"}
+        if update_fields is None or key_fields & set(update_fields):
+            # 문자열/naive 값도 저장될 값과 같은 aware datetime 으로 변환
+            start_time = self._meta.get_field("start_time").get_prep_value(
+                self.start_time
+            )
+            fingerprint = make_schedule_fingerprint(
+                self.group_id, self.title, start_time
+            )
+            if fingerprint != getattr(self, "_legacy_fingerprint", None):
+                self.fingerprint = fingerprint
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "fingerprint"}
+        super().save(*args, **kwargs)
+
     class Meta:
         db_table = "schedule"
+        constraints = [
+            # (그룹, 제목, 시작 시간)이 같은 일정은 하나만 등록 (NULL 은 중복 허용)
+            models.UniqueConstraint(
+                fields=["fingerprint"], name="schedule_fingerprint_unique"
+            )
+        ]
+
+
+class ImportJob(models.Model):
+    """
+    일정 일괄 등록 작업. 업로드 파일은 디스크에 임시 저장되고 Celery 워커가 처리합니다.
+    처리 중 진행 상황은 캐시에 기록하고 (가져오기 트랜잭션이 끝나기 전에도 조회 가능),
+    완료되면 최종 값을 이 행에 저장합니다.
+    """
+
+    class Status(models.TextChoices):
+        PENDING = "pending", "대기"
+        RUNNING = "running", "처리 중"
+        SUCCEEDED = "succeeded", "완료"
+        FAILED = "failed", "실패"
+
+    PROGRESS_KEY = "schedules:import_job:{id}:progress"
+    PROGRESS_FIELDS = ("processed", "succeeded", "failed")
+
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="import_jobs")
+    file_name = models.CharField(max_length=255)
+    file_format = models.CharField(max_length=10, default="xlsx")  # xlsx/csv/ndjson
+    mode = models.CharField(max_length=10, default="create")  # create/upsert
+    file_path = models.CharField(max_length=500)  # 임시 저장 경로 (처리 후 삭제)
+    status = models.CharField(
+        max_length=10, choices=Status.choices, default=Status.PENDING
+    )
+    processed = models.PositiveIntegerField(default=0)  # 읽은 행 수
+    succeeded = models.PositiveIntegerField(default=0)  # 검증을 통과한 행 수
+    failed = models.PositiveIntegerField(default=0)  # 오류 행 수
+    created = models.PositiveIntegerField(default=0)  # 저장된 일정 수
+    updated = models.PositiveIntegerField(default=0)  # upsert 로 수정된 일정 수
+    unchanged = models.PositiveIntegerField(
+        default=0
+    )  # upsert 에서 변경 없이 건너뛴 수
+    error = models.CharField(max_length=200, blank=True)  # 파일 단위 오류
+    errors = models.JSONField(default=list, blank=True)  # 행별 오류 [{row, errors}]
+    created_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f"{self.file_name} ({self.status})"
+
+    def set_progress(self, **counters):
+        cache.set(self.PROGRESS_KEY.format(id=self.pk), counters, timeout=60 * 60)
+
+    def load_progress(self):
+        # 처리 중이면 캐시에 기록된 최신 카운터를 반영
+        if self.status == self.Status.RUNNING:
+            progress = cache.get(self.PROGRESS_KEY.format(id=self.pk)) or {}
+            for field in self.PROGRESS_FIELDS:
+                setattr(self, field, progress.get(field, getattr(self, field)))
+        return self
+
+    def clear_progress(self):
+        cache.delete(self.PROGRESS_KEY.format(id=self.pk))
+
+    class Meta:
+        db_table = "schedule_import_job"
@@ -1,13 +1,22 @@
 from rest_framework import serializers
 from rest_framework.exceptions import ValidationError
+from rest_framework.settings import api_settings
 
 # from config.base_exception import SubscriptionConflictException
 from Idols.models import Group, Idol
+from Idols.serializers import UniqueConstraintMixin
 
-from .models import Schedule
+from .models import ImportJob, Schedule
 
 
-class ScheduleSerializer(serializers.ModelSerializer):
+class ScheduleSerializer(UniqueConstraintMixin, serializers.ModelSerializer):
+    # (그룹, 제목, 시작 시간) 중복은 미리 조회하지 않고 유니크 제약으로 검사
+    unique_error_messages = {
+        "schedule_fingerprint_unique": (
+            api_settings.NON_FIELD_ERRORS_KEY,
+            "같은 그룹에 제목과 시작 시간이 같은 일정이 이미 있습니다.",
+        )
+    }
     # 참여 멤버를 이름 반환
     participating_members = serializers.SerializerMethodField()
     group = serializers.PrimaryKeyRelatedField(queryset=Group.objects.all())
@@ -35,13 +44,11 @@ class ScheduleSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError("User context is missing.")
 
         validated_data["user"] = request.user  # 사용자 추가
-        participating_members = validated_data.pop("participating_member_ids", [])
-
-        schedule = Schedule.objects.create(**validated_data)
-        schedule.participating_members.set(
-            participating_members
-        )  # ManyToMany 관계 설정
-        return schedule
+        # ManyToMany 관계는 ModelSerializer.create 가 저장 후 설정
+        validated_data["participating_members"] = validated_data.pop(
+            "participating_member_ids", []
+        )
+        return super().create(validated_data)
 
     def get_participating_members(self, obj):
         # 참여 멤버의 이름만 반환
@@ -62,3 +69,30 @@ class MinimalScheduleSerializer(serializers.ModelSerializer):
     class Meta:
         model = Schedule
         fields = ["schedule_id", "group_id"]
+
+
+class ImportJobSerializer(serializers.ModelSerializer):
+    # 행별 오류는 오류 보고서(CSV)로 내려받으므로 개수만 반환
+    error_rows = serializers.SerializerMethodField()
+
+    class Meta:
+        model = ImportJob
+        fields = [
+            "id",
+            "file_name",
+            "mode",
+            "status",
+            "processed",
+            "succeeded",
+            "failed",
+            "created",
+            "updated",
+            "unchanged",
+            "error",
+            "error_rows",
+            "created_at",
+            "finished_at",
+        ]
+
+    def get_error_rows(self, obj):
+        return len(obj.errors)
@@ -0,0 +1,67 @@
+import logging
+import os
+
+from celery import shared_task
+from django.utils import timezone
+
+from .importer import IMPORT_READERS, ScheduleImport, ScheduleImportError
+from .models import ImportJob
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def import_schedules_task(job_id):
+    """
+    임시 저장된 업로드 파일(엑셀/CSV/NDJSON)의 일정을 청크 단위로 등록합니다.
+    청크마다 처리/성공/실패 행 수를 캐시에 기록하고, 끝나면 결과와 행별 오류를 작업에 저장합니다.
+    """
+    job = ImportJob.objects.select_related("user").filter(pk=job_id).first()
+    if job is None or job.status != ImportJob.Status.PENDING:
+        return False
+    job.status = ImportJob.Status.RUNNING
+    job.save(update_fields=["status"])
+
+    def report(schedule_import):
+        job.set_progress(
+            processed=schedule_import.processed,
+            succeeded=schedule_import.succeeded,
+            failed=schedule_import.failed,
+        )
+
+    schedule_import = None
+    try:
+        with open(job.file_path, "rb") as file:
+            rows = IMPORT_READERS[job.file_format](file)
+            schedule_import = ScheduleImport(
+                rows, job.user, on_progress=report, mode=job.mode
+            )
+            saved = schedule_import.run()
+        job.status = ImportJob.Status.SUCCEEDED if saved else ImportJob.Status.FAILED
+        job.errors = schedule_import.errors
+    except ScheduleImportError as e:
+        job.status = ImportJob.Status.FAILED
+        job.error = str(e)
+    except FileNotFoundError:
+        logger.error(f"일정 가져오기 임시 파일 없음 (작업 {job_id})")
+        job.status = ImportJob.Status.FAILED
+        job.error = "업로드 파일을 찾을 수 없습니다."
+    except Exception as e:
+        logger.error(f"일정 가져오기 실패 (작업 {job_id}): {e}")
+        job.status = ImportJob.Status.FAILED
+        job.error = "가져오기 중 오류가 발생했습니다."
+    finally:
+        if schedule_import is not None:
+            job.processed = schedule_import.processed
+            job.succeeded = schedule_import.succeeded
+            job.failed = schedule_import.failed
+            job.created = schedule_import.created
+            job.updated = schedule_import.updated
+            job.unchanged = schedule_import.unchanged
+        job.finished_at = timezone.now()
+        job.save()
+        job.clear_progress()
+        if os.path.exists(job.file_path):
+            os.remove(job.file_path)
+    logger.info(f"일정 가져오기 {job.status} (작업 {job_id}, {job.created}개 등록)")
+    return job.status == ImportJob.Status.SUCCEEDED
@@ -1,11 +1,28 @@
+import csv
+import io
+import json
+import os
+import tempfile
+from datetime import datetime, timedelta
+from functools import partial
+from unittest.mock import patch
+
 from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from django.utils import timezone
+from openpyxl import Workbook
 from rest_framework import status
 from rest_framework.test import APIClient, APIRequestFactory, APITestCase
 
+from config.query_budget import QueryBudgetMixin
 from Idols.models import Agency, Idol
 
-from .models import Group, Schedule
+from .importer import SCHEDULE_COLUMNS, ScheduleImport, read_workbook
+from .models import Group, ImportJob, Schedule
 from .serializer import ScheduleSerializer
 
 
@@ -70,6 +87,72 @@ class PermissionOverrideTest(APITestCase):
         else:
             print("Errors:", serializer.errors)
 
+    def test_create_duplicate_schedule(self):
+        """같은 그룹/제목/시작 시간의 일정은 다시 등록할 수 없음"""
+        Schedule.objects.create(
+            group=self.group,
+            user=self.user,
+            title="Showcase",
+            location="Seoul",
+            start_time="2025-04-01T10:00:00Z",
+        )
+        data = {
+            "group": self.group.id,
+            "title": "Showcase",
+            "location": "Busan",
+            "start_time": "2025-04-01T19:00:00+09:00",
+            "end_time": "2025-04-01T21:00:00+09:00",
+            "participating_member_ids": [],
+        }
+        response = self.client.post(self.schedule_list_url, data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("non_field_errors", response.data)
+        self.assertEqual(Schedule.objects.count(), 1)
+
+    def test_update_legacy_duplicate_schedule(self):
+        """fingerprint 가 없는 기존 중복 일정도 키를 바꾸지 않으면 수정 가능"""
+        original = Schedule.objects.create(
+            group=self.group,
+            user=self.user,
+            title="Showcase",
+            start_time="2025-04-01T10:00:00Z",
+        )
+        legacy = Schedule.objects.create(
+            group=self.group,
+            user=self.user,
+            title="Showcase (copy)",
+            start_time="2025-04-01T10:00:00Z",
+        )
+        # 0004 마이그레이션 이전에 중복 등록된 행 재현
+        Schedule.objects.filter(pk=legacy.pk).update(title="Showcase", fingerprint=None)
+
+        data = {
+            "group": self.group.id,
+            "title": "Showcase",
+            "location": "Busan",
+            "start_time": "2025-04-01T10:00:00Z",
+            "end_time": "2025-04-01T12:00:00Z",
+            "participating_member_ids": [],
+        }
+        response = self.client.put(
+            self.schedule_detail_url(legacy.pk), data, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        legacy.refresh_from_db()
+        self.assertEqual(legacy.location, "Busan")
+        self.assertIsNone(legacy.fingerprint)
+
+        # 키를 바꾸면 새 fingerprint 를 받음
+        response = self.client.put(
+            self.schedule_detail_url(legacy.pk),
+            {**data, "title": "Encore"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        legacy.refresh_from_db()
+        self.assertIsNotNone(legacy.fingerprint)
+        self.assertNotEqual(legacy.fingerprint, original.fingerprint)
+
     def test_list_schedules(self):
         """일정 목록 조회 테스트"""
         Schedule.objects.create(
@@ -180,3 +263,433 @@ class PermissionOverrideTest(APITestCase):
             response.status_code, status.HTTP_403_FORBIDDEN
         )  # 권한 실패 확인
         self.assertEqual(Schedule.objects.count(), 1)  # 일정 삭제되지 않음 확인
+
+
+class ScheduleAdminQueryTests(QueryBudgetMixin, APITestCase):
+    def setUp(self):
+        User = get_user_model()
+        self.superuser = User.objects.create_superuser(
+            username="adminuser",
+            name="Super User",
+            email="admin@example.com",
+            password="adminpassword123",
+        )
+        self.client.force_login(self.superuser)
+        self.group = Group.objects.create(
+            name="Test Group", agency=Agency.objects.create(name="Test Agency")
+        )
+        self.members = [
+            Idol.objects.create(name=f"Idol{n}", group=self.group) for n in range(3)
+        ]
+
+    def populate(self, count):
+        schedules = Schedule.objects.bulk_create(
+            Schedule(
+                user=self.superuser,
+                group=self.group,
+                title=f"Schedule {n}",
+                location="Seoul",
+                start_time=timezone.now(),
+            )
+            for n in range(count)
+        )
+        Through = Schedule.participating_members.through
+        Through.objects.bulk_create(
+            Through(schedule_id=schedule.id, idol_id=member.id)
+            for schedule in schedules
+            for member in self.members
+        )
+
+    def test_changelist_budget(self):
+        """참가 멤버/그룹/작성자 표시가 행마다 쿼리를 만들지 않음 (1,000행 포함)"""
+        self.assertEndpointBudget(
+            reverse("admin:Schedules_schedule_changelist"), 5, self.populate
+        )
+
+
+SPOOL_DIR = tempfile.mkdtemp()
+
+
+def make_schedule_workbook(rows):
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.append(list(SCHEDULE_COLUMNS))
+    for row in rows:
+        sheet.append(list(row))
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+    buffer.seek(0)
+    return SimpleUploadedFile(
+        "schedules.xlsx",
+        buffer.getvalue(),
+        content_type=(
+            "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+        ),
+    )
+
+
+# 커밋 후 예약되는 가져오기 작업을 브로커(Redis) 없이 바로 실행
+@override_settings(SCHEDULE_IMPORT_SPOOL_DIR=SPOOL_DIR, CELERY_TASK_ALWAYS_EAGER=True)
+class ScheduleImportTests(APITestCase):
+    def setUp(self):
+        User = get_user_model()
+        self.admin_user = User.objects.create_superuser(
+            username="admin",
+            name="Super User",
+            email="admin@example.com",
+            password="adminpassword",
+        )
+        self.client.force_authenticate(user=self.admin_user)
+        agency = Agency.objects.create(name="SM")
+        self.group = Group.objects.create(name="aespa", agency=agency)
+        self.karina = Idol.objects.create(name="Karina", group=self.group)
+        self.winter = Idol.objects.create(name="Winter", group=self.group)
+        self.url = reverse("upload_schedule")
+        self.start = datetime(2026, 11, 1, 18, 0)
+
+    def make_rows(self, count, first=0):
+        return [
+            (
+                self.group.id,
+                f"공연 {n}",
+                None,
+                "서울",
+                self.start + timedelta(days=n),
+                self.start + timedelta(days=n, hours=2),
+                f"{self.karina.id},{self.winter.id}" if n % 2 else self.karina.id,
+            )
+            for n in range(first, first + count)
+        ]
+
+    def upload(self, rows, file=None, mode=None):
+        # 커밋 후 예약되는 작업을 바로 실행
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                f"{self.url}?mode={mode}" if mode else self.url,
+                {"file": file or make_schedule_workbook(rows)},
+                format="multipart",
+            )
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        return ImportJob.objects.get(pk=response.data["data"]["id"])
+
+    def test_bulk_import(self):
+        """일정과 참여 멤버를 저장하고, 시간은 현재 타임존 기준으로 해석"""
+        job = self.upload(self.make_rows(3))
+        self.assertEqual(job.status, ImportJob.Status.SUCCEEDED)
+        self.assertEqual((job.processed, job.succeeded, job.created), (3, 3, 3))
+        self.assertFalse(os.path.exists(job.file_path))
+
+        schedule = Schedule.objects.get(title="공연 1")
+        self.assertEqual(
+            set(schedule.participating_members.values_list("name", flat=True)),
+            {"Karina", "Winter"},
+        )
+        self.assertEqual(timezone.localtime(schedule.start_time).hour, 18)
+        self.assertEqual(Schedule.participating_members.through.objects.count(), 4)
+
+        response = self.client.get(reverse("import_job", args=[job.pk]))
+        self.assertEqual(response.data["data"]["status"], "succeeded")
+        self.assertEqual(response.data["data"]["created"], 3)
+
+    def test_query_count_is_constant(self):
+        """행 수와 관계없이 같은 쿼리 수 (사전 조회 2번 + 청크마다 기존 일정 조회 1번, INSERT 2번)"""
+
+        def run(count, first=0):
+            file = make_schedule_workbook(self.make_rows(count, first))
+            with CaptureQueriesContext(connection) as queries:
+                ScheduleImport(read_workbook(file), self.admin_user).run()
+            return len(queries)
+
+        self.assertEqual(run(5), run(80, first=5))
+        self.assertEqual(Schedule.objects.count(), 85)
+
+    def test_progress_is_reported_per_chunk(self):
+        """처리 중에는 캐시에 기록된 청크별 진행 상황을 반환"""
+        job = ImportJob.objects.create(
+            user=self.admin_user,
+            file_name="schedules.xlsx",
+            file_path="unused",
+            status=ImportJob.Status.RUNNING,
+        )
+        job.set_progress(processed=2000, succeeded=1990, failed=10)
+        response = self.client.get(reverse("import_job", args=[job.pk]))
+        data = response.data["data"]
+        self.assertEqual((data["processed"], data["failed"]), (2000, 10))
+
+        progress = []
+        file = make_schedule_workbook(self.make_rows(5))
+        ScheduleImport(
+            read_workbook(file),
+            self.admin_user,
+            chunk_size=2,
+            on_progress=lambda schedule_import: progress.append(
+                schedule_import.processed
+            ),
+        ).run()
+        self.assertEqual(progress, [2, 4, 5])
+
+    def test_row_errors_roll_back(self):
+        """오류 행을 모두 모아 작업에 남기고 아무것도 저장하지 않음"""
+        rows = self.make_rows(4)
+        rows[1] = (9999,) + rows[1][1:]
+        rows[2] = rows[2][:4] + (self.start, self.start - timedelta(hours=1), 8888)
+        rows.append((self.group.id, "", None, "", "내일", None, None))
+        job = self.upload(rows)
+        self.assertEqual(job.status, ImportJob.Status.FAILED)
+        self.assertEqual((job.processed, job.failed, job.created), (5, 3, 0))
+        errors = {row["row"]: row["errors"] for row in job.errors}
+        self.assertEqual(set(errors), {3, 4, 6})
+        self.assertEqual(errors[3]["group"], ["존재하지 않는 그룹입니다."])
+        self.assertEqual(set(errors[4]), {"end_time", "participating_member_ids"})
+        self.assertEqual(set(errors[6]), {"title", "location", "start_time"})
+        self.assertEqual(Schedule.objects.count(), 0)
+
+        response = self.client.get(reverse("import_job_errors", args=[job.pk]))
+        self.assertEqual(response["Content-Type"], "text/csv")
+        report = list(csv.reader(io.StringIO(response.content.decode())))
+        self.assertEqual(report[0], ["row", "field", "message"])
+        self.assertIn(["3", "group", "존재하지 않는 그룹입니다."], report)
+
+    def test_invalid_file(self):
+        job = self.upload(None, SimpleUploadedFile("schedules.xlsx", b"not a workbook"))
+        self.assertEqual(job.status, ImportJob.Status.FAILED)
+        self.assertEqual(job.error, "엑셀 파일을 읽을 수 없습니다.")
+
+    def test_csv_and_ndjson_formats(self):
+        """CSV/NDJSON 업로드도 같은 검증/저장 과정을 거침"""
+        rows = self.make_rows(3)
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(SCHEDULE_COLUMNS)
+        writer.writerows(rows)
+        csv_file = SimpleUploadedFile(
+            "schedules.csv", buffer.getvalue().encode(), content_type="text/csv"
+        )
+        job = self.upload(None, csv_file)
+        self.assertEqual((job.file_format, job.status), ("csv", "succeeded"))
+        self.assertEqual(job.created, 3)
+
+        lines = [
+            json.dumps(
+                {
+                    "group": self.group.id,
+                    "title": f"팬미팅 {n}",
+                    "location": "부산",
+                    "start_time": (self.start + timedelta(days=n)).isoformat(),
+                    "participating_member_ids": [self.karina.id, self.winter.id],
+                }
+            )
+            for n in range(2)
+        ]
+        ndjson_file = SimpleUploadedFile(
+            "schedules.txt",
+            "\n".join(lines).encode(),
+            content_type="application/x-ndjson",
+        )
+        job = self.upload(None, ndjson_file)
+        self.assertEqual((job.file_format, job.status), ("ndjson", "succeeded"))
+        schedule = Schedule.objects.get(title="팬미팅 1")
+        self.assertEqual(schedule.participating_members.count(), 2)
+        self.assertEqual(timezone.localtime(schedule.start_time).hour, 18)
+
+    def test_csv_and_ndjson_row_errors(self):
+        csv_file = SimpleUploadedFile(
+            "schedules.csv",
+            ",".join(SCHEDULE_COLUMNS).encode() + b"\n9999,t,,l,2026-11-01 18:00,,\n",
+        )
+        job = self.upload(None, csv_file)
+        self.assertEqual(job.errors[0]["row"], 2)
+        self.assertEqual(
+            job.errors[0]["errors"]["group"], ["존재하지 않는 그룹입니다."]
+        )
+
+        job = self.upload(None, SimpleUploadedFile("schedules.ndjson", b"{}\n[1]\n"))
+        self.assertEqual(job.status, ImportJob.Status.FAILED)
+        self.assertEqual(job.error, "2번째 줄이 올바른 JSON 객체가 아닙니다.")
+        self.assertEqual(Schedule.objects.count(), 0)
+
+    def test_reimport_requires_upsert_mode(self):
+        """같은 파일을 다시 올리면 중복 등록 대신 행별 오류 (파일 안 중복도 오류)"""
+        self.upload(self.make_rows(2))
+        rows = self.make_rows(3)
+        rows.append(rows[2])
+        job = self.upload(rows)
+        self.assertEqual(job.status, ImportJob.Status.FAILED)
+        errors = {row["row"]: row["errors"]["title"] for row in job.errors}
+        self.assertEqual(errors[2], ["이미 등록된 일정입니다."])
+        self.assertEqual(
+            errors[5], ["파일 안에 같은 그룹/제목/시작 시간의 일정이 있습니다."]
+        )
+        self.assertEqual(set(errors), {2, 3, 5})
+        self.assertEqual(Schedule.objects.count(), 2)
+
+    def test_upsert_updates_changed_rows_only(self):
+        self.upload(self.make_rows(4))
+        ids = dict(Schedule.objects.values_list("title", "id"))
+        rows = self.make_rows(5)
+        rows[0] = rows[0][:3] + ("부산",) + rows[0][4:]  # 장소 변경
+        rows[1] = rows[1][:6] + (self.winter.id,)  # 참여 멤버 변경
+
+        job = self.upload(rows, mode="upsert")
+        self.assertEqual(job.status, ImportJob.Status.SUCCEEDED)
+        self.assertEqual((job.created, job.updated, job.unchanged), (1, 2, 2))
+        self.assertEqual(Schedule.objects.count(), 5)
+        self.assertEqual(Schedule.objects.get(id=ids["공연 0"]).location, "부산")
+        self.assertEqual(
+            list(
+                Schedule.objects.get(
+                    id=ids["공연 1"]
+                ).participating_members.values_list("name", flat=True)
+            ),
+            ["Winter"],
+        )
+        self.assertEqual(Schedule.participating_members.through.objects.count(), 6)
+
+    def test_unchanged_upsert_does_not_write(self):
+        """변경이 없으면 청크마다 기존 일정 조회 한 번만 실행"""
+        self.upload(self.make_rows(50))
+        file = make_schedule_workbook(self.make_rows(50))
+        schedule_import = ScheduleImport(
+            read_workbook(file), self.admin_user, chunk_size=20, mode="upsert"
+        )
+        with CaptureQueriesContext(connection) as queries:
+            self.assertTrue(schedule_import.run())
+        self.assertEqual(schedule_import.unchanged, 50)
+        statements = [query["sql"].split()[0] for query in queries]
+        self.assertEqual(statements.count("SELECT"), 2 + 3)
+        self.assertNotIn("INSERT", statements)
+        self.assertNotIn("UPDATE", statements)
+        self.assertNotIn("DELETE", statements)
+
+    def test_failure_after_saved_chunks_resets_counts(self):
+        """앞 청크를 저장한 뒤 잘못된 줄을 만나면 전체 롤백, 작업의 저장 수도 0"""
+        lines = [
+            json.dumps(
+                {
+                    "group": self.group.id,
+                    "title": f"공연 {n}",
+                    "location": "서울",
+                    "start_time": (self.start + timedelta(days=n)).isoformat(),
+                }
+            )
+            for n in range(4)
+        ]
+        file = SimpleUploadedFile(
+            "schedules.ndjson", "\n".join([*lines, "not json"]).encode()
+        )
+        with patch(
+            "Schedules.tasks.ScheduleImport", partial(ScheduleImport, chunk_size=2)
+        ):
+            job = self.upload(None, file)
+        self.assertEqual(job.status, ImportJob.Status.FAILED)
+        self.assertEqual(job.error, "5번째 줄이 올바른 JSON 객체가 아닙니다.")
+        self.assertEqual(job.processed, 4)
+        self.assertEqual((job.created, job.updated, job.unchanged), (0, 0, 0))
+        self.assertEqual(Schedule.objects.count(), 0)
+
+    def test_unsupported_format(self):
+        response = self.client.post(
+            self.url,
+            {"file": SimpleUploadedFile("schedules.pdf", b"%PDF")},
+            format="multipart",
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(ImportJob.objects.exists())
+
+    def test_other_users_job_is_hidden(self):
+        job = self.upload(self.make_rows(1))
+        other = get_user_model().objects.create_user(
+            username="fan", name="Fan", email="fan@example.com", password="password"
+        )
+        self.client.force_authenticate(user=other)
+        response = self.client.get(reverse("import_job", args=[job.pk]))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class ScheduleExportTests(APITestCase):
+    def setUp(self):
+        User = get_user_model()
+        self.admin_user = User.objects.create_superuser(
+            username="admin",
+            name="Super User",
+            email="admin@example.com",
+            password="adminpassword",
+        )
+        self.client.force_authenticate(user=self.admin_user)
+        agency = Agency.objects.create(name="SM")
+        self.group = Group.objects.create(name="aespa", agency=agency)
+        self.other_group = Group.objects.create(name="NCT", agency=agency)
+        self.karina = Idol.objects.create(name="Karina", group=self.group)
+        self.winter = Idol.objects.create(name="Winter", group=self.group)
+        self.url = reverse("schedule_export")
+        start = timezone.make_aware(datetime(2026, 11, 1, 18, 0))
+        for n, group in enumerate([self.group, self.group, self.other_group]):
+            schedule = Schedule.objects.create(
+                user=self.admin_user,
+                group=group,
+                title=f"공연 {n}",
+                location="서울",
+                start_time=start + timedelta(days=n),
+                end_time=start + timedelta(days=n, hours=2),
+            )
+            if n == 0:
+                schedule.participating_members.set([self.karina, self.winter])
+        Schedule.objects.create(
+            user=self.admin_user,
+            group=self.group,
+            title="작년 공연",
+            location="서울",
+            start_time=start - timedelta(days=365),
+        )
+
+    def export(self, **params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return b"".join(response.streaming_content)
+
+    def test_csv_export_with_filters(self):
+        content = self.export(
+            format="csv",
+            group=self.group.id,
+            **{"from": "2026-11-01", "to": "2026-11-30"},
+        )
+        rows = list(csv.DictReader(io.StringIO(content.decode())))
+        self.assertEqual([row["title"] for row in rows], ["공연 0", "공연 1"])
+        self.assertEqual(rows[0]["start_time"], "2026-11-01T18:00:00")
+        self.assertEqual(
+            set(rows[0]["participating_member_ids"].split(",")),
+            {str(self.karina.id), str(self.winter.id)},
+        )
+        self.assertEqual(
+            set(rows[0]["participating_members"].split(", ")), {"Karina", "Winter"}
+        )
+        self.assertEqual(rows[1]["participating_member_ids"], "")
+        self.assertEqual(rows[0]["group_name"], "aespa")
+
+    def test_members_are_aggregated_in_one_query(self):
+        with CaptureQueriesContext(connection) as queries:
+            content = self.export(format="csv")
+        self.assertEqual(len(content.decode().splitlines()), 5)
+        self.assertEqual(len(queries), 1)
+
+    def test_xlsx_export_can_be_reimported(self):
+        """내보낸 엑셀을 upsert 로 다시 올리면 모두 변경 없음"""
+        content = self.export(**{"from": "2026-01-01"})
+        rows = list(read_workbook(io.BytesIO(content)))
+        self.assertEqual(len(rows), 3)
+        schedule_import = ScheduleImport(rows, self.admin_user, mode="upsert")
+        self.assertTrue(schedule_import.run())
+        self.assertEqual(schedule_import.unchanged, 3)
+
+    def test_invalid_params(self):
+        for params in ({"format": "pdf"}, {"group": "aespa"}, {"from": "어제"}):
+            response = self.client.get(self.url, params)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_requires_admin(self):
+        user = get_user_model().objects.create_user(
+            username="fan", name="Fan", email="fan@example.com", password="password"
+        )
+        self.client.force_authenticate(user=user)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
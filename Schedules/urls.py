@@ -10,4 +10,11 @@ urlpatterns = [
     ),
     path("myschedules/", UserScheduleListView.as_view(), name="my_schedules"),
     path("uploadschedule/", ExcelUploadview.as_view(), name="upload_schedule"),
+    path("export/", ScheduleExportView.as_view(), name="schedule_export"),
+    path("import-jobs/<int:pk>/", ImportJobDetailView.as_view(), name="import_job"),
+    path(
+        "import-jobs/<int:pk>/errors/",
+        ImportJobErrorReportView.as_view(),
+        name="import_job_errors",
+    ),
 ]
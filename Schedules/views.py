@@ -1,26 +1,45 @@
+import csv
+import io
+import tempfile
+from datetime import datetime, time, timedelta
+
+from django.db import transaction
+from django.http import FileResponse, HttpResponse, StreamingHttpResponse
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
-from openpyxl import load_workbook
 from rest_framework import status
 from rest_framework.generics import (
+    GenericAPIView,
     ListAPIView,
     ListCreateAPIView,
+    RetrieveAPIView,
     RetrieveUpdateDestroyAPIView,
 )
+from rest_framework.negotiation import DefaultContentNegotiation
 from rest_framework.parsers import FormParser, MultiPartParser
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
-from config.permissions import IsAdminOrReadOnly
+from config.permissions import IsAdmin, IsAdminOrReadOnly
 from Preferences.notification_service import NotificationService
 
-from .models import Schedule
-from .serializer import ScheduleSerializer
+from .exporter import iter_schedule_csv, write_schedule_xlsx
+from .importer import (
+    ScheduleImport,
+    detect_import_format,
+    iter_error_report,
+    spool_import_file,
+)
+from .models import ImportJob, Schedule
+from .serializer import ImportJobSerializer, ScheduleSerializer
 from .swagger_schema import (
     delete_response_schema,
     generate_swagger_response,
     update_create_response_schema,
 )
+from .tasks import import_schedules_task
 
 
 class ScheduleListView(ListCreateAPIView):
@@ -118,7 +137,7 @@ class UserScheduleListView(ListAPIView):
 
 class ExcelUploadview(ListCreateAPIView):
     """
-    일정 등록 및 조회를 엑셀 파일을 업로드하여 진행합니다.
+    일정 등록 및 조회를 엑셀/CSV/NDJSON 파일을 업로드하여 진행합니다.
     """
 
     queryset = Schedule.objects.all()
@@ -126,52 +145,192 @@ class ExcelUploadview(ListCreateAPIView):
     permission_classes = [IsAdminOrReadOnly]
     parser_classes = (MultiPartParser, FormParser)
 
+    @swagger_auto_schema(
+        operation_description=(
+            "엑셀(첫 시트), CSV(text/csv) 또는 NDJSON(application/x-ndjson) 파일로 "
+            "일정을 일괄 등록합니다. 컬럼: group, title, description, location, "
+            "start_time, end_time, participating_member_ids. "
+            "파일은 백그라운드에서 처리되며, 응답의 작업 id로 진행 상황을 조회합니다. "
+            "오류가 있으면 아무것도 저장하지 않고 작업에 행별 오류를 남깁니다. "
+            "?mode=upsert 이면 (그룹, 제목, 시작 시간)이 같은 기존 일정을 수정하고 "
+            "바뀌지 않은 일정은 건너뜁니다."
+        ),
+        manual_parameters=[
+            openapi.Parameter(
+                "mode",
+                openapi.IN_QUERY,
+                type=openapi.TYPE_STRING,
+                enum=list(ScheduleImport.MODES),
+                description="create(기본): 이미 등록된 일정은 오류, upsert: 수정/건너뜀",
+            )
+        ],
+        responses={202: "가져오기 작업"},
+    )
     def create(self, request, *args, **kwargs):
         file = request.FILES.get("file")
         if not file:
             return Response({"error": "엑셀 파일을 업로드 해주세요."}, status=400)
+        mode = request.query_params.get("mode", "create")
+        if mode not in ScheduleImport.MODES:
+            return Response({"error": "mode는 create 또는 upsert 입니다."}, status=400)
+        file_format = detect_import_format(file)
+        if file_format is None:
+            return Response(
+                {"error": "엑셀, CSV, NDJSON 파일만 업로드할 수 있습니다."}, status=400
+            )
+        job = ImportJob.objects.create(
+            user=request.user,
+            file_name=file.name[:255],
+            file_format=file_format,
+            mode=mode,
+            file_path=spool_import_file(file),
+        )
+        # 작업 행이 커밋된 뒤에 워커가 읽도록 예약
+        transaction.on_commit(lambda: import_schedules_task.delay(job.id))
+        return Response(
+            {"data": ImportJobSerializer(job).data}, status=status.HTTP_202_ACCEPTED
+        )
+
+
+class ImportJobDetailView(RetrieveAPIView):
+    """
+    일정 가져오기 작업의 진행 상황 조회 (본인 작업만, 관리자는 전체)
+    """
+
+    serializer_class = ImportJobSerializer
+    permission_classes = [IsAuthenticated]
+
+    def get_queryset(self):
+        queryset = ImportJob.objects.all()
+        if not getattr(self.request.user, "is_admin", False):
+            queryset = queryset.filter(user=self.request.user)
+        return queryset
+
+    @swagger_auto_schema(
+        responses=generate_swagger_response("일정 가져오기 작업", None),
+    )
+    def retrieve(self, request, *args, **kwargs):
+        job = self.get_object().load_progress()
+        return Response({"data": self.get_serializer(job).data})
+
+
+class ImportJobErrorReportView(ImportJobDetailView):
+    """
+    일정 가져오기 작업의 행별 오류를 CSV(row, field, message)로 내려받습니다.
+    """
+
+    @swagger_auto_schema(responses={200: "오류 보고서 (text/csv)"})
+    def retrieve(self, request, *args, **kwargs):
+        job = self.get_object()
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(("row", "field", "message"))
+        writer.writerows(iter_error_report(job.errors))
+        response = HttpResponse(buffer.getvalue(), content_type="text/csv")
+        response["Content-Disposition"] = (
+            f'attachment; filename="import-{job.pk}-errors.csv"'
+        )
+        return response
+
+
+class ExportContentNegotiation(DefaultContentNegotiation):
+    # ?format= 은 내보낼 파일 형식이므로 렌더러 선택(URL_FORMAT_OVERRIDE)에 사용하지 않음
+    def select_renderer(self, request, renderers, format_suffix=None):
+        return renderers[0], renderers[0].media_type
+
+
+def _parse_export_time(value, end=False):
+    # 날짜만 주면 그 날의 시작 (end=True 면 다음 날 시작 = 그 날 포함)
+    parsed = parse_datetime(value)
+    if parsed is None:
+        day = parse_date(value)
+        if day is None:
+            raise ValueError(value)
+        parsed = datetime.combine(day + timedelta(days=int(end)), time.min)
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return parsed
+
+
+class ScheduleExportView(GenericAPIView):
+    """
+    일정을 엑셀(xlsx) 또는 CSV로 내보냅니다.
+    앞 7개 컬럼은 일괄 등록 형식과 같아 ?mode=upsert 로 다시 올릴 수 있습니다.
+    """
+
+    queryset = Schedule.objects.all()
+    permission_classes = [IsAuthenticated, IsAdmin]
+    content_negotiation_class = ExportContentNegotiation
+
+    @swagger_auto_schema(
+        manual_parameters=[
+            openapi.Parameter(
+                "format",
+                openapi.IN_QUERY,
+                type=openapi.TYPE_STRING,
+                enum=["xlsx", "csv"],
+                description="파일 형식 (기본 xlsx)",
+            ),
+            openapi.Parameter(
+                "group",
+                openapi.IN_QUERY,
+                type=openapi.TYPE_STRING,
+                description="그룹 id (쉼표로 구분, 없으면 전체)",
+            ),
+            openapi.Parameter(
+                "from",
+                openapi.IN_QUERY,
+                type=openapi.TYPE_STRING,
+                description="시작 시간 이후 (날짜 또는 ISO 8601 시간)",
+            ),
+            openapi.Parameter(
+                "to",
+                openapi.IN_QUERY,
+                type=openapi.TYPE_STRING,
+                description="시작 시간 이전 (날짜만 주면 그 날 포함)",
+            ),
+        ],
+        responses={200: "xlsx 또는 csv 파일"},
+    )
+    def get(self, request, *args, **kwargs):
+        export_format = request.query_params.get("format", "xlsx")
+        if export_format not in ("xlsx", "csv"):
+            return Response({"error": "format은 xlsx 또는 csv 입니다."}, status=400)
+        queryset = self.get_queryset()
         try:
-            # 엑셀 파일 로드
-            workbook = load_workbook(file)
-            sheet = workbook.active  # 첫번째 시트 사용
-
-            # 엑셀 데이터 읽기
-            schedules = []
-            for row in sheet.iter_rows(min_row=2, values_only=True):
-                (
-                    group_id,
-                    title,
-                    description,
-                    location,
-                    start_time,
-                    end_time,
-                    participating_member_ids,
-                ) = row
-                schedule_data = {
-                    "group": (
-                        int(group_id) if group_id else None
-                    ),  # 그룹 아이디 정수로 변환
-                    "title": title,
-                    "description": description,
-                    "location": location,
-                    "start_time": start_time,
-                    "end_time": end_time,
-                    "participating_member_ids": (
-                        [int(x) for x in str(participating_member_ids).split(",")]
-                        if participating_member_ids
-                        else []
-                    ),
-                }
-                # serializer를 통해 검증 및 저장
-                serializer = self.get_serializer(data=schedule_data)
-                serializer.is_valid(raise_exception=True)
-                schedule = serializer.save(
-                    user=request.user
-                )  # 작성자를 현재 사용자로 설정
-
-                # JSON 응답을 위해 Schedule 객체를 Serializer로 직렬화
-                schedules.append(self.get_serializer(schedule).data)
-
-            return Response({"data": schedules}, status=201)
-        except Exception as e:
-            return Response({"error": str(e)}, status=400)
+            group_ids = [
+                int(pk)
+                for pk in request.query_params.get("group", "").split(",")
+                if pk.strip()
+            ]
+            if "from" in request.query_params:
+                queryset = queryset.filter(
+                    start_time__gte=_parse_export_time(request.query_params["from"])
+                )
+            if "to" in request.query_params:
+                queryset = queryset.filter(
+                    start_time__lt=_parse_export_time(
+                        request.query_params["to"], end=True
+                    )
+                )
+        except ValueError:
+            return Response(
+                {"error": "group은 숫자, from/to는 날짜 또는 시간이어야 합니다."},
+                status=400,
+            )
+        if group_ids:
+            queryset = queryset.filter(group_id__in=group_ids)
+
+        filename = f"schedules.{export_format}"
+        if export_format == "csv":
+            # 쿼리 결과를 청크 단위로 읽으며 바로 전송
+            response = StreamingHttpResponse(
+                iter_schedule_csv(queryset), content_type="text/csv; charset=utf-8"
+            )
+            response["Content-Disposition"] = f'attachment; filename="{filename}"'
+            return response
+        # xlsx(zip)는 끝까지 써야 완성되므로 임시 파일에 쓴 뒤 파일 단위로 전송
+        file = tempfile.TemporaryFile()
+        write_schedule_xlsx(file, queryset)
+        file.seek(0)
+        return FileResponse(file, as_attachment=True, filename=filename)
@@ -0,0 +1,113 @@
+"""
+S3 이미지 업로드 지연 시간 벤치마크 (요청마다 새 클라이언트 vs 프로세스 공유 클라이언트)
+
+moto 서버를 로컬 S3 대용으로 띄워 100KB ~ 20MB 파일을 업로드합니다.
+
+    pip install "moto[server]"
+    python benchmarks/s3_upload.py [--repeat 10]
+"""
+
+import argparse
+import io
+import logging
+import os
+import statistics
+import sys
+import time
+import uuid
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import boto3
+import django
+from django.conf import settings
+
+SIZES = [
+    ("100KB", 100 * 1024),
+    ("1MB", 1024 * 1024),
+    ("5MB", 5 * 1024 * 1024),
+    ("20MB", 20 * 1024 * 1024),
+]
+BUCKET = "ilog-benchmark"
+
+
+def configure(endpoint_url):
+    settings.configure(
+        AWS_ACCESS_KEY_ID="testing",
+        AWS_SECRET_ACCESS_KEY="testing",
+        AWS_STORAGE_BUCKET_NAME=BUCKET,
+        AWS_REGION_NAME="ap-northeast-2",
+        AWS_S3_ENDPOINT_URL=endpoint_url,
+        AWS_S3_MAX_POOL_CONNECTIONS=20,
+        AWS_S3_MULTIPART_THRESHOLD=8 * 1024 * 1024,
+        AWS_S3_MULTIPART_CHUNKSIZE=8 * 1024 * 1024,
+        AWS_S3_MAX_CONCURRENCY=4,
+    )
+    django.setup()
+
+
+def upload_before(payload, key):
+    # 기존 방식: 호출마다 클라이언트 생성 + 기본 전송 설정
+    client = boto3.client(
+        "s3",
+        aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+        aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+        region_name=settings.AWS_REGION_NAME,
+        endpoint_url=settings.AWS_S3_ENDPOINT_URL,
+    )
+    client.upload_fileobj(io.BytesIO(payload), BUCKET, key)
+
+
+def upload_after(payload, key):
+    # 이미지 업로드 작업과 같은 경로 (HEAD 확인 후 공유 클라이언트로 업로드)
+    from Idols.s3_utils import upload_blob_to_s3
+
+    # 같은 키가 있으면 전송을 건너뛰므로 매번 새 키 사용
+    if not upload_blob_to_s3(io.BytesIO(payload), f"{key}-{uuid.uuid4().hex}"):
+        raise RuntimeError("업로드되지 않음")
+
+
+def measure(upload, payload, repeat):
+    timings = []
+    for index in range(repeat):
+        started = time.perf_counter()
+        upload(payload, f"bench-{index}")
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--port", type=int, default=5055)
+    args = parser.parse_args()
+
+    try:
+        from moto.server import ThreadedMotoServer
+    except ImportError:
+        sys.exit('moto 서버가 필요합니다: pip install "moto[server]"')
+
+    logging.getLogger("werkzeug").setLevel(logging.ERROR)
+    server = ThreadedMotoServer(port=args.port, verbose=False)
+    server.start()
+    try:
+        configure(f"http://127.0.0.1:{args.port}")
+        from Idols.s3_utils import get_s3_client
+
+        get_s3_client().create_bucket(
+            Bucket=BUCKET,
+            CreateBucketConfiguration={"LocationConstraint": "ap-northeast-2"},
+        )
+
+        print(f"{'size':>6} {'before(ms)':>12} {'after(ms)':>12} {'speedup':>8}")
+        for label, size in SIZES:
+            payload = os.urandom(size)
+            before = measure(upload_before, payload, args.repeat)
+            after = measure(upload_after, payload, args.repeat)
+            print(f"{label:>6} {before:>12.1f} {after:>12.1f} {before / after:>7.2f}x")
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""
+일정 일괄 등록 형식별 처리량 벤치마크 (엑셀 vs CSV vs NDJSON, 초당 행 수)
+
+형식마다 1k / 10k / 100k 행 파일을 메모리에 만들고
+  - parse: 행 읽기 제너레이터만 끝까지 소비
+  - import: 검증 + bulk_create 까지 실행 (트랜잭션은 롤백)
+의 초당 처리 행 수를 출력합니다. import 는 설정된 DB(기본 config.settings)를 사용합니다.
+
+    python benchmarks/schedule_import.py [--rows 1000 10000 100000] [--parse-only]
+"""
+
+import argparse
+import csv
+import io
+import json
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import django
+from openpyxl import Workbook
+
+FORMATS = ("xlsx", "csv", "ndjson")
+
+
+def make_rows(count, group_id, idol_ids):
+    start = datetime(2026, 11, 1, 18, 0)
+    members = ",".join(map(str, idol_ids))
+    for n in range(count):
+        yield (
+            group_id,
+            f"공연 {n}",
+            "벤치마크 일정",
+            "서울",
+            start + timedelta(minutes=n),
+            start + timedelta(minutes=n, hours=2),
+            members,
+        )
+
+
+def build_file(file_format, rows):
+    from Schedules.importer import SCHEDULE_COLUMNS
+
+    if file_format == "xlsx":
+        # write_only 모드로 만들어 10만 행도 빠르게 생성
+        workbook = Workbook(write_only=True)
+        sheet = workbook.create_sheet()
+        sheet.append(list(SCHEDULE_COLUMNS))
+        for row in rows:
+            sheet.append(list(row))
+        buffer = io.BytesIO()
+        workbook.save(buffer)
+        return buffer.getvalue()
+    text = io.StringIO()
+    if file_format == "csv":
+        writer = csv.writer(text)
+        writer.writerow(SCHEDULE_COLUMNS)
+        writer.writerows(
+            (*row[:4], row[4].isoformat(), row[5].isoformat(), row[6]) for row in rows
+        )
+    else:
+        for row in rows:
+            values = dict(zip(SCHEDULE_COLUMNS, row))
+            values["start_time"] = values["start_time"].isoformat()
+            values["end_time"] = values["end_time"].isoformat()
+            text.write(json.dumps(values, ensure_ascii=False) + "\n")
+    return text.getvalue().encode()
+
+
+def measure_parse(file_format, payload):
+    from Schedules.importer import IMPORT_READERS
+
+    started = time.perf_counter()
+    count = sum(1 for _ in IMPORT_READERS[file_format](io.BytesIO(payload)))
+    return count, time.perf_counter() - started
+
+
+def measure_import(file_format, payload, user):
+    from Schedules.importer import IMPORT_READERS, ScheduleImport
+
+    schedule_import = ScheduleImport(
+        IMPORT_READERS[file_format](io.BytesIO(payload)), user
+    )
+    started = time.perf_counter()
+    schedule_import.run()
+    elapsed = time.perf_counter() - started
+    if schedule_import.errors:
+        raise RuntimeError(f"가져오기 오류: {schedule_import.errors[:3]}")
+    return schedule_import.created, elapsed
+
+
+def run(counts, group_id, idol_ids, user=None):
+    # user 가 없으면 (--parse-only) DB 없이 읽기 속도만 측정
+    print(f"{'format':>7} {'rows':>7} {'parse(rows/s)':>14} {'import(rows/s)':>15}")
+    for count in counts:
+        for file_format in FORMATS:
+            payload = build_file(file_format, make_rows(count, group_id, idol_ids))
+            parsed, parse_seconds = measure_parse(file_format, payload)
+            imported = "-"
+            if user is not None:
+                created, import_seconds = measure_import(file_format, payload, user)
+                imported = f"{created / import_seconds:,.0f}"
+            print(
+                f"{file_format:>7} {count:>7} "
+                f"{parsed / parse_seconds:>14,.0f} {imported:>15}"
+            )
+
+
+class Rollback(Exception):
+    pass
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--parse-only", action="store_true")
+    args = parser.parse_args()
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+    django.setup()
+    if args.parse_only:
+        run(args.rows, 1, [1, 2, 3])
+        return
+
+    from django.contrib.auth import get_user_model
+    from django.db import transaction
+
+    from Idols.models import Agency, Group, Idol
+
+    try:
+        # 벤치마크용 그룹/멤버/사용자와 가져온 일정은 마지막에 모두 롤백
+        with transaction.atomic():
+            user = get_user_model().objects.create_user(
+                username="schedule-import-benchmark",
+                name="benchmark",
+                email="schedule-import-benchmark@example.com",
+                password=None,
+            )
+            agency = Agency.objects.create(name="schedule-import-benchmark")
+            group = Group.objects.create(
+                name="schedule-import-benchmark", agency=agency
+            )
+            idol_ids = [
+                Idol.objects.create(name=f"member {n}", group=group).pk
+                for n in range(3)
+            ]
+            run(args.rows, group.pk, idol_ids, user)
+            raise Rollback
+    except Rollback:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    필터/검색이 없는 큰 테이블의 admin 목록에서는 COUNT(*) 대신
+    PostgreSQL 통계(pg_class.reltuples)의 추정 행 수를 사용합니다.
+    추정치가 작거나 PostgreSQL이 아니면 정확한 COUNT를 실행합니다.
+    """
+
+    # 이 행 수 이상일 때만 추정치 사용
+    estimate_threshold = 10000
+
+    def is_unfiltered(self, queryset):
+        """
+        기본 매니저가 항상 붙이는 조건(소프트 삭제 숨김 등) 외에 필터가 없는지 확인합니다.
+        숨김 행은 곧 삭제되므로 테이블 전체 추정치에 포함되어도 무방합니다.
+        """
+        if not hasattr(queryset, "query"):
+            return False
+        where = queryset.query.where
+        return not where or where == queryset.model._default_manager.all().query.where
+
+    def get_estimated_count(self):
+        queryset = self.object_list
+        if not self.is_unfiltered(queryset):
+            return None
+        connection = connections[queryset.db]
+        if connection.vendor != "postgresql":
+            return None
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+                [connection.ops.quote_name(queryset.model._meta.db_table)],
+            )
+            row = cursor.fetchone()
+        return row[0] if row else None
+
+    @cached_property
+    def count(self):
+        estimated = self.get_estimated_count()
+        if estimated is not None and estimated >= self.estimate_threshold:
+            return estimated
+        return super().count
+
+
+class EstimatedCountAdminMixin:
+    """
+    큰 테이블용 ModelAdmin 설정. 추정 COUNT를 사용하고,
+    필터 적용 시 전체 건수를 세는 두 번째 COUNT(*)를 생략합니다.
+    """
+
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
@@ -0,0 +1,146 @@
+import base64
+import json
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db.models import CharField, Func, Value
+from django.db.models.lookups import GreaterThan, LessThan
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class Row(Func):
+    """
+    (a, b) 형태의 row value 표현식. 복합 인덱스를 그대로 타는
+    WHERE (name, id) > (%s, %s) 비교에 사용합니다.
+    """
+
+    function = ""
+    output_field = CharField()
+
+
+class KeysetPagination(BasePagination):
+    """
+    OFFSET 없이 마지막으로 본 정렬 키 다음부터 조회하는 커서 페이지네이션.
+    몇 번째 페이지든 인덱스 탐색 한 번으로 조회하므로 비용이 일정합니다.
+    """
+
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+    invalid_cursor_message = "유효하지 않은 커서입니다."
+
+    # 뷰에 ordering 속성(또는 get_ordering())이 있으면 그 값을 사용
+    # (유일성을 위해 마지막은 id, 내림차순은 모든 컬럼이 "-" 로 시작해야 함)
+    ordering = ("id",)
+
+    @property
+    def page_size(self):
+        return getattr(settings, "CATALOG_PAGE_SIZE", 50)
+
+    @property
+    def max_page_size(self):
+        return getattr(settings, "CATALOG_MAX_PAGE_SIZE", 200)
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if page_size <= 0:
+            return self.page_size
+        return min(page_size, self.max_page_size)
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            position = json.loads(base64.urlsafe_b64decode(encoded.encode()))
+        except (TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(position, list) or len(position) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+        return position
+
+    def clean_position(self, model, fields, position):
+        # 커서 값을 정렬 컬럼 타입으로 변환 (잘못된 값으로 500이 나지 않도록 404 처리)
+        try:
+            position = [
+                model._meta.get_field(field).to_python(value)
+                for field, value in zip(fields, position)
+            ]
+        except (TypeError, ValueError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+        # 정렬 컬럼은 NULL 이 없으므로 None 도 잘못된 커서
+        if any(value is None for value in position):
+            raise NotFound(self.invalid_cursor_message)
+        return position
+
+    def encode_cursor(self, position):
+        return base64.urlsafe_b64encode(json.dumps(position).encode()).decode()
+
+    def get_page_key(self, request):
+        # 캐시 키 등에 사용할 현재 페이지 식별자
+        return "%s:%s" % (
+            request.query_params.get(self.cursor_query_param, ""),
+            self.get_page_size(request),
+        )
+
+    def get_ordering(self, view):
+        if hasattr(view, "get_ordering"):
+            return tuple(view.get_ordering())
+        return tuple(getattr(view, "ordering", None) or self.ordering)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.ordering = self.get_ordering(view)
+        self.page_size_value = self.get_page_size(request)
+        position = self.decode_cursor(request)
+
+        queryset = queryset.order_by(*self.ordering)
+        # 모두 내림차순이면 (a, b) < (%s, %s) 로 같은 복합 인덱스를 역방향으로 탐색
+        descending = self.ordering[0].startswith("-")
+        fields = [field.lstrip("-") for field in self.ordering]
+        if position is not None:
+            position = self.clean_position(queryset.model, fields, position)
+            if len(fields) == 1:
+                lookup = "lt" if descending else "gt"
+                queryset = queryset.filter(**{f"{fields[0]}__{lookup}": position[0]})
+            else:
+                compare = LessThan if descending else GreaterThan
+                queryset = queryset.filter(
+                    compare(Row(*fields), Row(*[Value(value) for value in position]))
+                )
+
+        # 다음 페이지 존재 여부 확인을 위해 한 건 더 조회
+        results = list(queryset[: self.page_size_value + 1])
+        self.has_next = len(results) > self.page_size_value
+        results = results[: self.page_size_value]
+        self.next_position = (
+            [getattr(results[-1], field) for field in fields] if self.has_next else None
+        )
+        return results
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        # 캐시된 스냅샷에 요청 호스트/스킴이 남지 않도록 상대 경로로 반환
+        return replace_query_param(
+            self.request.get_full_path(),
+            self.cursor_query_param,
+            self.encode_cursor(self.next_position),
+        )
+
+    def get_paginated_response(self, data):
+        return Response({"data": data, "next": self.get_next_link()})
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "properties": {
+                "data": schema,
+                "next": {"type": "string", "nullable": True, "format": "uri-reference"},
+            },
+        }
@@ -19,3 +19,12 @@ class IsSuperUser(BasePermission):
 
     def has_permission(self, request, view):
         return request.user and request.user.is_superuser
+
+
+class IsAdmin(BasePermission):
+    """
+    관리자 등급만 허용 (읽기 요청 포함)
+    """
+
+    def has_permission(self, request, view):
+        return bool(request.user and getattr(request.user, "is_admin", False))
@@ -0,0 +1,78 @@
+from contextlib import ContextDecorator
+
+from django.db import connections
+from django.test.utils import CaptureQueriesContext
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+class query_budget(ContextDecorator):
+    """
+    블록(또는 함수) 안에서 실행된 쿼리 수가 예산을 넘으면 실패합니다.
+
+        with query_budget(3):
+            client.get(url)
+
+        @query_budget(2)
+        def handler(): ...
+    """
+
+    def __init__(self, max_queries, using="default", label=None):
+        self.max_queries = max_queries
+        self.using = using
+        self.label = label
+
+    def __enter__(self):
+        self.context = CaptureQueriesContext(connections[self.using])
+        self.context.__enter__()
+        return self.context
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.context.__exit__(exc_type, exc_value, traceback)
+        if exc_type is not None:
+            return False
+
+        executed = len(self.context)
+        if executed > self.max_queries:
+            queries = "\n".join(
+                f"{index}. {query['sql']}"
+                for index, query in enumerate(self.context.captured_queries, start=1)
+            )
+            raise QueryBudgetExceeded(
+                f"{self.label or '쿼리 예산'} 초과: "
+                f"{executed}개 실행 (예산 {self.max_queries}개)\n{queries}"
+            )
+        return False
+
+
+class QueryBudgetMixin:
+    """
+    DRF 테스트 케이스용 쿼리 예산 검증 믹스인.
+    행 수(N)를 늘려도 쿼리 수가 예산 안에 머무는지 확인하여 N+1 회귀를 잡아냅니다.
+    """
+
+    query_budget_sizes = (1, 10, 1000)
+
+    def assertQueryBudget(self, max_queries, label=None):
+        return query_budget(max_queries, label=label)
+
+    def assertEndpointBudget(self, url, max_queries, populate):
+        """
+        populate(n)으로 행을 n개 추가하면서 N=1, 10, 1000 각각에서
+        url 호출 쿼리 수가 예산 이하인지 확인합니다. (url은 문자열 또는 호출 가능 객체)
+        """
+        created = 0
+        for size in self.query_budget_sizes:
+            populate(size - created)
+            created = size
+            target = url() if callable(url) else url
+            self.before_budget_request()
+            with query_budget(max_queries, label=f"GET {target} (N={size})"):
+                response = self.client.get(target)
+            self.assertLess(response.status_code, 400, response.content[:500])
+
+    def before_budget_request(self):
+        # 캐시 등 측정에 영향을 주는 상태 초기화용 훅
+        pass
@@ -210,6 +210,23 @@ CELERY_TASK_SERIALIZER = "json"
 CELERY_RESULT_SERIALIZER = "json"
 CELERY_TIMEZONE = "Asia/Seoul"
 
+# 카탈로그 스냅샷 캐시 유지 시간 (버전이 바뀌면 자동으로 무효화됨)
+CATALOG_SNAPSHOT_TIMEOUT = 60 * 60 * 24
+
+# 소속사/그룹/아이돌 목록 페이지 크기 (?page_size= 로 최대값까지 조절 가능)
+CATALOG_PAGE_SIZE = 50
+CATALOG_MAX_PAGE_SIZE = 200
+
+# 그룹 응답에 ?upcoming=N 으로 포함할 수 있는 다가오는 일정 최대 개수
+CATALOG_MAX_UPCOMING = 20
+
+# 퍼지 검색 최소 유사도 (pg_trgm 기본값과 동일)
+CATALOG_FUZZY_THRESHOLD = 0.3
+
+# 다른 프로세스의 변경으로 검색 인덱스가 오래되면 백그라운드 스레드에서 다시 만들고
+# 그동안은 기존 인덱스로 응답 (False 면 검색 요청 안에서 바로 다시 생성)
+CATALOG_SEARCH_BACKGROUND_REBUILD = True
+
 # 이메일 설정
 EMAIL_BACKEND = "django.core.mail.backends.smtp.EmailBackend"
 EMAIL_HOST = "in-v3.mailjet.com"
@@ -224,6 +241,40 @@ AWS_ACCESS_KEY_ID = os.getenv("AWS_ACCESS_KEY_ID")
 AWS_SECRET_ACCESS_KEY = os.getenv("AWS_SECRET_ACCESS_KEY")
 AWS_STORAGE_BUCKET_NAME = os.getenv("AWS_STORAGE_BUCKET_NAME")
 AWS_REGION_NAME = os.getenv("AWS_REGION_NAME")
+# S3 호환 스토리지(MinIO, moto 등) 사용 시 엔드포인트 지정
+AWS_S3_ENDPOINT_URL = os.getenv("AWS_S3_ENDPOINT_URL") or None
+
+# S3 클라이언트 커넥션 풀 및 멀티파트 업로드 설정
+AWS_S3_MAX_POOL_CONNECTIONS = int(os.getenv("AWS_S3_MAX_POOL_CONNECTIONS", 20))
+AWS_S3_MULTIPART_THRESHOLD = int(
+    os.getenv("AWS_S3_MULTIPART_THRESHOLD", 8 * 1024 * 1024)
+)
+AWS_S3_MULTIPART_CHUNKSIZE = int(
+    os.getenv("AWS_S3_MULTIPART_CHUNKSIZE", 8 * 1024 * 1024)
+)
+AWS_S3_MAX_CONCURRENCY = int(os.getenv("AWS_S3_MAX_CONCURRENCY", 4))
+
+# 이미지 직접 업로드(presigned) 제한
+IMAGE_UPLOAD_MAX_SIZE = 10 * 1024 * 1024
+IMAGE_UPLOAD_CONTENT_TYPES = ["image/jpeg", "image/png", "image/webp", "image/gif"]
+IMAGE_UPLOAD_PRESIGN_EXPIRES = 300
+
+# 파생 이미지(썸네일) 생성용 프로세스 수 (0이면 워커 프로세스에서 직접 처리)와 제한 시간(초)
+IMAGE_VARIANT_PROCESSES = int(os.getenv("IMAGE_VARIANT_PROCESSES", 2))
+IMAGE_VARIANT_TIMEOUT = 60
+
+# 참조가 사라진 이미지 blob을 삭제하기 전 유예 시간(초)
+IMAGE_BLOB_GC_GRACE = 24 * 60 * 60
+
+# S3 업로드 전 이미지를 임시 저장하는 경로 (웹 서버와 Celery 워커가 공유해야 함)
+IMAGE_UPLOAD_SPOOL_DIR = os.getenv(
+    "IMAGE_UPLOAD_SPOOL_DIR", os.path.join(MEDIA_ROOT, "spool")
+)
+
+# 일정 일괄 등록 파일을 Celery 워커가 처리할 때까지 임시 저장하는 경로 (공유 필요)
+SCHEDULE_IMPORT_SPOOL_DIR = os.getenv(
+    "SCHEDULE_IMPORT_SPOOL_DIR", os.path.join(MEDIA_ROOT, "spool", "schedules")
+)
 
 try:
     from . import logging